@@ -1,15 +1,22 @@
 """Entry point for the WWM guild manager application.
 
-This is a lightweight bootstrap that will later delegate to the GUI layer.
-For now it validates inputs and prints the intended startup mode.
+The bootstrap validates inputs and opens the main window. Heavy subsystems
+(Qt, Pillow, the OCR engines) are imported only once a code path needs
+them, so keep module-level imports here to the standard library.
 """
 
 from __future__ import annotations
 
 import argparse
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+import multiprocessing
 from pathlib import Path
 import sys
+import time
+from typing import IO, Iterator
+
+_STARTED = time.perf_counter()
 
 
 @dataclass(frozen=True)
@@ -19,6 +26,44 @@ class AppConfig:
     config_path: Path | None
     csv_path: Path | None
     create_new: bool
+    jobs: int | None = None
+    serve_ocr: bool = False
+    profile_startup: bool = False
+
+
+@dataclass
+class StartupProfile:
+    """Wall time and newly imported top-level packages per startup stage.
+
+    For a per-module breakdown run ``python -X importtime app.py`` instead.
+    """
+
+    enabled: bool = False
+    stages: list[tuple[str, float, list[str]]] = field(default_factory=list)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        loaded = set(sys.modules)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            packages = {
+                module.partition(".")[0] for module in sys.modules.keys() - loaded
+            }
+            self.stages.append((name, elapsed, sorted(packages)))
+
+    def report(self, stream: IO[str]) -> None:
+        for name, elapsed, packages in self.stages:
+            print(f"{elapsed * 1000:8.1f} ms  {name}", file=stream)
+            if packages:
+                print(f"{'':13}imports: {', '.join(packages)}", file=stream)
+        total = time.perf_counter() - _STARTED
+        print(f"{total * 1000:8.1f} ms  total since app.py started", file=stream)
 
 
 def parse_args(argv: list[str]) -> AppConfig:
@@ -40,16 +85,37 @@ def parse_args(argv: list[str]) -> AppConfig:
         action="store_true",
         help="Start with a new CSV project.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        metavar="N",
+        help="Number of OCR worker processes (0 = one per CPU core).",
+    )
+    parser.add_argument(
+        "--serve-ocr",
+        action="store_true",
+        help="Run the shared OCR host that keeps EasyOCR models loaded.",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Print how long each startup stage and its imports took once the window is shown.",
+    )
 
     args = parser.parse_args(argv)
 
     if args.open_csv and args.new:
         parser.error("--open-csv and --new cannot be used together.")
+    if args.jobs is not None and args.jobs < 0:
+        parser.error("--jobs must be 0 or greater.")
 
     return AppConfig(
         config_path=args.config,
         csv_path=args.open_csv,
         create_new=args.new,
+        jobs=args.jobs,
+        serve_ocr=args.serve_ocr,
+        profile_startup=args.profile_startup,
     )
 
 
@@ -60,32 +126,59 @@ def validate_paths(config: AppConfig) -> None:
         raise FileNotFoundError(f"CSV not found: {config.csv_path}")
 
 
+def run_gui(config: AppConfig) -> int:
+    """Open the main window, loading the CSV selected by ``config`` or settings."""
+
+    profile = StartupProfile(enabled=config.profile_startup)
+    with profile.stage("settings"):
+        from config import DEFAULT_CONFIG_PATH, load_settings
+
+        settings_path = config.config_path or DEFAULT_CONFIG_PATH
+        settings = load_settings(settings_path)
+        if config.jobs is not None:
+            settings = replace(settings, ocr_jobs=config.jobs)
+    with profile.stage("Qt"):
+        from PySide6 import QtCore, QtWidgets
+
+        app = QtWidgets.QApplication(sys.argv[:1])
+    with profile.stage("main window"):
+        from ui.main_window import MainWindow
+
+        window = MainWindow(settings, settings_path)
+    csv_path = None if config.create_new else config.csv_path or settings.default_csv_path
+    if csv_path is not None and csv_path.exists():
+        with profile.stage(f"load {csv_path.name}"):
+            from core.exporter import import_table
+
+            window.load_records(import_table(csv_path))
+    with profile.stage("show window"):
+        window.show()
+    if profile.enabled:
+        # Report once the first paint has been processed.
+        QtCore.QTimer.singleShot(0, lambda: profile.report(sys.stderr))
+    return app.exec()
+
+
 def main(argv: list[str] | None = None) -> int:
     argv = argv if argv is not None else sys.argv[1:]
     config = parse_args(argv)
 
+    if config.serve_ocr:
+        from core.ocr_host import serve
+
+        serve()
+        return 0
+
     try:
         validate_paths(config)
     except FileNotFoundError as exc:
         print(exc, file=sys.stderr)
         return 2
 
-    if config.create_new:
-        mode = "new"
-    elif config.csv_path:
-        mode = "open"
-    else:
-        mode = "default"
-
-    print("WWM Guild Manager bootstrap")
-    print(f"Startup mode: {mode}")
-    if config.config_path:
-        print(f"Config: {config.config_path}")
-    if config.csv_path:
-        print(f"CSV: {config.csv_path}")
-    print("GUI implementation will be added once the folder structure exists.")
-    return 0
+    return run_gui(config)
 
 
 if __name__ == "__main__":
+    # Required for the OCR process pool in PyInstaller one-file builds.
+    multiprocessing.freeze_support()
     raise SystemExit(main())
@@ -0,0 +1,101 @@
+"""Compare time per image and peak RSS of screenshot cropping strategies.
+
+Run from the repository root: ``python benchmarks/crop_decode.py``. Each
+strategy runs in its own process so peak RSS is not shared between them
+(``resource`` makes this Unix-only).
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.image_cropper import CropPreset, _normalized_box, crop_image  # noqa: E402
+
+
+SCREEN_SIZE = (3840, 2160)
+IMAGE_COUNT = 20
+PRESET = CropPreset(name="benchmark", x=0.32, y=0.18, width=0.3, height=0.55)
+STRATEGIES = ("open-crop", "crop_image", "crop_image@0.5")
+
+
+def _legacy_crop(image_path: Path, preset: CropPreset) -> Image.Image:
+    # The cropper before decode limiting: full decode, file left to the GC.
+    image = Image.open(image_path)
+    return image.crop(_normalized_box(image.size, preset.x, preset.y, preset.width, preset.height))
+
+
+def _write_screenshots(directory: Path) -> dict[str, list[Path]]:
+    rng = np.random.default_rng(0)
+    width, height = SCREEN_SIZE
+    gradient = np.linspace(0, 180, width, dtype=np.float32)[None, :, None]
+    base = np.broadcast_to(gradient, (height, width, 3)).astype(np.uint8)
+    paths: dict[str, list[Path]] = {"png": [], "jpg": []}
+    for index in range(IMAGE_COUNT):
+        pixels = base.copy()
+        # Scattered bright blocks stand in for UI text.
+        for _ in range(400):
+            x, y = rng.integers(0, width - 40), rng.integers(0, height - 12)
+            pixels[y : y + 12, x : x + 40] = rng.integers(150, 256)
+        image = Image.fromarray(pixels)
+        for extension in paths:
+            path = directory / f"screen_{index:03d}.{extension}"
+            image.save(path, quality=92) if extension == "jpg" else image.save(path)
+            paths[extension].append(path)
+    return paths
+
+
+def _run_strategy(strategy: str, paths: list[Path]) -> None:
+    start = time.perf_counter()
+    for path in paths:
+        if strategy == "open-crop":
+            _legacy_crop(path, PRESET)
+        elif strategy == "crop_image":
+            crop_image(path, PRESET)
+        else:
+            crop_image(path, PRESET, scale=0.5)
+    elapsed = (time.perf_counter() - start) / len(paths)
+    print(f"{elapsed * 1000:.1f} {_peak_rss_kib() / 1024:.1f}")
+
+
+def _peak_rss_kib() -> int:
+    # ru_maxrss survives exec on Linux and would report the parent's peak;
+    # VmHWM belongs to this process image only.
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        screenshots = _write_screenshots(Path(directory))
+        print(f"{'format':<7} {'strategy':<16} {'ms/image':>9} {'peak RSS MiB':>13}")
+        for extension, paths in screenshots.items():
+            for strategy in STRATEGIES:
+                output = subprocess.run(
+                    [sys.executable, __file__, "--worker", strategy, *map(str, paths)],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout.split()
+                print(f"{extension:<7} {strategy:<16} {output[0]:>9} {output[1]:>13}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--worker":
+        _run_strategy(sys.argv[2], [Path(arg) for arg in sys.argv[3:]])
+    else:
+        main()
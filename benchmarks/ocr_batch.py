@@ -0,0 +1,81 @@
+"""Compare OCR throughput at different ``read_batch`` batch sizes.
+
+Run from the repository root: ``python benchmarks/ocr_batch.py [engine ...]``
+(default: easyocr tesseract). Every engine reads the same synthetic panel
+crops in chunks of each batch size, the way the pipeline hands a chunk of
+``PipelineOptions.batch_size`` crops to ``read_batch``. Engines that cannot
+be built here (missing package, binary or models) are reported and skipped.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import time
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.ocr_engine import OCREngine, build_engine  # noqa: E402
+
+
+PANEL_SIZE = (640, 720)
+CROP_COUNT = 64
+BATCH_SIZES = (1, 8, 32)
+DEFAULT_ENGINES = ("easyocr", "tesseract")
+
+
+def _make_crops() -> list[Image.Image]:
+    rng = np.random.default_rng(0)
+    crops = []
+    for index in range(CROP_COUNT):
+        image = Image.new("RGB", PANEL_SIZE, (32, 30, 28))
+        draw = ImageDraw.Draw(image)
+        lines = [
+            f"Nickname member{index:04d}",
+            "Role Member",
+            f"Days {rng.integers(1, 900)}",
+            f"Weekly activity {rng.integers(0, 5000)}",
+            f"Realm {rng.integers(1, 99)}.{rng.integers(0, 9)}",
+            f"Exploration {rng.integers(0, 400)}",
+            f"Mastery {rng.integers(0, 400)}",
+        ]
+        for line_number, line in enumerate(lines):
+            draw.text((40, 60 + line_number * 80), line, fill=(235, 230, 220))
+        crops.append(image)
+    return crops
+
+
+def _throughput(engine: OCREngine, crops: list[Image.Image], batch_size: int) -> float:
+    start = time.perf_counter()
+    for offset in range(0, len(crops), batch_size):
+        engine.read_batch(crops[offset : offset + batch_size])
+    return len(crops) / (time.perf_counter() - start)
+
+
+def main(engine_names: list[str]) -> None:
+    crops = _make_crops()
+    print(f"{CROP_COUNT} crops of {PANEL_SIZE[0]}x{PANEL_SIZE[1]}")
+    print(f"{'engine':<11} {'batch':>5} {'images/s':>9} {'vs batch 1':>10}")
+    for name in engine_names:
+        try:
+            engine = build_engine(name)
+            # Warm up outside the timing: model loading and the first call.
+            engine.read_batch(crops[:1])
+        except (ImportError, OSError, RuntimeError) as error:
+            print(f"{name:<11} unavailable: {error}")
+            continue
+        baseline = None
+        for batch_size in BATCH_SIZES:
+            rate = _throughput(engine, crops, batch_size)
+            baseline = baseline or rate
+            print(f"{name:<11} {batch_size:>5} {rate:>9.2f} {rate / baseline:>9.2f}x")
+        close = getattr(engine, "close", None)
+        if close is not None:
+            close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or list(DEFAULT_ENGINES))
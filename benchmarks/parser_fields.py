@@ -0,0 +1,86 @@
+"""Compare the single-pass field extractor with per-field regex searches.
+
+Run from the repository root: ``python benchmarks/parser_fields.py``.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import random
+import re
+import sys
+import timeit
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.parser import _normalize, parse_member_text  # noqa: E402
+
+
+ROUNDS = 5
+PATHOLOGICAL_SIZE = 10 * 1024
+
+# The extractor this replaced: one search per field, patterns as strings.
+_LEGACY_PATTERNS = {
+    "nickname": r"닉네임\s*([\w\W]+?)\s",
+    "role": r"직책\s*([\w\W]+?)\s",
+    "faction": r"문파\s*([\w\W]+?)\s",
+    "days_since_join": r"가입\s*일수\s*(\d+\s*일)",
+    "weekly_activity": r"이번\s*주\s*활약도\s*(\d+)",
+    "martial_realm": r"무공\s*경지\s*([\d\.]+\S*)",
+    "exploration_skill": r"탐색\s*숙련도\s*(\d+)",
+    "tech_mastery": r"기술\s*조예\s*(\d+)",
+}
+
+CLEAN = (
+    "닉네임 청풍검객 직책 장로 문파 청운문 가입 일수 152일 "
+    "이번 주 활약도 3400 무공 경지 12.5 탐색 숙련도 880 기술 조예 415"
+)
+# Misread label syllables, labels split mid-word and stray symbols.
+NOISY = (
+    "| 넥네임 청풍검객 · 직잭 장로 운파 청운문 가입 일 수 152일 "
+    "이번주 할약도 3400 ~ 무공경시 12.5 탐색 숙런도 880 기슬 조예 415 ]"
+)
+
+
+def _legacy_parse(text: str) -> dict[str, str]:
+    normalized = _normalize(text)
+    values = {}
+    for name, pattern in _LEGACY_PATTERNS.items():
+        match = re.search(pattern, normalized)
+        values[name] = match.group(1).strip() if match else ""
+    return values
+
+
+def _parse(text: str) -> dict[str, str]:
+    record = parse_member_text(text, 1)
+    return {name: getattr(record, name) for name in _LEGACY_PATTERNS}
+
+
+def _inputs() -> dict[str, str]:
+    rng = random.Random(0)
+    alphabet = "가나다라마바사아자차카타파하0123456789abcxyz.|"
+    garbage = "".join(rng.choice(alphabet) for _ in range(PATHOLOGICAL_SIZE))
+    spaced = " ".join(garbage[position : position + 7] for position in range(0, len(garbage), 7))
+    return {
+        "clean": CLEAN,
+        "noisy": NOISY,
+        "10KB garbage": spaced,
+        "10KB repeated label": "닉네임" * (PATHOLOGICAL_SIZE // 3),
+        "10KB unspaced tail": CLEAN[:40] + "직책문파" * (PATHOLOGICAL_SIZE // 4),
+    }
+
+
+def main() -> None:
+    assert _parse(CLEAN) == _legacy_parse(CLEAN)
+    noisy = _parse(NOISY)
+    assert noisy == _legacy_parse(CLEAN), noisy
+    print(f"{'input':<22} {'legacy ms':>10} {'single-pass ms':>15} {'speedup':>8} {'fields':>7}")
+    for label, text in _inputs().items():
+        legacy_ms = min(timeit.repeat(lambda: _legacy_parse(text), number=1, repeat=ROUNDS)) * 1000
+        new_ms = min(timeit.repeat(lambda: _parse(text), number=1, repeat=ROUNDS)) * 1000
+        found = sum(1 for value in _parse(text).values() if value)
+        print(f"{label:<22} {legacy_ms:>10.3f} {new_ms:>15.3f} {legacy_ms / new_ms:>7.1f}x {found:>7}")
+
+
+if __name__ == "__main__":
+    main()
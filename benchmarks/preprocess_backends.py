@@ -0,0 +1,54 @@
+"""Compare the PIL and numpy preprocessing backends on 1440p panel crops.
+
+Run from the repository root: ``python benchmarks/preprocess_backends.py``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+import sys
+import timeit
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.preprocess import PREPROCESS_VARIANTS, PreprocessSettings  # noqa: E402
+
+
+# A profile panel cropped from a 2560x1440 screenshot.
+CROP_SIZE = (1100, 1200)
+ROUNDS = 20
+
+
+def _sample_crop() -> Image.Image:
+    rng = np.random.default_rng(0)
+    pixels = rng.integers(0, 256, (CROP_SIZE[1], CROP_SIZE[0], 3), dtype=np.uint8)
+    return Image.fromarray(pixels)
+
+
+def main() -> None:
+    crop = _sample_crop()
+    settings_list = (PreprocessSettings(),) + PREPROCESS_VARIANTS
+    print(f"{'settings':<70} {'pil ms':>8} {'numpy ms':>9} {'speedup':>8}")
+    for settings in settings_list:
+        numpy_settings = replace(settings, backend="numpy")
+        assert np.array_equal(
+            np.asarray(settings.apply(crop)),
+            np.asarray(numpy_settings.apply(crop)),
+        )
+        pil_ms = min(timeit.repeat(lambda: settings.apply(crop), number=1, repeat=ROUNDS)) * 1000
+        numpy_ms = (
+            min(timeit.repeat(lambda: numpy_settings.apply(crop), number=1, repeat=ROUNDS)) * 1000
+        )
+        label = (
+            f"sharpen={settings.sharpen} contrast={settings.contrast} "
+            f"threshold={settings.threshold} invert={settings.invert}"
+        )
+        print(f"{label:<70} {pil_ms:>8.2f} {numpy_ms:>9.2f} {pil_ms / numpy_ms:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import json
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from core.image_cropper import CropPreset
+    from core.pipeline import PipelineOptions
 
 
 DEFAULT_CONFIG_PATH = Path("settings.json")
@@ -13,12 +17,21 @@ DEFAULT_CONFIG_PATH = Path("settings.json")
 
 @dataclass(frozen=True)
 class AppSettings:
-    """User-facing settings persisted to disk."""
+    """User-facing settings persisted to disk.
+
+    ``crop_presets`` caches automatically detected presets keyed by
+    ``core.preset_detector.preset_cache_key``; ``panel_template`` points to
+    the reference panel they are detected from.
+    """
 
     default_csv_path: Path | None = None
     last_opened_project: Path | None = None
     crop_preset: str | None = None
     ocr_language: str = "kor+eng"
+    ocr_jobs: int = 1
+    ui_scale: float = 1.0
+    panel_template: Path | None = None
+    crop_presets: dict[str, CropPreset] = field(default_factory=dict)
 
 
 def _coerce_path(value: Any) -> Path | None:
@@ -39,9 +52,22 @@ def load_settings(path: Path = DEFAULT_CONFIG_PATH) -> AppSettings:
         last_opened_project=_coerce_path(payload.get("last_opened_project")),
         crop_preset=payload.get("crop_preset"),
         ocr_language=payload.get("ocr_language", "kor+eng"),
+        ocr_jobs=int(payload.get("ocr_jobs", 1)),
+        ui_scale=float(payload.get("ui_scale", 1.0)),
+        panel_template=_coerce_path(payload.get("panel_template")),
+        crop_presets=_load_presets(payload.get("crop_presets", {})),
     )
 
 
+def _load_presets(payload: dict[str, Any]) -> dict[str, CropPreset]:
+    if not payload:
+        return {}
+    # Imported here so reading settings at startup does not load Pillow.
+    from core.image_cropper import CropPreset
+
+    return {key: CropPreset.from_dict(value) for key, value in payload.items()}
+
+
 def save_settings(settings: AppSettings, path: Path = DEFAULT_CONFIG_PATH) -> None:
     """Persist settings to JSON."""
 
@@ -54,5 +80,28 @@ def save_settings(settings: AppSettings, path: Path = DEFAULT_CONFIG_PATH) -> No
         else None,
         "crop_preset": settings.crop_preset,
         "ocr_language": settings.ocr_language,
+        "ocr_jobs": settings.ocr_jobs,
+        "ui_scale": settings.ui_scale,
+        "panel_template": str(settings.panel_template)
+        if settings.panel_template
+        else None,
+        "crop_presets": {
+            key: preset.to_dict() for key, preset in settings.crop_presets.items()
+        },
     }
     path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def pipeline_options(settings: AppSettings, **overrides: Any) -> PipelineOptions:
+    """Batch OCR options for ``settings``: worker count and OCR language.
+
+    ``overrides`` are passed through to ``PipelineOptions``.
+    """
+
+    from core.pipeline import PipelineOptions
+
+    return PipelineOptions(
+        jobs=settings.ocr_jobs,
+        language=settings.ocr_language,
+        **overrides,
+    )
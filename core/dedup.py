@@ -0,0 +1,218 @@
+"""Perceptual hashes of cropped panels for skipping duplicate screenshots."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from datetime import date
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Iterable
+
+from PIL import Image
+
+from core.fileio import atomic_write_text
+
+
+DEFAULT_MAX_DISTANCE = 2
+_HASH_SIZE = 16
+_INDEX_VERSION = 2
+
+
+def dhash(image: Image.Image, size: int = _HASH_SIZE) -> int:
+    """``size``-squared-bit difference hash: brightness gradients of a thumbnail."""
+
+    thumbnail = image.convert("L").resize((size + 1, size), Image.Resampling.BOX)
+    pixels = thumbnail.tobytes()
+    value = 0
+    for row in range(size):
+        offset = row * (size + 1)
+        for column in range(size):
+            value = (value << 1) | (pixels[offset + column] > pixels[offset + column + 1])
+    return value
+
+
+def hamming_distance(first: int, second: int) -> int:
+    return (first ^ second).bit_count()
+
+
+@dataclass(frozen=True)
+class PanelHash:
+    """Fingerprint of a panel: a perceptual hash plus an exact pixel digest.
+
+    ``bits`` finds candidates within a few bits; ``digest`` confirms them, so
+    panels that share a layout but differ in a single digit never match.
+    """
+
+    bits: int
+    digest: str
+
+
+def panel_hash(panel: Image.Image, regions: Iterable[Image.Image] = ()) -> PanelHash:
+    """Hash the field ``regions`` cut from ``panel``, or the whole panel without them.
+
+    Field regions hold the text that tells members apart; a thumbnail of the
+    whole panel mostly captures its layout.
+    """
+
+    images = list(regions) or [panel]
+    bits = 0
+    digest = hashlib.blake2b(digest_size=16)
+    for image in images:
+        gray = image.convert("L")
+        bits = (bits << (_HASH_SIZE * _HASH_SIZE)) | dhash(gray)
+        digest.update(f"{gray.width}x{gray.height}:".encode("ascii"))
+        digest.update(gray.tobytes())
+    return PanelHash(bits=bits, digest=digest.hexdigest())
+
+
+@dataclass
+class _HashEntry:
+    hash: int
+    digest: str
+    source: str
+    batch: str
+
+
+@dataclass(frozen=True)
+class Duplicate:
+    """A screenshot whose panel matched one seen earlier.
+
+    ``previous_batch`` is set when the original came from an earlier batch
+    rather than the current one.
+    """
+
+    path: Path
+    original: Path
+    distance: int
+    previous_batch: str | None = None
+
+
+@dataclass
+class PanelHashIndex:
+    """Hashes of every panel seen in a project, persisted between batches.
+
+    ``check`` records a new panel or reports it as a duplicate of a stored one
+    within ``max_distance`` bits. With ``exact`` (the default) a candidate
+    must also have the same pixel digest; turning it off also catches
+    re-encoded copies of a screenshot, at the risk of skipping a profile
+    whose numbers changed by a digit or two. Screenshots are identified by
+    path, so re-running a batch does not flag its files as duplicates of
+    themselves. With ``path`` unset the index only lives for one batch. Call
+    ``save`` once the batch finishes.
+    """
+
+    path: Path | None = None
+    max_distance: int = DEFAULT_MAX_DISTANCE
+    exact: bool = True
+    batch: str = field(default_factory=lambda: date.today().isoformat())
+    duplicates: list[Duplicate] = field(default_factory=list, init=False)
+    _entries: dict[str, _HashEntry] = field(default_factory=dict, init=False, repr=False)
+    _dirty: bool = field(default=False, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._entries = self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def find(self, image_path: Path, value: PanelHash) -> Duplicate | None:
+        """The closest indexed panel ``image_path`` duplicates, without recording anything."""
+
+        source = str(image_path.resolve())
+        best: tuple[int, _HashEntry] | None = None
+        for entry in self._entries.values():
+            if entry.source == source or (self.exact and entry.digest != value.digest):
+                continue
+            distance = hamming_distance(value.bits, entry.hash)
+            if distance <= self.max_distance and (best is None or distance < best[0]):
+                best = (distance, entry)
+        if best is None:
+            return None
+        distance, entry = best
+        return Duplicate(
+            path=image_path,
+            original=Path(entry.source),
+            distance=distance,
+            previous_batch=entry.batch if entry.batch != self.batch else None,
+        )
+
+    def check(self, image_path: Path, value: PanelHash) -> Duplicate | None:
+        """Return the duplicate record for ``image_path`` or index it as new."""
+
+        duplicate = self.find(image_path, value)
+        if duplicate is not None:
+            self.duplicates.append(duplicate)
+            return duplicate
+
+        source = str(image_path.resolve())
+        known = self._entries.get(source)
+        if known is None:
+            self._entries[source] = _HashEntry(
+                hash=value.bits,
+                digest=value.digest,
+                source=source,
+                batch=self.batch,
+            )
+            self._dirty = True
+        elif (known.hash, known.digest) != (value.bits, value.digest):
+            # Same file hashed at another decode scale; keep when it was first seen.
+            known.hash, known.digest = value.bits, value.digest
+            self._dirty = True
+        return None
+
+    def add_duplicate(self, duplicate: Duplicate) -> None:
+        """Record a duplicate found by ``find`` on a copy of this index."""
+
+        self.duplicates.append(duplicate)
+
+    def groups(self) -> dict[Path, list[Duplicate]]:
+        """Duplicates found so far, grouped by the screenshot they repeat."""
+
+        grouped: dict[Path, list[Duplicate]] = {}
+        for duplicate in self.duplicates:
+            grouped.setdefault(duplicate.original, []).append(duplicate)
+        return grouped
+
+    def summary(self) -> str:
+        earlier = sum(1 for duplicate in self.duplicates if duplicate.previous_batch)
+        return (
+            f"Skipped {len(self.duplicates)} duplicate screenshots "
+            f"({earlier} seen in earlier batches)"
+        )
+
+    def save(self) -> None:
+        """Write the index to ``path`` if anything changed."""
+
+        if self.path is None or not self._dirty:
+            return
+        payload: dict[str, Any] = {
+            "version": _INDEX_VERSION,
+            "entries": [
+                {**asdict(entry), "hash": f"{entry.hash:x}"}
+                for entry in self._entries.values()
+            ],
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(self.path, json.dumps(payload, ensure_ascii=False))
+        self._dirty = False
+
+    def _load(self) -> dict[str, _HashEntry]:
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if payload.get("version") != _INDEX_VERSION:
+            return {}
+        entries = {}
+        for item in payload.get("entries", []):
+            entry = _HashEntry(
+                hash=int(item["hash"], 16),
+                digest=item["digest"],
+                source=item["source"],
+                batch=item["batch"],
+            )
+            entries[entry.source] = entry
+        return entries
@@ -1,52 +1,133 @@
-"""CSV import/export helpers."""
+"""CSV import/export helpers.
+
+Paths ending in ``.gz`` are read and written as gzip-compressed CSV.
+"""
 
 from __future__ import annotations
 
 import csv
+import gzip
+import itertools
 from pathlib import Path
-from typing import Iterable
+from typing import IO, Iterable, Iterator, Sequence
+
+from models import DEFAULT_FIELDS, GuildMemberRecord, RecordTable
+
+
+_IMPORT_CHUNK_ROWS = 4096
+
+
+def _open_csv(path: Path, mode: str) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, f"{mode}t", encoding="utf-8", newline="")
+    return path.open(mode, newline="", encoding="utf-8")
+
+
+class RecordWriter:
+    """Streams records to CSV under a header schema fixed up front.
+
+    Rows are written as they arrive, so memory does not grow with the row
+    count. Extra fields must be listed in ``columns``; a record carrying an
+    unknown one raises ``ValueError`` rather than losing data.
+    """
+
+    def __init__(self, path: Path, columns: Sequence[str] = DEFAULT_FIELDS) -> None:
+        self.columns = list(columns)
+        self._known = set(self.columns)
+        self._handle = _open_csv(path, "w")
+        self._writer = csv.writer(self._handle)
+        self._writer.writerow(self.columns)
+        self.rows_written = 0
+
+    def __enter__(self) -> RecordWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def write(self, record: GuildMemberRecord) -> None:
+        unknown = [name for name in record.extras if name not in self._known]
+        if unknown:
+            raise ValueError(f"Record {record.index} has columns outside the schema: {unknown}")
+        self._writer.writerow(
+            [
+                getattr(record, name) if name in DEFAULT_FIELDS else record.extras.get(name, "")
+                for name in self.columns
+            ],
+        )
+        self.rows_written += 1
+
+    def write_cells(self, cells: Sequence[object]) -> None:
+        """Write one row given as cells in ``columns`` order."""
 
-from models import DEFAULT_FIELDS, GuildMemberRecord
+        self._writer.writerow(cells)
+        self.rows_written += 1
 
+    def write_table(self, table: RecordTable) -> None:
+        unknown = [name for name in table.columns if name not in self._known]
+        if unknown:
+            raise ValueError(f"Table has columns outside the schema: {unknown}")
+        self._writer.writerows(table.iter_rows(self.columns))
+        self.rows_written += len(table)
 
-def export_records(path: Path, records: Iterable[GuildMemberRecord]) -> None:
-    """Write records to CSV."""
+    def close(self) -> None:
+        self._handle.close()
 
-    rows = [record.to_csv_row(DEFAULT_FIELDS) for record in records]
-    headers: list[str] = []
-    for row in rows:
-        for key in row:
-            if key not in headers:
-                headers.append(key)
 
-    with path.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=headers)
-        writer.writeheader()
-        writer.writerows(rows)
+def export_records(path: Path, records: RecordTable | Iterable[GuildMemberRecord]) -> None:
+    """Write records to CSV: default fields first, then extra columns.
+
+    The header comes from the table's column metadata. A plain iterable of
+    records is collected into a table first to discover its extra columns;
+    use ``RecordWriter`` to stream records whose columns are known.
+    """
+
+    table = records if isinstance(records, RecordTable) else RecordTable.from_records(records)
+    with RecordWriter(path, table.columns) as writer:
+        writer.write_table(table)
+
+
+def iter_tables(path: Path, chunk_rows: int = _IMPORT_CHUNK_ROWS) -> Iterator[RecordTable]:
+    """Read a CSV as a sequence of RecordTables of at most ``chunk_rows`` rows.
+
+    Every chunk carries the file's full column list, and only one chunk is in
+    memory at a time.
+    """
+
+    with _open_csv(path, "r") as handle:
+        reader = csv.reader(handle)
+        header = next(reader, [])
+        while chunk := list(itertools.islice(reader, chunk_rows)):
+            table = RecordTable()
+            for name in header:
+                table.add_column(name)
+            table.extend_rows(header, chunk)
+            yield table
+
+
+def iter_records(path: Path, chunk_rows: int = _IMPORT_CHUNK_ROWS) -> Iterator[GuildMemberRecord]:
+    """Stream records from CSV without holding the whole file."""
+
+    for table in iter_tables(path, chunk_rows):
+        yield from table.records()
+
+
+def import_table(path: Path) -> RecordTable:
+    """Load a CSV straight into a RecordTable."""
+
+    table = RecordTable()
+    with _open_csv(path, "r") as handle:
+        reader = csv.reader(handle)
+        header = next(reader, [])
+        for name in header:
+            table.add_column(name)
+        while chunk := list(itertools.islice(reader, _IMPORT_CHUNK_ROWS)):
+            table.extend_rows(header, chunk)
+    return table
 
 
 def import_records(path: Path) -> list[GuildMemberRecord]:
     """Load records from CSV into GuildMemberRecord entries."""
 
-    with path.open("r", newline="", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        records: list[GuildMemberRecord] = []
-        for row in reader:
-            record = GuildMemberRecord(
-                index=int(row.get("index", "0") or 0),
-                nickname=row.get("nickname", ""),
-                role=row.get("role", ""),
-                faction=row.get("faction", ""),
-                days_since_join=row.get("days_since_join", ""),
-                weekly_activity=row.get("weekly_activity", ""),
-                martial_realm=row.get("martial_realm", ""),
-                exploration_skill=row.get("exploration_skill", ""),
-                tech_mastery=row.get("tech_mastery", ""),
-                extras={
-                    key: value
-                    for key, value in row.items()
-                    if key not in DEFAULT_FIELDS
-                },
-            )
-            records.append(record)
-        return records
+    return list(iter_records(path))
+
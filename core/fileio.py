@@ -0,0 +1,22 @@
+"""File helpers shared by the caches, indexes and manifests written to disk."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+
+def atomic_write_text(path: Path, text: str, *, mode: int = 0o666) -> None:
+    """Replace ``path`` with ``text`` so readers never see a partial file.
+
+    The text goes to a ``.tmp`` sibling first, which ``os.replace`` then
+    moves over ``path``. ``mode`` (less the umask) is set when the temporary
+    file is created, so a private file is never readable by others, even
+    briefly.
+    """
+
+    temp_path = path.with_suffix(".tmp")
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    with os.fdopen(fd, "w", encoding="utf-8") as handle:
+        handle.write(text)
+    os.replace(temp_path, path)
@@ -2,44 +2,176 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+import math
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Iterable
 
 from PIL import Image
 
+from core.dedup import PanelHash, PanelHashIndex, panel_hash
+
+
+@dataclass(frozen=True)
+class FieldRegion:
+    """Normalized sub-rectangle of the cropped panel holding one record field.
+
+    Coordinates are relative to the panel, not the full screenshot. Numeric
+    fields are recognized as a single line restricted to digits.
+    """
+
+    name: str
+    x: float
+    y: float
+    width: float
+    height: float
+    numeric: bool = False
+
 
 @dataclass(frozen=True)
 class CropPreset:
-    """Defines a normalized crop region for a specific resolution."""
+    """Defines a normalized crop region for a specific resolution.
+
+    When ``fields`` is set, each field is OCR'd from its own sub-region of the
+    panel instead of parsing one OCR blob of the whole panel.
+    """
 
     name: str
     x: float
     y: float
     width: float
     height: float
+    fields: tuple[FieldRegion, ...] = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation of the preset."""
+
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> CropPreset:
+        """Rebuild a preset saved with ``to_dict``."""
+
+        return cls(
+            name=payload["name"],
+            x=float(payload["x"]),
+            y=float(payload["y"]),
+            width=float(payload["width"]),
+            height=float(payload["height"]),
+            fields=tuple(FieldRegion(**region) for region in payload.get("fields", ())),
+        )
 
 
-def crop_image(image_path: Path, preset: CropPreset) -> Image.Image:
-    """Crop an image using a normalized preset (0-1 coordinates)."""
+def _normalized_box(
+    size: tuple[int, int],
+    x: float,
+    y: float,
+    width: float,
+    height: float,
+) -> tuple[int, int, int, int]:
+    image_width, image_height = size
+    return (
+        int(image_width * x),
+        int(image_height * y),
+        int(image_width * (x + width)),
+        int(image_height * (y + height)),
+    )
+
+
+def crop_image(image_path: Path, preset: CropPreset, *, scale: float = 1.0) -> Image.Image:
+    """Crop an image using a normalized preset (0-1 coordinates).
+
+    Only as much of the screenshot as the preset needs is decoded. JPEGs use
+    draft mode to decode at a reduced DCT scale when ``scale`` < 1, and
+    non-interlaced PNGs stop decoding below the panel. ``scale`` resizes the
+    crop for OCR. The file is closed before returning.
+    """
+
+    with Image.open(image_path) as image:
+        full_box = _normalized_box(image.size, preset.x, preset.y, preset.width, preset.height)
+        target = None
+        if scale != 1.0:
+            target = (
+                max(1, round((full_box[2] - full_box[0]) * scale)),
+                max(1, round((full_box[3] - full_box[1]) * scale)),
+            )
+            if image.format == "JPEG":
+                width, height = image.size
+                image.draft(image.mode, (math.ceil(width * scale), math.ceil(height * scale)))
+
+        box = _normalized_box(image.size, preset.x, preset.y, preset.width, preset.height)
+        _limit_decoded_rows(image, box[3])
+        cropped = image.crop(box)
+
+    if target is not None and cropped.size != target:
+        # Box-reduce by whole factors first; full Lanczos on a 4K panel costs
+        # more than the decode it follows.
+        cropped = cropped.resize(target, Image.Resampling.LANCZOS, reducing_gap=1.0)
+    return cropped
+
+
+def _limit_decoded_rows(image: Image.Image, rows: int) -> None:
+    """Stop a sequential PNG decode after ``rows`` scanlines.
+
+    PNG rows must be inflated in order, but nothing below the crop is needed.
+    Interlaced and animated files, and anything else, decode in full.
+    """
 
-    image = Image.open(image_path)
     width, height = image.size
-    left = int(width * preset.x)
-    upper = int(height * preset.y)
-    right = int(width * (preset.x + preset.width))
-    lower = int(height * (preset.y + preset.height))
-    return image.crop((left, upper, right, lower))
+    if (
+        image.format != "PNG"
+        or image.info.get("interlace")
+        or getattr(image, "n_frames", 1) != 1
+        or len(image.tile) != 1
+        or not 0 < rows < height
+    ):
+        return
+    codec, extents, offset, args = image.tile[0]
+    if tuple(extents) != (0, 0, width, height):
+        return
+    image.tile = [(codec, (0, 0, width, rows), offset, args)]
+    image._size = (width, rows)
+
+
+def crop_fields(panel: Image.Image, preset: CropPreset) -> dict[str, Image.Image]:
+    """Cut each of the preset's field regions out of a cropped panel."""
+
+    return {
+        region.name: panel.crop(
+            _normalized_box(panel.size, region.x, region.y, region.width, region.height),
+        )
+        for region in preset.fields
+    }
+
+
+def hash_panel(panel: Image.Image, preset: CropPreset) -> PanelHash:
+    """Duplicate-detection hash of a cropped panel, taken over its field regions."""
+
+    return panel_hash(panel, crop_fields(panel, preset).values())
+
 
+def batch_crop(
+    images: Iterable[Path],
+    preset: CropPreset,
+    output_dir: Path,
+    hashes: PanelHashIndex | None = None,
+) -> list[Path]:
+    """Crop multiple images and save them to the output directory.
 
-def batch_crop(images: Iterable[Path], preset: CropPreset, output_dir: Path) -> list[Path]:
-    """Crop multiple images and save them to the output directory."""
+    With ``hashes``, panels that duplicate one already indexed are not saved
+    and are listed in ``hashes.duplicates`` instead. Crops keep their
+    screenshot number either way.
+    """
 
     output_dir.mkdir(parents=True, exist_ok=True)
     output_paths: list[Path] = []
     for index, image_path in enumerate(images, start=1):
         cropped = crop_image(image_path, preset)
+        if hashes is not None and hashes.check(image_path, hash_panel(cropped, preset)) is not None:
+            continue
         output_path = output_dir / f"cropped_{index:03d}.png"
         cropped.save(output_path)
         output_paths.append(output_path)
+    if hashes is not None:
+        hashes.save()
     return output_paths
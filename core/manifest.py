@@ -0,0 +1,305 @@
+"""Build manifest that lets a project rebuild only screenshots that changed.
+
+``manifest.json`` in the project root records, per input screenshot, its
+content hash, fingerprints of the crop and OCR settings it was processed
+with, and the outputs it produced (cropped panel and OCR result). An entry
+is stale from the first stage whose inputs changed: the crop stage when the
+file, the crop settings or its screenshot number changed or its cropped
+panel is gone, and the OCR stage when only the OCR settings changed.
+``rebuild_project`` re-runs each stale entry from that stage on, make-style.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, replace
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Iterator, Sequence
+
+from core.dedup import PanelHashIndex
+from core.fileio import atomic_write_text
+from core.image_cropper import CropPreset
+from core.pipeline import CascadeStats, PipelineOptions, iter_batch
+from core.preset_detector import PresetResolver, group_by_preset
+from core.project_store import ProjectPaths
+from models import ScreenshotOCRResult
+
+
+_MANIFEST_VERSION = 1
+_DIGEST_CHUNK_SIZE = 1024 * 1024
+# Build stages in pipeline order; each one's output feeds the next.
+STAGES: tuple[str, ...] = ("crop", "ocr")
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of a file's bytes, read in chunks."""
+
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(_DIGEST_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def stage_fingerprints(preset: CropPreset, options: PipelineOptions) -> dict[str, str]:
+    """Hash the settings that shape each stage's output.
+
+    Scheduling knobs (jobs, batch and queue sizes, cache location) and the
+    pixel-equivalent preprocessing backend are left out.
+    """
+
+    crop = {"preset": preset.to_dict(), "ocr_scale": options.ocr_scale}
+    preprocess = asdict(options.preprocess)
+    preprocess.pop("backend")
+    ocr = {
+        **crop,
+        "engines": list(options.engines),
+        "language": options.language,
+        "preprocess": preprocess,
+        "confidence_gate": options.confidence_gate,
+        "variant_search": options.variant_search,
+    }
+    return {"crop": _fingerprint(crop), "ocr": _fingerprint(ocr)}
+
+
+def _fingerprint(payload: dict[str, Any]) -> str:
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+@dataclass
+class ManifestEntry:
+    """What one input screenshot went through in the last build."""
+
+    index: int
+    size: int
+    mtime_ns: int
+    content_hash: str
+    stages: dict[str, str]
+    cropped: str | None = None
+    result: dict[str, Any] | None = None
+    duplicate_of: str | None = None
+
+
+@dataclass
+class BuildManifest:
+    """Per-input build records persisted as ``manifest.json``."""
+
+    path: Path
+    entries: dict[str, ManifestEntry]
+
+    @classmethod
+    def load(cls, path: Path) -> BuildManifest:
+        """Read a manifest; missing, unreadable or outdated files start empty."""
+
+        if not path.exists():
+            return cls(path, {})
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(path, {})
+        if payload.get("version") != _MANIFEST_VERSION:
+            return cls(path, {})
+        entries = {
+            source: ManifestEntry(**values) for source, values in payload.get("entries", {}).items()
+        }
+        return cls(path, entries)
+
+    def save(self) -> None:
+        payload = {
+            "version": _MANIFEST_VERSION,
+            "entries": {source: asdict(entry) for source, entry in self.entries.items()},
+        }
+        atomic_write_text(self.path, json.dumps(payload, ensure_ascii=False, indent=2))
+
+    def is_fresh(self, image_path: Path, index: int, stages: dict[str, str]) -> bool:
+        """Whether ``image_path`` can keep all of its recorded outputs."""
+
+        return self.stale_stage(image_path, index, stages) is None
+
+    def stale_stage(self, image_path: Path, index: int, stages: dict[str, str]) -> str | None:
+        """The first stage of ``STAGES`` that must re-run for ``image_path``, if any.
+
+        Unchanged size and modification time are trusted; otherwise the file
+        is re-hashed, and a matching hash just refreshes the recorded stat.
+        Later stages only count as stale once every earlier one is fresh.
+        """
+
+        entry = self.entries.get(_source_key(image_path))
+        if entry is None or entry.index != index:
+            return STAGES[0]
+        stat = image_path.stat()
+        if (stat.st_size, stat.st_mtime_ns) != (entry.size, entry.mtime_ns):
+            if file_digest(image_path) != entry.content_hash:
+                return STAGES[0]
+            entry.size, entry.mtime_ns = stat.st_size, stat.st_mtime_ns
+        if entry.stages.get("crop") != stages["crop"]:
+            return "crop"
+        if entry.cropped is not None and not Path(entry.cropped).exists():
+            return "crop"
+        if entry.stages.get("ocr") != stages["ocr"]:
+            # OCR re-runs read the saved panel; duplicates have none and
+            # start over from the crop.
+            return "ocr" if entry.cropped is not None else "crop"
+        return None
+
+    def record(
+        self,
+        image_path: Path,
+        index: int,
+        stages: dict[str, str],
+        result: ScreenshotOCRResult | None,
+        duplicate_of: Path | None = None,
+    ) -> None:
+        stat = image_path.stat()
+        self.entries[_source_key(image_path)] = ManifestEntry(
+            index=index,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            content_hash=file_digest(image_path),
+            stages=stages,
+            cropped=str(result.cropped_path) if result and result.cropped_path else None,
+            result=_result_payload(result) if result else None,
+            duplicate_of=str(duplicate_of) if duplicate_of else None,
+        )
+
+    def result(self, image_path: Path) -> ScreenshotOCRResult | None:
+        entry = self.entries.get(_source_key(image_path))
+        if entry is None or entry.result is None:
+            return None
+        return _result_from_payload(entry.result)
+
+    def prune(self, image_paths: Sequence[Path]) -> None:
+        """Forget inputs that are no longer part of the project."""
+
+        keep = {_source_key(path) for path in image_paths}
+        for source in [source for source in self.entries if source not in keep]:
+            del self.entries[source]
+
+
+def rebuild_project(
+    paths: ProjectPaths,
+    images: Sequence[Path],
+    preset: CropPreset | PresetResolver,
+    options: PipelineOptions = PipelineOptions(),
+    stats: CascadeStats | None = None,
+    hashes: PanelHashIndex | None = None,
+) -> list[ScreenshotOCRResult]:
+    """Re-run only the stale stages of a project's screenshots and return every result.
+
+    Screenshots are numbered from 1 in ``images`` order, so appending new
+    screenshots leaves existing entries fresh. Screenshots whose crop is
+    still current are OCR'd again from their saved panel without decoding
+    the screenshot; the rest are cropped into ``paths.cropped_dir`` and OCR'd.
+    With a ``PresetResolver``, each screenshot is rebuilt with the preset of
+    its resolution. The manifest is saved even if the run is interrupted,
+    keeping whatever finished.
+    """
+
+    manifest = BuildManifest.load(paths.manifest)
+    manifest.prune(images)
+    groups = group_by_preset(images, preset)
+    try:
+        for group_preset, numbered in groups:
+            _rebuild_stale(manifest, paths, group_preset, numbered, options, stats, hashes)
+    finally:
+        manifest.save()
+
+    results = (manifest.result(image_path) for image_path in images)
+    return [result for result in results if result is not None]
+
+
+def _rebuild_stale(
+    manifest: BuildManifest,
+    paths: ProjectPaths,
+    preset: CropPreset,
+    numbered: Sequence[tuple[int, Path]],
+    options: PipelineOptions,
+    stats: CascadeStats | None,
+    hashes: PanelHashIndex | None,
+) -> None:
+    """Rebuild the stale stages of numbered screenshots sharing one preset."""
+
+    stages = stage_fingerprints(preset, options)
+    stale_from: dict[str, list[tuple[int, Path]]] = {stage: [] for stage in STAGES}
+    for index, image_path in numbered:
+        stage = manifest.stale_stage(image_path, index, stages)
+        if stage is not None:
+            stale_from[stage].append((index, image_path))
+    stale = stale_from["crop"]
+    duplicates_before = len(hashes.duplicates) if hashes is not None else 0
+    try:
+        for result in _reread_panels(manifest, stale_from["ocr"], preset, options, stats):
+            manifest.record(result.source_path, result.index, stages, result)
+        for result in iter_batch(
+            [image_path for _, image_path in stale],
+            preset,
+            paths.cropped_dir,
+            options,
+            stats,
+            hashes,
+            indexes=[index for index, _ in stale],
+        ):
+            manifest.record(result.source_path, result.index, stages, result)
+    finally:
+        if hashes is not None:
+            numbers = {image_path: index for index, image_path in stale}
+            for duplicate in hashes.duplicates[duplicates_before:]:
+                manifest.record(
+                    duplicate.path,
+                    numbers[duplicate.path],
+                    stages,
+                    None,
+                    duplicate.original,
+                )
+
+
+def _reread_panels(
+    manifest: BuildManifest,
+    stale: Sequence[tuple[int, Path]],
+    preset: CropPreset,
+    options: PipelineOptions,
+    stats: CascadeStats | None,
+) -> Iterator[ScreenshotOCRResult]:
+    """OCR the saved panels of screenshots whose crop stage is still fresh.
+
+    A saved panel holds exactly the pixels OCR consumed (already scaled by
+    ``ocr_scale``), so it is read whole at scale 1 with the preset's fields.
+    """
+
+    if not stale:
+        return
+    panel = replace(preset, x=0.0, y=0.0, width=1.0, height=1.0)
+    panels = [Path(manifest.entries[_source_key(image_path)].cropped) for _, image_path in stale]
+    results = iter_batch(
+        panels,
+        panel,
+        None,
+        replace(options, ocr_scale=1.0),
+        stats,
+        indexes=[index for index, _ in stale],
+    )
+    # Without a hash index every panel yields a result, in input order.
+    for result, (_, image_path), panel_path in zip(results, stale, panels):
+        yield replace(result, source_path=image_path, cropped_path=panel_path)
+
+
+def _source_key(image_path: Path) -> str:
+    return str(image_path.resolve())
+
+
+def _result_payload(result: ScreenshotOCRResult) -> dict[str, Any]:
+    payload = asdict(result)
+    payload["source_path"] = str(result.source_path)
+    payload["cropped_path"] = str(result.cropped_path) if result.cropped_path else None
+    return payload
+
+
+def _result_from_payload(payload: dict[str, Any]) -> ScreenshotOCRResult:
+    cropped_path = payload.get("cropped_path")
+    return replace(
+        ScreenshotOCRResult(**payload),
+        source_path=Path(payload["source_path"]),
+        cropped_path=Path(cropped_path) if cropped_path else None,
+    )
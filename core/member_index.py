@@ -0,0 +1,191 @@
+"""Fuzzy nickname index that maps OCR'd nicknames to stable member IDs."""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+import unicodedata
+
+from rapidfuzz import fuzz, process
+
+
+# Scores compare jamo (NFD) strings, so one wrong vowel in a three-syllable
+# nickname costs 1 of 9 units and scores about 89.
+DEFAULT_SCORE_CUTOFF = 70.0
+DEFAULT_AMBIGUITY_MARGIN = 5.0
+# Only the aliases sharing the most bigrams with a query are scored.
+_MAX_CANDIDATES = 32
+
+
+@dataclass(frozen=True)
+class MemberMatch:
+    """How a nickname was resolved.
+
+    ``alias`` is the known nickname it matched (itself for new members).
+    ``ambiguous`` means another member scored within the ambiguity margin, so
+    the assignment should be reviewed.
+    """
+
+    member_id: int
+    alias: str
+    score: float
+    ambiguous: bool = False
+    created: bool = False
+
+
+def normalize_nickname(nickname: str) -> str:
+    """Case- and whitespace-insensitive form used for matching."""
+
+    return "".join(nickname.split()).casefold()
+
+
+def _decompose(key: str) -> str:
+    """Split Hangul syllables into jamo so a single OCR slip costs one unit, not three."""
+
+    return unicodedata.normalize("NFD", key)
+
+
+def _bigrams(text: str) -> set[str]:
+    padded = f" {text} "
+    return {padded[position : position + 2] for position in range(len(padded) - 1)}
+
+
+class MemberIndex:
+    """Known nickname aliases with a bigram inverted index for candidate lookup.
+
+    Exact aliases resolve with one dict lookup. Otherwise the aliases sharing
+    the most bigrams with the query are scored with ``rapidfuzz`` and the best
+    one at or above ``score_cutoff`` wins. Bigrams and scores use the NFD
+    (jamo) form of each nickname. The cost depends on the number of similar
+    aliases, not on the size of the roster history.
+    """
+
+    def __init__(
+        self,
+        aliases: Iterable[tuple[str, int]] = (),
+        *,
+        score_cutoff: float = DEFAULT_SCORE_CUTOFF,
+        ambiguity_margin: float = DEFAULT_AMBIGUITY_MARGIN,
+    ) -> None:
+        self.score_cutoff = score_cutoff
+        self.ambiguity_margin = ambiguity_margin
+        self._aliases: dict[str, int] = {}
+        self._decomposed: dict[str, str] = {}
+        self._grams: dict[str, set[str]] = {}
+        self._next_id = 1
+        for alias, member_id in aliases:
+            self.add(alias, member_id)
+
+    def __len__(self) -> int:
+        return len(self._aliases)
+
+    def add(self, alias: str, member_id: int) -> None:
+        """Record ``alias`` as a spelling of ``member_id``."""
+
+        key = normalize_nickname(alias)
+        if not key or key in self._aliases:
+            return
+        self._aliases[key] = member_id
+        decomposed = self._decomposed[key] = _decompose(key)
+        for gram in _bigrams(decomposed):
+            self._grams.setdefault(gram, set()).add(key)
+        self._next_id = max(self._next_id, member_id + 1)
+
+    def lookup(self, nickname: str) -> MemberMatch | None:
+        """Best known member for ``nickname``, or ``None`` below the cutoff."""
+
+        key = normalize_nickname(nickname)
+        member_id = self._aliases.get(key)
+        if member_id is not None:
+            return MemberMatch(member_id=member_id, alias=key, score=100.0)
+
+        query = _decompose(key)
+        candidates = self._candidates(query)
+        best = process.extractOne(
+            query,
+            {alias: self._decomposed[alias] for alias in candidates},
+            scorer=fuzz.ratio,
+            score_cutoff=self.score_cutoff,
+        )
+        if best is None:
+            return None
+        _, score, alias = best
+        member_id = self._aliases[alias]
+        rivals = [
+            self._decomposed[candidate]
+            for candidate in candidates
+            if self._aliases[candidate] != member_id
+        ]
+        rival = process.extractOne(
+            query,
+            rivals,
+            scorer=fuzz.ratio,
+            score_cutoff=max(self.score_cutoff, score - self.ambiguity_margin),
+        )
+        return MemberMatch(member_id=member_id, alias=alias, score=score, ambiguous=rival is not None)
+
+    def resolve(self, nickname: str) -> MemberMatch:
+        """Like ``lookup``, but unknown nicknames become new members.
+
+        Unambiguous fuzzy matches are added as aliases, so the same OCR
+        spelling resolves exactly next time.
+        """
+
+        key = normalize_nickname(nickname)
+        if not key:
+            raise ValueError("Cannot resolve an empty nickname")
+        match = self.lookup(key)
+        if match is None:
+            return self._create(key)
+        if not match.ambiguous:
+            self.add(key, match.member_id)
+        return match
+
+    def resolve_batch(self, nicknames: Sequence[str]) -> list[MemberMatch]:
+        """Resolve one roster's nicknames without merging two of them.
+
+        Names on the same roster belong to different people however similar
+        they look (``검객1`` and ``검객2``), so a fuzzy match to a member
+        already claimed in the batch becomes a new member instead. Exact
+        aliases claim their members first; a repeated exact name still maps
+        to the same member.
+        """
+
+        keys = [normalize_nickname(nickname) for nickname in nicknames]
+        if not all(keys):
+            raise ValueError("Cannot resolve an empty nickname")
+        matches: list[MemberMatch | None] = [None] * len(keys)
+        claimed: set[int] = set()
+        for position, key in enumerate(keys):
+            member_id = self._aliases.get(key)
+            if member_id is not None:
+                matches[position] = MemberMatch(member_id=member_id, alias=key, score=100.0)
+                claimed.add(member_id)
+        for position, key in enumerate(keys):
+            if matches[position] is not None:
+                continue
+            match = self.lookup(key)
+            if match is None or (match.member_id in claimed and match.alias != key):
+                match = self._create(key)
+            elif not match.ambiguous:
+                self.add(key, match.member_id)
+            claimed.add(match.member_id)
+            matches[position] = match
+        return [match for match in matches if match is not None]
+
+    def aliases(self) -> dict[str, int]:
+        """Every known alias and its member ID."""
+
+        return dict(self._aliases)
+
+    def _create(self, key: str) -> MemberMatch:
+        member_id = self._next_id
+        self.add(key, member_id)
+        return MemberMatch(member_id=member_id, alias=key, score=100.0, created=True)
+
+    def _candidates(self, decomposed: str) -> list[str]:
+        shared: Counter[str] = Counter()
+        for gram in _bigrams(decomposed):
+            shared.update(self._grams.get(gram, ()))
+        return [alias for alias, _ in shared.most_common(_MAX_CANDIDATES)]
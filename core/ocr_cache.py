@@ -0,0 +1,180 @@
+"""Content-addressed cache for raw OCR output stored in the project's ``ocr_raw/``."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+import hashlib
+import json
+from pathlib import Path
+import time
+from typing import Any
+
+from PIL import Image
+
+from core.fileio import atomic_write_text
+from core.ocr_engine import OCRReading
+from core.preprocess import PreprocessSettings
+
+
+INDEX_FILENAME = "index.json"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+_INDEX_VERSION = 2
+
+
+def cache_key(
+    image: Image.Image,
+    engine_name: str,
+    language: str,
+    preprocess: PreprocessSettings,
+    mode: str = "panel",
+) -> str:
+    """Hash the cropped image pixels together with everything that shapes OCR.
+
+    ``mode`` distinguishes whole-panel OCR from ``line`` and ``digits`` field
+    reads of the same pixels.
+    """
+
+    digest = hashlib.sha256()
+    digest.update(f"{image.mode}:{image.width}x{image.height}\0".encode("utf-8"))
+    digest.update(image.tobytes())
+    settings = asdict(preprocess)
+    # Backends are pixel-equivalent, so switching one must not miss the cache.
+    settings.pop("backend")
+    params = {
+        "engine": engine_name,
+        "language": language,
+        "preprocess": settings,
+        "mode": mode,
+    }
+    digest.update(json.dumps(params, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+@dataclass
+class _CacheEntry:
+    size: int
+    last_used: float
+
+
+@dataclass
+class OCRCache:
+    """OCR reading cache with an on-disk index and least-recently-used eviction.
+
+    Entries live in ``<root>/<key[:2]>/<key>.json``; ``index.json`` records their
+    sizes and last use so lookups and eviction never scan the directory. The
+    in-memory index is kept in least-recently-used order with a running byte
+    total, so ``put`` and eviction cost the same however full the cache is.
+    Call ``save`` once a batch finishes to persist the index.
+    """
+
+    root: Path
+    max_bytes: int = DEFAULT_MAX_BYTES
+    _entries: OrderedDict[str, _CacheEntry] = field(
+        default_factory=OrderedDict,
+        init=False,
+        repr=False,
+    )
+    _total_bytes: int = field(default=0, init=False, repr=False)
+    _dirty: bool = field(default=False, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._entries = self._load_index()
+        self._total_bytes = sum(entry.size for entry in self._entries.values())
+
+    @property
+    def index_path(self) -> Path:
+        return self.root / INDEX_FILENAME
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> OCRReading | None:
+        """Return the cached reading for ``key`` or ``None`` on a miss."""
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        try:
+            payload = json.loads(self._entry_path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._total_bytes -= self._entries.pop(key).size
+            self._dirty = True
+            return None
+        self._touch(key, entry)
+        return OCRReading(payload["text"], tuple(payload["confidences"]))
+
+    def put(self, key: str, reading: OCRReading) -> None:
+        """Store ``reading`` under ``key``; existing entries are only touched."""
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._touch(key, entry)
+            return
+
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"text": reading.text, "confidences": list(reading.word_confidences)}
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        path.write_bytes(data)
+        self._entries[key] = _CacheEntry(size=len(data), last_used=time.time())
+        self._total_bytes += len(data)
+        self._dirty = True
+        self._evict()
+
+    def save(self) -> None:
+        """Write the index to disk if anything changed since it was loaded."""
+
+        if not self._dirty:
+            return
+        payload: dict[str, Any] = {
+            "version": _INDEX_VERSION,
+            "entries": {key: asdict(entry) for key, entry in self._entries.items()},
+        }
+        self.root.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(self.index_path, json.dumps(payload))
+        self._dirty = False
+
+    def _touch(self, key: str, entry: _CacheEntry) -> None:
+        entry.last_used = time.time()
+        self._entries.move_to_end(key)
+        self._dirty = True
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def _load_index(self) -> OrderedDict[str, _CacheEntry]:
+        if not self.index_path.exists():
+            return OrderedDict()
+        try:
+            payload = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return OrderedDict()
+        if payload.get("version") != _INDEX_VERSION:
+            self._discard_legacy_entries(payload)
+            return OrderedDict()
+        entries = (
+            (key, _CacheEntry(size=int(value["size"]), last_used=float(value["last_used"])))
+            for key, value in payload.get("entries", {}).items()
+        )
+        # Sort once on load; afterwards order is maintained on every use.
+        return OrderedDict(sorted(entries, key=lambda item: item[1].last_used))
+
+    def _discard_legacy_entries(self, payload: dict[str, Any]) -> None:
+        # Version 1 stored plain text in <key>.txt files.
+        for key in payload.get("entries", {}):
+            (self.root / key[:2] / f"{key}.txt").unlink(missing_ok=True)
+        self._dirty = True
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes and self._entries:
+            key, entry = self._entries.popitem(last=False)
+            self._total_bytes -= entry.size
+            self._entry_path(key).unlink(missing_ok=True)
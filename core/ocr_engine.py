@@ -3,47 +3,372 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Protocol
+from pathlib import Path
+import subprocess
+import tempfile
+import threading
+from typing import Any, Protocol, Sequence
 
 from PIL import Image
 
 
+@dataclass(frozen=True)
+class OCRReading:
+    """OCR text plus per-word confidences on a 0-100 scale."""
+
+    text: str
+    word_confidences: tuple[float, ...] = ()
+
+    @property
+    def confidence(self) -> float:
+        """Confidence of the least certain word; 0 when nothing was read."""
+
+        return min(self.word_confidences, default=0.0)
+
+
 class OCREngine(Protocol):
-    """Protocol for OCR engines used in the pipeline."""
+    """Protocol for OCR engines used in the pipeline.
+
+    Every read returns ``OCRReading``s so the confidence gate and the cache
+    see the engine's word confidences; callers that only want text use
+    ``.text``.
+    """
 
     name: str
 
-    def read_text(self, image: Image.Image) -> str:
-        """Return OCR text for the given image."""
+    def read_batch(self, images: Sequence[Image.Image]) -> list[OCRReading]:
+        """Read whole panels, in input order."""
+
+    def read_fields(
+        self,
+        images: Sequence[Image.Image],
+        *,
+        numeric: bool = False,
+    ) -> list[OCRReading]:
+        """Read single-line field regions, in input order.
+
+        ``numeric`` restricts recognition to ``DIGIT_ALLOWLIST``.
+        """
+
+    def close(self) -> None:
+        """Release the engine's resources; it must not be used afterwards."""
+
+
+DIGIT_ALLOWLIST = "0123456789."
+
+
+def _tesseract_field_config(numeric: bool) -> str:
+    config = "--psm 7"
+    if numeric:
+        config += f" -c tessedit_char_whitelist={DIGIT_ALLOWLIST}"
+    return config
+
+
+def _confidences_from_tsv(tsv: str) -> dict[int, tuple[float, ...]]:
+    """Word confidences per page (numbered from 1) from Tesseract TSV output."""
+
+    pages: dict[int, list[float]] = {}
+    for line in tsv.splitlines()[1:]:
+        columns = line.split("\t")
+        if len(columns) < 12:
+            continue
+        confidences = pages.setdefault(int(columns[1]), [])
+        if columns[0] != "5" or not columns[11].strip():
+            continue
+        confidence = float(columns[10])
+        if confidence >= 0:
+            confidences.append(confidence)
+    return {page: tuple(confidences) for page, confidences in pages.items()}
+
+
+# Marker passed as Tesseract's page_separator so multi-image output can be split.
+_PAGE_MARKER = "\x1e"
+
+
+def _split_pages(output: str, count: int) -> list[str]:
+    pages = output.split(_PAGE_MARKER)
+    # Tesseract 4 appends the separator after every page, 5 only between them.
+    if len(pages) == count + 1 and not pages[-1].strip():
+        pages.pop()
+    if len(pages) != count:
+        raise RuntimeError(f"Tesseract returned {len(pages)} pages for {count} images")
+    return pages
+
+
+def _run_tesseract(
+    images: Sequence[Image.Image],
+    language: str,
+    options: Sequence[str],
+    outputs: Sequence[str],
+) -> dict[str, str]:
+    """Run one ``tesseract`` process over all images via a list file.
+
+    Returns the text of each requested output format (``txt``, ``tsv``),
+    with ``txt`` pages separated by ``_PAGE_MARKER``.
+    """
+
+    import pytesseract
+
+    with tempfile.TemporaryDirectory(prefix="wwm-tess-") as temp_dir:
+        directory = Path(temp_dir)
+        paths = []
+        for position, image in enumerate(images):
+            # Uncompressed PNM keeps the hand-off cheap compared to PNG.
+            path = directory / f"{position:04d}.pnm"
+            image.save(path, format="PPM")
+            paths.append(str(path))
+        list_path = directory / "images.txt"
+        list_path.write_text("\n".join(paths) + "\n", encoding="utf-8")
+        subprocess.run(
+            [
+                pytesseract.pytesseract.tesseract_cmd,
+                str(list_path),
+                str(directory / "out"),
+                "-l",
+                language,
+                *options,
+                "-c",
+                f"page_separator={_PAGE_MARKER}",
+                *outputs,
+            ],
+            capture_output=True,
+            check=True,
+        )
+        return {
+            output: (directory / f"out.{output}").read_text(encoding="utf-8")
+            for output in outputs
+        }
+
+
+def _tesseract_readings(
+    images: Sequence[Image.Image],
+    language: str,
+    options: Sequence[str] = (),
+) -> list[OCRReading]:
+    """OCR images in one process, keeping Tesseract's own text layout.
+
+    The text is Tesseract's plain text output (as from ``image_to_string``,
+    minus the trailing page separator); the TSV output of the same run only
+    supplies word confidences.
+    """
+
+    if not images:
+        return []
+    outputs = _run_tesseract(images, language, options, ("txt", "tsv"))
+    texts = _split_pages(outputs["txt"], len(images))
+    confidences = _confidences_from_tsv(outputs["tsv"])
+    return [
+        OCRReading(text, confidences.get(page, ()))
+        for page, text in enumerate(texts, start=1)
+    ]
+
+
+def _tesseract_field_readings(
+    images: Sequence[Image.Image],
+    language: str,
+    numeric: bool,
+) -> list[OCRReading]:
+    """Read single-line field regions in one ``tesseract`` process."""
+
+    options = _tesseract_field_config(numeric).split()
+    return [
+        OCRReading(reading.text.strip(), reading.word_confidences)
+        for reading in _tesseract_readings(images, language, options)
+    ]
 
 
 @dataclass
-class TesseractEngine:
-    """Wrapper for pytesseract-based OCR."""
+class TesseractSessionEngine:
+    """Tesseract backend that stays initialized for a whole batch.
+
+    With the ``tesserocr`` C API bindings installed, one ``PyTessBaseAPI`` holds
+    the traineddata for the engine's lifetime. Without them, batch reads
+    drive a single ``tesseract`` invocation over a list file instead of one
+    process per image; the text and the word confidences come from the
+    text and TSV output of that same run.
+    """
 
     language: str = "kor+eng"
     name: str = "tesseract"
 
-    def read_text(self, image: Image.Image) -> str:
-        import pytesseract
+    def __post_init__(self) -> None:
+        # Re-entrant: field reads hold it around page segmentation mode changes.
+        self._lock = threading.RLock()
+        try:
+            from tesserocr import PyTessBaseAPI
+        except ImportError:
+            self._api = None
+        else:
+            self._api = PyTessBaseAPI(lang=self.language)
+
+    def read_batch(self, images: Sequence[Image.Image]) -> list[OCRReading]:
+        if self._api is not None:
+            return [self._api_read(image) for image in images]
+        return _tesseract_readings(images, self.language)
+
+    def read_fields(
+        self,
+        images: Sequence[Image.Image],
+        *,
+        numeric: bool = False,
+    ) -> list[OCRReading]:
+        if self._api is None:
+            return _tesseract_field_readings(images, self.language, numeric)
+
+        from tesserocr import PSM
+
+        with self._lock:
+            self._api.SetPageSegMode(PSM.SINGLE_LINE)
+            self._api.SetVariable("tessedit_char_whitelist", DIGIT_ALLOWLIST if numeric else "")
+            try:
+                readings = [self._api_read(image) for image in images]
+            finally:
+                self._api.SetPageSegMode(PSM.AUTO)
+                self._api.SetVariable("tessedit_char_whitelist", "")
+        return [OCRReading(reading.text.strip(), reading.word_confidences) for reading in readings]
+
+    def _api_read(self, image: Image.Image) -> OCRReading:
+        with self._lock:
+            self._api.SetImage(image)
+            text = self._api.GetUTF8Text()
+            confidences = tuple(float(value) for value in self._api.AllWordConfidences())
+        return OCRReading(text, confidences)
 
-        return pytesseract.image_to_string(image, lang=self.language)
+    def close(self) -> None:
+        if self._api is not None:
+            self._api.End()
+            self._api = None
 
 
 @dataclass
 class EasyOCREngine:
-    """Wrapper for EasyOCR."""
+    """Wrapper for EasyOCR.
+
+    With ``use_host`` the engine attaches to a running ``core.ocr_host`` process
+    that already holds the models, and only loads them in-process if no host
+    is reachable.
+    """
 
     language: tuple[str, ...] = ("ko", "en")
     name: str = "easyocr"
+    use_host: bool = True
+    batch_size: int = 16
 
     def __post_init__(self) -> None:
+        if self.use_host:
+            from core.ocr_host import connect_reader
+
+            self._reader = connect_reader(self.language)
+            if self._reader is not None:
+                return
+
         import easyocr
 
         self._reader = easyocr.Reader(list(self.language))
 
-    def read_text(self, image: Image.Image) -> str:
+    @property
+    def is_remote(self) -> bool:
+        """True when recognition runs in the shared OCR host process."""
+
+        from core.ocr_host import RemoteReader
+
+        return isinstance(self._reader, RemoteReader)
+
+    def read_batch(self, images: Sequence[Image.Image]) -> list[OCRReading]:
+        """OCR many crops with batched detection and recognition.
+
+        Crops are grouped by size (every crop from one preset shares its
+        dimensions) so each group runs through ``readtext_batched`` without
+        resizing.
+        """
+
+        return [
+            _reading_from_easyocr(results, "\n")
+            for results in self._read_batch_results(images)
+        ]
+
+    def read_fields(
+        self,
+        images: Sequence[Image.Image],
+        *,
+        numeric: bool = False,
+    ) -> list[OCRReading]:
+        readings = (
+            _reading_from_easyocr(results, " ")
+            for results in self._read_batch_results(
+                images,
+                allowlist=DIGIT_ALLOWLIST if numeric else None,
+            )
+        )
+        return [OCRReading(reading.text.strip(), reading.word_confidences) for reading in readings]
+
+    def close(self) -> None:
+        # Only a host connection needs closing; in-process models are freed
+        # with the engine.
+        if self.is_remote:
+            self._reader.close()
+
+    def _read_batch_results(
+        self,
+        images: Sequence[Image.Image],
+        **options: Any,
+    ) -> list[list[Any]]:
         import numpy as np
 
-        results = self._reader.readtext(np.array(image))
-        return "\n".join(text for _, text, _ in results)
+        groups: dict[tuple[int, int], list[int]] = {}
+        for position, image in enumerate(images):
+            groups.setdefault(image.size, []).append(position)
+
+        batch: list[list[Any]] = [[] for _ in images]
+        for (width, height), positions in groups.items():
+            if len(positions) == 1:
+                batch[positions[0]] = self._reader.readtext(
+                    np.array(images[positions[0]]),
+                    **options,
+                )
+                continue
+            batch_results = self._reader.readtext_batched(
+                [np.array(images[position]) for position in positions],
+                n_width=width,
+                n_height=height,
+                batch_size=self.batch_size,
+                **options,
+            )
+            for position, results in zip(positions, batch_results):
+                batch[position] = results
+        return batch
+
+
+def _reading_from_easyocr(results: list[Any], separator: str) -> OCRReading:
+    # EasyOCR reports confidence as 0-1; scale to match Tesseract's 0-100.
+    return OCRReading(
+        separator.join(text for _, text, _ in results),
+        tuple(float(confidence) * 100 for _, _, confidence in results),
+    )
+
+
+_EASYOCR_LANGUAGE_CODES = {
+    "kor": "ko",
+    "eng": "en",
+    "jpn": "ja",
+    "chi_sim": "ch_sim",
+    "chi_tra": "ch_tra",
+}
+
+
+def easyocr_languages(language: str) -> tuple[str, ...]:
+    """Map a Tesseract language string (``kor+eng``) to EasyOCR codes."""
+
+    return tuple(
+        _EASYOCR_LANGUAGE_CODES.get(code, code) for code in language.split("+") if code
+    )
+
+
+def build_engine(name: str, language: str = "kor+eng") -> OCREngine:
+    """Create an OCR engine by name using a Tesseract-style language string."""
+
+    if name == "tesseract":
+        return TesseractSessionEngine(language=language)
+    if name == "easyocr":
+        return EasyOCREngine(language=easyocr_languages(language))
+    raise ValueError(f"Unknown OCR engine: {name}")
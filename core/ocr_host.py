@@ -0,0 +1,245 @@
+"""Long-lived local process that keeps EasyOCR models loaded between runs.
+
+Start it once with ``python app.py --serve-ocr`` (or ``python -m core.ocr_host``).
+``EasyOCREngine`` instances in the GUI and in batch workers then attach to it
+instead of loading the detection and recognition models themselves.
+
+The host listens on a random localhost port. Its address and a random
+authentication key are written to a state file readable only by the current
+user, so other local users cannot submit work to it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+import os
+from pathlib import Path
+import secrets
+import sys
+import threading
+from typing import Any
+
+from core.fileio import atomic_write_text
+
+
+DEFAULT_STATE_PATH = Path.home() / ".wwm-guild-manager" / "ocr-host.json"
+# How many inference calls one loaded reader runs at once. PyTorch releases the GIL
+# during inference, so a few clients (e.g. pool workers) overlap their work;
+# more would only compete for the same cores and memory.
+DEFAULT_READER_CONCURRENCY = 2
+_READER_METHODS = frozenset({"readtext", "readtext_batched"})
+
+
+@dataclass(frozen=True)
+class HostAddress:
+    """Connection details published by a running OCR host."""
+
+    host: str
+    port: int
+    authkey: bytes
+    pid: int
+
+
+def read_host_address(state_path: Path = DEFAULT_STATE_PATH) -> HostAddress | None:
+    """Return the published host address, or ``None`` if no host is running."""
+
+    try:
+        payload = json.loads(state_path.read_text(encoding="utf-8"))
+        return HostAddress(
+            host=payload["host"],
+            port=int(payload["port"]),
+            authkey=bytes.fromhex(payload["authkey"]),
+            pid=int(payload["pid"]),
+        )
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _write_host_address(address: HostAddress, state_path: Path) -> None:
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "host": address.host,
+        "port": address.port,
+        "authkey": address.authkey.hex(),
+        "pid": address.pid,
+    }
+    # The authkey lets anyone who reads it drive the host; keep it private.
+    atomic_write_text(state_path, json.dumps(payload), mode=0o600)
+
+
+class RemoteReader:
+    """Client-side stand-in for ``easyocr.Reader`` backed by the OCR host."""
+
+    def __init__(self, connection: Connection, language: tuple[str, ...]) -> None:
+        self._connection = connection
+        self._language = language
+        self._lock = threading.Lock()
+
+    def readtext(self, image: Any, **kwargs: Any) -> list[Any]:
+        return self._call("readtext", (image,), kwargs)
+
+    def readtext_batched(self, images: list[Any], **kwargs: Any) -> list[list[Any]]:
+        return self._call("readtext_batched", (images,), kwargs)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _call(self, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        with self._lock:
+            self._connection.send((method, self._language, args, kwargs))
+            status, value = self._connection.recv()
+        if status != "ok":
+            raise RuntimeError(f"OCR host error: {value}")
+        return value
+
+
+def connect_reader(
+    language: tuple[str, ...],
+    state_path: Path = DEFAULT_STATE_PATH,
+) -> RemoteReader | None:
+    """Attach to a running OCR host, returning ``None`` when none is reachable."""
+
+    address = read_host_address(state_path)
+    if address is None:
+        return None
+    try:
+        connection = Client((address.host, address.port), authkey=address.authkey)
+    except (OSError, EOFError, AuthenticationError):
+        # Stale state file or a host that refused our key; load in-process.
+        return None
+    try:
+        connection.send(("ping", language, (), {}))
+        status, _ = connection.recv()
+    except (OSError, EOFError):
+        status = "error"
+    if status != "ok":
+        connection.close()
+        return None
+    return RemoteReader(connection, language)
+
+
+class _ReaderPool:
+    """Loads one ``easyocr.Reader`` per language set and shares it between clients.
+
+    The lock only covers loading. Inference on a reader runs concurrently for
+    up to ``concurrency`` calls; further calls wait for a free slot.
+    """
+
+    def __init__(self, concurrency: int = DEFAULT_READER_CONCURRENCY) -> None:
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+        self._concurrency = concurrency
+        self._readers: dict[tuple[str, ...], tuple[Any, threading.BoundedSemaphore]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, language: tuple[str, ...]) -> Any:
+        return self._slot(language)[0]
+
+    def call(self, method: str, language: tuple[str, ...], args: tuple, kwargs: dict) -> Any:
+        if method not in _READER_METHODS:
+            raise ValueError(f"Unsupported method: {method}")
+        reader, slots = self._slot(language)
+        with slots:
+            return getattr(reader, method)(*args, **kwargs)
+
+    def _slot(self, language: tuple[str, ...]) -> tuple[Any, threading.BoundedSemaphore]:
+        entry = self._readers.get(language)
+        if entry is not None:
+            return entry
+        with self._lock:
+            return self._load_locked(language)
+
+    def _load_locked(self, language: tuple[str, ...]) -> tuple[Any, threading.BoundedSemaphore]:
+        entry = self._readers.get(language)
+        if entry is None:
+            import easyocr
+
+            reader = easyocr.Reader(list(language))
+            entry = (reader, threading.BoundedSemaphore(self._concurrency))
+            self._readers[language] = entry
+        return entry
+
+
+def _serve_connection(connection: Connection, readers: _ReaderPool, stop: threading.Event) -> None:
+    with connection:
+        while not stop.is_set():
+            try:
+                method, language, args, kwargs = connection.recv()
+            except (EOFError, OSError):
+                return
+            if method == "ping":
+                connection.send(("ok", None))
+                continue
+            if method == "shutdown":
+                stop.set()
+                connection.send(("ok", None))
+                return
+            try:
+                connection.send(("ok", readers.call(method, tuple(language), args, kwargs)))
+            except Exception as exc:  # reported to the client, host keeps running
+                connection.send(("error", f"{type(exc).__name__}: {exc}"))
+
+
+def serve(
+    preload: tuple[str, ...] | None = ("ko", "en"),
+    state_path: Path = DEFAULT_STATE_PATH,
+    concurrency: int = DEFAULT_READER_CONCURRENCY,
+) -> None:
+    """Run the OCR host until a client sends ``shutdown`` or the process exits.
+
+    Each connection is served on its own thread; ``concurrency`` bounds how
+    many of them run inference on the same reader at once.
+    """
+
+    readers = _ReaderPool(concurrency)
+    if preload:
+        readers.load(preload)
+
+    authkey = secrets.token_bytes(32)
+    stop = threading.Event()
+    with Listener(("127.0.0.1", 0), authkey=authkey) as listener:
+        host, port = listener.address
+        address = HostAddress(host=host, port=port, authkey=authkey, pid=os.getpid())
+        _write_host_address(address, state_path)
+        print(f"OCR host listening on {host}:{port}", file=sys.stderr)
+        try:
+            while not stop.is_set():
+                try:
+                    connection = listener.accept()
+                except (OSError, EOFError, AuthenticationError):
+                    # Failed handshakes (wrong key) must not take the host down.
+                    continue
+                threading.Thread(
+                    target=_serve_connection,
+                    args=(connection, readers, stop),
+                    daemon=True,
+                ).start()
+        finally:
+            current = read_host_address(state_path)
+            if current is not None and current.pid == address.pid:
+                state_path.unlink(missing_ok=True)
+
+
+def stop_host(state_path: Path = DEFAULT_STATE_PATH) -> bool:
+    """Ask a running OCR host to exit. Returns ``False`` if none was reachable."""
+
+    address = read_host_address(state_path)
+    if address is None:
+        return False
+    try:
+        with Client((address.host, address.port), authkey=address.authkey) as connection:
+            connection.send(("shutdown", (), (), {}))
+            connection.recv()
+        # Wake the accept loop so it notices the stop flag.
+        with Client((address.host, address.port), authkey=address.authkey):
+            pass
+    except (OSError, EOFError, AuthenticationError):
+        return False
+    return True
+
+
+if __name__ == "__main__":
+    serve()
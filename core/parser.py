@@ -3,11 +3,86 @@
 from __future__ import annotations
 
 import re
+from typing import Mapping
 
 from models import GuildMemberRecord
 
 
 _FIELD_PATTERN = re.compile(r"\s+")
+_DIGITS_PATTERN = re.compile(r"\d+")
+_DECIMAL_PATTERN = re.compile(r"\d+(?:\.\d+)?")
+_NUMBER_NOISE_PATTERN = re.compile(r"[\s,]+")
+
+# Label syllables OCR commonly confuses with visually similar ones.
+_LABEL_CONFUSIONS: dict[str, str] = {
+    "닉": "넥닠",
+    "네": "내녜",
+    "임": "입잉",
+    "직": "짇",
+    "책": "잭첵챡",
+    "문": "운믄",
+    "파": "피퍄",
+    "가": "기",
+    "입": "임",
+    "일": "얼",
+    "수": "슈",
+    "번": "빈",
+    "주": "조",
+    "활": "할횔",
+    "약": "얀",
+    "도": "토",
+    "무": "우",
+    "공": "곰",
+    "경": "겅",
+    "지": "시",
+    "탐": "담",
+    "색": "섹",
+    "숙": "슥",
+    "련": "런",
+    "기": "가",
+    "술": "슬",
+    "조": "주",
+    "예": "에",
+}
+
+# A single whitespace-delimited token; the trailing space is required, as a
+# value cut off by the end of the text is likely truncated.
+_TOKEN_VALUE = re.compile(r"\s*(\S+)\s")
+_DIGITS_VALUE = re.compile(r"\s*(\d+)")
+
+# Field name -> (label words, value pattern matched right after the label).
+_FIELD_RULES: dict[str, tuple[tuple[str, ...], re.Pattern[str]]] = {
+    "nickname": (("닉네임",), _TOKEN_VALUE),
+    "role": (("직책",), _TOKEN_VALUE),
+    "faction": (("문파",), _TOKEN_VALUE),
+    "days_since_join": (("가입", "일수"), re.compile(r"\s*(\d+\s*일)")),
+    "weekly_activity": (("이번", "주", "활약도"), _DIGITS_VALUE),
+    "martial_realm": (("무공", "경지"), re.compile(r"\s*([\d.]+\S*)")),
+    "exploration_skill": (("탐색", "숙련도"), _DIGITS_VALUE),
+    "tech_mastery": (("기술", "조예"), _DIGITS_VALUE),
+}
+
+
+def _label_pattern(words: tuple[str, ...]) -> str:
+    # OCR splits labels at arbitrary syllables, so a space may appear anywhere.
+    syllables = "".join(words)
+    return r"\s?".join(
+        f"[{re.escape(char + _LABEL_CONFUSIONS.get(char, ''))}]" for char in syllables
+    )
+
+
+def _compile_labels() -> re.Pattern[str]:
+    branches = "|".join(
+        f"(?P<{name}>{_label_pattern(words)})" for name, (words, _) in _FIELD_RULES.items()
+    )
+    # Leading with the set of first syllables lets the scan skip ahead cheaply
+    # instead of trying every branch at every position.
+    initials = {words[0][0] for words, _ in _FIELD_RULES.values()}
+    initials |= {char for initial in initials for char in _LABEL_CONFUSIONS.get(initial, "")}
+    return re.compile(f"(?=[{re.escape(''.join(sorted(initials)))}])(?:{branches})")
+
+
+_LABEL_PATTERN = _compile_labels()
 
 
 def _normalize(text: str) -> str:
@@ -17,35 +92,71 @@ def _normalize(text: str) -> str:
 def parse_member_text(text: str, index: int) -> GuildMemberRecord:
     """Parse OCR text into a GuildMemberRecord.
 
-    This uses heuristic regex extraction and should be refined with real samples.
+    One scan finds every field label, tolerating common OCR misreads of the
+    label syllables; each value is then matched in place right after its
+    label. The first label occurrence with a valid value wins.
     """
 
-    normalized = _normalize(text)
+    values = _extract_fields(_normalize(text))
+    return GuildMemberRecord(
+        index=index,
+        nickname=values.get("nickname", ""),
+        role=values.get("role", ""),
+        faction=values.get("faction", ""),
+        days_since_join=values.get("days_since_join", ""),
+        weekly_activity=values.get("weekly_activity", ""),
+        martial_realm=values.get("martial_realm", ""),
+        exploration_skill=values.get("exploration_skill", ""),
+        tech_mastery=values.get("tech_mastery", ""),
+    )
+
+
+def _extract_fields(text: str) -> dict[str, str]:
+    values: dict[str, str] = {}
+    settled: set[str | None] = {None}
+    for label in _LABEL_PATTERN.finditer(text):
+        name = label.lastgroup
+        if name in settled:
+            continue
+        pattern = _FIELD_RULES[name][1]
+        match = pattern.match(text, label.end())
+        if match is not None:
+            values[name] = match.group(1).strip()
+            settled.add(name)
+        elif pattern is _TOKEN_VALUE:
+            # No whitespace follows this label, so none follows a later one either.
+            settled.add(name)
+        if len(settled) > len(_FIELD_RULES):
+            break
+    return values
 
-    nickname = _extract(normalized, r"닉네임\s*([\w\W]+?)\s")
-    role = _extract(normalized, r"직책\s*([\w\W]+?)\s")
-    faction = _extract(normalized, r"문파\s*([\w\W]+?)\s")
-    days_since_join = _extract(normalized, r"가입\s*일수\s*(\d+\s*일)")
-    weekly_activity = _extract(normalized, r"이번\s*주\s*활약도\s*(\d+)")
-    martial_realm = _extract(normalized, r"무공\s*경지\s*([\d\.]+\S*)")
-    exploration_skill = _extract(normalized, r"탐색\s*숙련도\s*(\d+)")
-    tech_mastery = _extract(normalized, r"기술\s*조예\s*(\d+)")
+
+def parse_member_fields(fields: Mapping[str, str], index: int) -> GuildMemberRecord:
+    """Build a GuildMemberRecord from per-field OCR of a panel's sub-regions.
+
+    Numeric values are reduced to their digits so stray OCR noise around a
+    field does not leak into the record. A recognized ``index`` field takes
+    precedence over the screenshot number passed as ``index``.
+    """
+
+    panel_index = _number(fields.get("index", ""))
+    days = _number(fields.get("days_since_join", ""))
 
     return GuildMemberRecord(
-        index=index,
-        nickname=nickname,
-        role=role,
-        faction=faction,
-        days_since_join=days_since_join,
-        weekly_activity=weekly_activity,
-        martial_realm=martial_realm,
-        exploration_skill=exploration_skill,
-        tech_mastery=tech_mastery,
+        index=int(panel_index) if panel_index else index,
+        nickname=_normalize(fields.get("nickname", "")),
+        role=_normalize(fields.get("role", "")),
+        faction=_normalize(fields.get("faction", "")),
+        days_since_join=f"{days}일" if days else "",
+        weekly_activity=_number(fields.get("weekly_activity", "")),
+        martial_realm=_number(fields.get("martial_realm", ""), decimal=True),
+        exploration_skill=_number(fields.get("exploration_skill", "")),
+        tech_mastery=_number(fields.get("tech_mastery", "")),
     )
 
 
-def _extract(text: str, pattern: str) -> str:
-    match = re.search(pattern, text)
-    if not match:
-        return ""
-    return match.group(1).strip()
+def _number(text: str, *, decimal: bool = False) -> str:
+    # Single-line digit OCR may split a number with spaces or group separators.
+    compact = _NUMBER_NOISE_PATTERN.sub("", text)
+    match = (_DECIMAL_PATTERN if decimal else _DIGITS_PATTERN).search(compact)
+    return match.group(0) if match else ""
@@ -0,0 +1,751 @@
+"""Batch OCR pipeline that spreads crop, preprocess and OCR over processes."""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+import functools
+import itertools
+import math
+import multiprocessing
+import multiprocessing.util
+import os
+from pathlib import Path
+import queue
+import threading
+from typing import Any, Callable, Iterable, Iterator, Sequence, TypeVar
+
+from PIL import Image
+
+from core.dedup import Duplicate, PanelHash, PanelHashIndex
+from core.image_cropper import CropPreset, crop_fields, crop_image, hash_panel
+from core.ocr_cache import DEFAULT_MAX_BYTES, OCRCache, cache_key
+from core.ocr_engine import OCREngine, OCRReading, build_engine
+from core.preprocess import PreprocessSettings
+from core.variant_search import VariantSearch
+from models import ScreenshotOCRResult
+
+
+@dataclass(frozen=True)
+class PipelineOptions:
+    """Settings for a batch OCR run.
+
+    ``jobs`` is the number of worker processes; ``0`` uses every CPU core and
+    ``1`` runs the whole batch in the calling process. When ``cache_dir`` is
+    set (normally ``ProjectPaths.ocr_raw_dir``), OCR text is cached there and
+    cache hits skip both preprocessing and the engine call. ``queue_size``
+    bounds how many decoded chunks may wait between stages, and
+    ``batch_size`` crops are sent to each engine's ``read_batch`` at once.
+
+    With ``confidence_gate`` set, engines after the first only run on panels
+    (or fields) whose first reading is less confident than the gate. With
+    ``variant_search``, ``preprocess`` is replaced by a lazy search over
+    ``PREPROCESS_VARIANTS`` that stops at the first variant that passes the
+    gate or on which the engines agree.
+
+    ``ocr_scale`` below 1 shrinks each panel before OCR; for JPEG screenshots
+    it also lets the decoder skip most of the full-resolution work.
+    """
+
+    jobs: int = 1
+    engines: tuple[str, ...] = ("easyocr", "tesseract")
+    language: str = "kor+eng"
+    preprocess: PreprocessSettings = field(default_factory=PreprocessSettings)
+    cache_dir: Path | None = None
+    cache_max_bytes: int = DEFAULT_MAX_BYTES
+    queue_size: int = 4
+    batch_size: int = 8
+    confidence_gate: float | None = None
+    variant_search: bool = False
+    ocr_scale: float = 1.0
+
+
+@dataclass
+class CascadeStats:
+    """Counts how often engines after the first had to run."""
+
+    primary_reads: int = 0
+    secondary_reads: int = 0
+
+    @property
+    def secondary_rate(self) -> float:
+        """Fraction of primary reads that escalated to a later engine."""
+
+        if not self.primary_reads:
+            return 0.0
+        return self.secondary_reads / self.primary_reads
+
+    def record(self, result: ScreenshotOCRResult, primary: str) -> None:
+        if result.fields:
+            reads = {name: len(values) for name, values in result.fields.items()}
+        else:
+            reads = {name: 1 for name in result.texts}
+        self.primary_reads += reads.pop(primary, 0)
+        # Counted once per panel or field, however many later engines ran.
+        self.secondary_reads += max(reads.values(), default=0)
+
+    def summary(self) -> str:
+        return (
+            f"Secondary OCR ran for {self.secondary_reads} of {self.primary_reads} "
+            f"reads ({self.secondary_rate:.0%})"
+        )
+
+
+@dataclass(frozen=True)
+class _Job:
+    index: int
+    image_path: Path
+    output_path: Path | None
+
+
+@dataclass
+class _WorkerState:
+    preset: CropPreset
+    options: PipelineOptions
+    cache: OCRCache | None = None
+    engines: dict[str, OCREngine] = field(default_factory=dict)
+    variants: VariantSearch | None = None
+    # Only read here; the consuming process records panels in its own index.
+    hashes: PanelHashIndex | None = None
+
+    def engine(self, name: str) -> OCREngine:
+        # Engines are built on first use so fully cached batches never load models.
+        if name not in self.engines:
+            self.engines[name] = build_engine(name, self.options.language)
+        return self.engines[name]
+
+    def close(self) -> None:
+        for engine in self.engines.values():
+            engine.close()
+        self.engines.clear()
+
+
+@dataclass
+class _Output:
+    """One processed screenshot; ``result`` is None when OCR was skipped as a duplicate."""
+
+    job: _Job
+    result: ScreenshotOCRResult | None
+    entries: dict[str, OCRReading]
+    cropped: Image.Image | None
+    panel: PanelHash | None = None
+    duplicate: Duplicate | None = None
+
+
+# Called as ``progress(stage, done, total)``. Stage "crop" counts decoded and
+# cropped screenshots and is reported from the decoder thread; "ocr" counts
+# finished screenshots and is reported from the consuming thread.
+ProgressCallback = Callable[[str, int, int], None]
+
+_T = TypeVar("_T")
+
+_WORKER_STATE: _WorkerState | None = None
+
+
+def resolve_jobs(jobs: int, job_count: int) -> int:
+    """Return the number of workers to start for ``job_count`` screenshots."""
+
+    if jobs < 0:
+        raise ValueError(f"jobs must be >= 0, got {jobs}")
+    workers = jobs or os.cpu_count() or 1
+    return max(1, min(workers, job_count))
+
+
+def _open_cache(options: PipelineOptions) -> OCRCache | None:
+    if options.cache_dir is None:
+        return None
+    return OCRCache(options.cache_dir, max_bytes=options.cache_max_bytes)
+
+
+def _create_state(
+    preset: CropPreset,
+    options: PipelineOptions,
+    cache: OCRCache | None,
+    hashes: PanelHashIndex | None = None,
+) -> _WorkerState:
+    variants = None
+    if options.variant_search:
+        variants = VariantSearch(confidence_threshold=options.confidence_gate)
+    return _WorkerState(
+        preset=preset,
+        options=options,
+        cache=cache,
+        variants=variants,
+        hashes=hashes,
+    )
+
+
+def _init_worker(
+    preset: CropPreset,
+    options: PipelineOptions,
+    threads: int,
+    hashes: PanelHashIndex | None,
+) -> None:
+    global _WORKER_STATE
+
+    # Keep torch/OpenMP from spawning a full set of threads in every worker.
+    os.environ.setdefault("OMP_NUM_THREADS", str(threads))
+    # Workers only read the cache and their copy of the hash index; the
+    # parent process records new entries in both.
+    _WORKER_STATE = _create_state(preset, options, _open_cache(options), hashes)
+    # Pool workers exit through multiprocessing's own shutdown, which runs
+    # its finalizers but not atexit handlers.
+    multiprocessing.util.Finalize(_WORKER_STATE, _WORKER_STATE.close, exitpriority=0)
+
+
+def _should_escalate(options: PipelineOptions, confidence: float) -> bool:
+    gate = options.confidence_gate
+    return gate is None or confidence < gate
+
+
+def _process_chunk(
+    state: _WorkerState,
+    jobs: Sequence[_Job],
+    crops: Sequence[Image.Image],
+) -> list[_Output]:
+    """Hash a chunk of cropped panels, then OCR those that are not known duplicates.
+
+    Duplicates are looked up in ``state.hashes`` without recording anything,
+    so a repeat within the same chunk is still OCR'd here and only dropped by
+    the consumer's ``PanelHashIndex.check``.
+    """
+
+    panels: list[PanelHash | None] = [None] * len(jobs)
+    duplicates: list[Duplicate | None] = [None] * len(jobs)
+    if state.hashes is not None:
+        for position, (job, cropped) in enumerate(zip(jobs, crops)):
+            panels[position] = hash_panel(cropped, state.preset)
+            duplicates[position] = state.hashes.find(job.image_path, panels[position])
+    fresh = [position for position in range(len(jobs)) if duplicates[position] is None]
+    readings = _ocr_crops(
+        state,
+        [jobs[position] for position in fresh],
+        [crops[position] for position in fresh],
+    )
+    ocr = dict(zip(fresh, readings))
+    outputs = []
+    for position, (job, cropped) in enumerate(zip(jobs, crops)):
+        result, entries = ocr.get(position, (None, {}))
+        outputs.append(
+            _Output(job, result, entries, cropped, panels[position], duplicates[position]),
+        )
+    return outputs
+
+
+def _ocr_crops(
+    state: _WorkerState,
+    jobs: Sequence[_Job],
+    crops: Sequence[Image.Image],
+) -> list[tuple[ScreenshotOCRResult, dict[str, OCRReading]]]:
+    """OCR a chunk of cropped panels, batching each engine's calls.
+
+    The first engine reads every panel; later engines only read panels whose
+    primary reading falls below ``options.confidence_gate``. Returns one
+    ``(result, cache entries)`` pair per job in input order.
+    """
+
+    if not jobs:
+        return []
+    if state.variants is not None:
+        return [_ocr_variant_crop(state, job, cropped) for job, cropped in zip(jobs, crops)]
+    if state.preset.fields:
+        return _ocr_field_crops(state, jobs, crops)
+
+    options = state.options
+    readings: list[dict[str, OCRReading]] = [{} for _ in jobs]
+    entries: list[dict[str, OCRReading]] = [{} for _ in jobs]
+    processed: dict[int, Image.Image] = {}
+    primary = options.engines[0]
+    for name in options.engines:
+        if name == primary:
+            positions = list(range(len(jobs)))
+        else:
+            positions = [
+                position
+                for position in range(len(jobs))
+                if _should_escalate(options, readings[position][primary].confidence)
+            ]
+
+        missing = []
+        for position in positions:
+            key = None
+            if state.cache is not None:
+                key = cache_key(crops[position], name, options.language, options.preprocess)
+                cached = state.cache.get(key)
+                if cached is not None:
+                    readings[position][name] = entries[position][key] = cached
+                    continue
+            missing.append((position, key))
+        if not missing:
+            continue
+
+        for position, _ in missing:
+            if position not in processed:
+                processed[position] = options.preprocess.apply(crops[position])
+        batch = state.engine(name).read_batch(
+            [processed[position] for position, _ in missing],
+        )
+        for (position, key), reading in zip(missing, batch):
+            readings[position][name] = reading
+            if key is not None:
+                entries[position][key] = reading
+
+    outputs = []
+    for job, job_readings, job_entries in zip(jobs, readings, entries):
+        result = ScreenshotOCRResult(
+            index=job.index,
+            source_path=job.image_path,
+            cropped_path=job.output_path,
+            texts={name: reading.text for name, reading in job_readings.items()},
+            confidences={name: reading.confidence for name, reading in job_readings.items()},
+        )
+        outputs.append((result, job_entries))
+    return outputs
+
+
+def _ocr_field_crops(
+    state: _WorkerState,
+    jobs: Sequence[_Job],
+    crops: Sequence[Image.Image],
+) -> list[tuple[ScreenshotOCRResult, dict[str, OCRReading]]]:
+    """OCR the field regions of a chunk of panels, each as a single line.
+
+    Uncached fields go to each engine in one ``read_fields`` call per mode
+    (text or digits). Later engines only read fields whose primary reading
+    falls below ``options.confidence_gate``.
+    """
+
+    options = state.options
+    regions = state.preset.fields
+    primary = options.engines[0]
+    field_images = [crop_fields(cropped, state.preset) for cropped in crops]
+    readings: list[dict[str, dict[str, OCRReading]]] = [{} for _ in jobs]
+    entries: list[dict[str, OCRReading]] = [{} for _ in jobs]
+    processed: dict[tuple[int, str], Image.Image] = {}
+    for name in options.engines:
+        missing: dict[bool, list[tuple[int, str, str | None]]] = {False: [], True: []}
+        for position in range(len(jobs)):
+            for region in regions:
+                if name != primary and not _should_escalate(
+                    options,
+                    readings[position][primary][region.name].confidence,
+                ):
+                    continue
+                key = None
+                if state.cache is not None:
+                    mode = "digits" if region.numeric else "line"
+                    key = cache_key(
+                        field_images[position][region.name],
+                        name,
+                        options.language,
+                        options.preprocess,
+                        mode,
+                    )
+                    cached = state.cache.get(key)
+                    if cached is not None:
+                        readings[position].setdefault(name, {})[region.name] = cached
+                        entries[position][key] = cached
+                        continue
+                missing[region.numeric].append((position, region.name, key))
+
+        for numeric, targets in missing.items():
+            if not targets:
+                continue
+            for position, region_name, _ in targets:
+                if (position, region_name) not in processed:
+                    processed[position, region_name] = options.preprocess.apply(
+                        field_images[position][region_name],
+                    )
+            batch = state.engine(name).read_fields(
+                [processed[position, region_name] for position, region_name, _ in targets],
+                numeric=numeric,
+            )
+            for (position, region_name, key), reading in zip(targets, batch):
+                readings[position].setdefault(name, {})[region_name] = reading
+                if key is not None:
+                    entries[position][key] = reading
+
+    outputs = []
+    for job, job_readings, job_entries in zip(jobs, readings, entries):
+        result = ScreenshotOCRResult(
+            index=job.index,
+            source_path=job.image_path,
+            cropped_path=job.output_path,
+        )
+        for name in options.engines:
+            engine_readings = job_readings.get(name, {})
+            for region in regions:
+                reading = engine_readings.get(region.name)
+                if reading is not None:
+                    result.fields.setdefault(name, {})[region.name] = reading.text
+                    result.field_confidences.setdefault(name, {})[region.name] = (
+                        reading.confidence
+                    )
+        outputs.append((result, job_entries))
+    return outputs
+
+
+@dataclass
+class _VariantTarget:
+    """One image (a panel or a field region) searched across variants."""
+
+    image: Image.Image
+    mode: str
+    numeric: bool = False
+    processed: dict[PreprocessSettings, Image.Image] = field(default_factory=dict)
+
+    def read(
+        self,
+        state: _WorkerState,
+        entries: dict[str, OCRReading],
+        name: str,
+        settings: PreprocessSettings,
+    ) -> OCRReading:
+        options = state.options
+        key = None
+        if state.cache is not None:
+            key = cache_key(self.image, name, options.language, settings, self.mode)
+            cached = state.cache.get(key)
+            if cached is not None:
+                entries[key] = cached
+                return cached
+
+        # Each variant is only computed once something actually needs it.
+        if settings not in self.processed:
+            self.processed[settings] = settings.apply(self.image)
+        engine = state.engine(name)
+        if self.mode == "panel":
+            reading = engine.read_batch([self.processed[settings]])[0]
+        else:
+            reading = engine.read_fields([self.processed[settings]], numeric=self.numeric)[0]
+        if key is not None:
+            entries[key] = reading
+        return reading
+
+
+def _ocr_variant_crop(
+    state: _WorkerState,
+    job: _Job,
+    cropped: Image.Image,
+) -> tuple[ScreenshotOCRResult, dict[str, OCRReading]]:
+    """OCR one panel (or its fields) through the lazy variant search."""
+
+    assert state.variants is not None
+    options = state.options
+    preset = state.preset
+    entries: dict[str, OCRReading] = {}
+    result = ScreenshotOCRResult(
+        index=job.index,
+        source_path=job.image_path,
+        cropped_path=job.output_path,
+    )
+
+    if not preset.fields:
+        target = _VariantTarget(cropped, "panel")
+        outcome = state.variants.run(
+            preset.name,
+            options.engines,
+            functools.partial(target.read, state, entries),
+        )
+        result.texts = {name: reading.text for name, reading in outcome.readings.items()}
+        result.confidences = {
+            name: reading.confidence for name, reading in outcome.readings.items()
+        }
+        return result, entries
+
+    field_images = crop_fields(cropped, preset)
+    for region in preset.fields:
+        target = _VariantTarget(
+            field_images[region.name],
+            "digits" if region.numeric else "line",
+            numeric=region.numeric,
+        )
+        outcome = state.variants.run(
+            f"{preset.name}:{region.name}",
+            options.engines,
+            functools.partial(target.read, state, entries),
+        )
+        for name, reading in outcome.readings.items():
+            result.fields.setdefault(name, {})[region.name] = reading.text
+            result.field_confidences.setdefault(name, {})[region.name] = reading.confidence
+    return result, entries
+
+
+def _run_pooled_chunk(jobs: list[_Job]) -> list[_Output]:
+    if _WORKER_STATE is None:
+        raise RuntimeError("OCR worker was not initialized")
+    crops = [
+        crop_image(job.image_path, _WORKER_STATE.preset, scale=_WORKER_STATE.options.ocr_scale)
+        for job in jobs
+    ]
+    outputs = _process_chunk(_WORKER_STATE, jobs, crops)
+    # Crops travel back as raw pixels; PNG encoding happens in the parent's
+    # writer thread instead of on the worker's critical path.
+    for output in outputs:
+        if output.job.output_path is None or output.result is None:
+            output.cropped = None
+    return outputs
+
+
+def _chunks(items: Iterable[_T], size: int) -> Iterator[list[_T]]:
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+class _CropWriter:
+    """Saves cropped panels to disk on a background thread."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._queue: queue.Queue[tuple[Image.Image, Path] | None] = queue.Queue(maxsize)
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, name="crop-writer")
+        self._thread.start()
+
+    def submit(self, image: Image.Image, path: Path) -> None:
+        self._queue.put((image, path))
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            if self._error is not None:
+                continue
+            image, path = item
+            try:
+                image.save(path)
+            except BaseException as exc:  # re-raised from close()
+                self._error = exc
+
+
+def _prefetch(items: Iterator[_T], maxsize: int) -> Iterator[_T]:
+    """Run ``items`` on a producer thread, buffering at most ``maxsize`` values."""
+
+    buffer: queue.Queue[tuple[bool, Any]] = queue.Queue(maxsize)
+    stop = threading.Event()
+
+    def put(entry: tuple[bool, Any]) -> bool:
+        # Gives up once the consumer has stopped, so a full buffer never
+        # leaves this thread blocked.
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put((True, item)):
+                    return
+        except BaseException as exc:
+            put((False, exc))
+            return
+        put((False, None))
+
+    thread = threading.Thread(target=produce, name="crop-decoder", daemon=True)
+    thread.start()
+    try:
+        while True:
+            ok, value = buffer.get()
+            if not ok:
+                if value is not None:
+                    raise value
+                return
+            yield value
+    finally:
+        stop.set()
+
+
+def _number_jobs(
+    images: Iterable[Path],
+    output_dir: Path | None,
+    indexes: Iterable[int] | None = None,
+) -> list[_Job]:
+    if output_dir is not None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+    if indexes is None:
+        numbered: Iterable[tuple[int, Path]] = enumerate(images, start=1)
+    else:
+        numbered = zip(indexes, images, strict=True)
+    return [
+        _Job(
+            index=index,
+            image_path=image_path,
+            output_path=output_dir / f"cropped_{index:03d}.png" if output_dir else None,
+        )
+        for index, image_path in numbered
+    ]
+
+
+def iter_batch(
+    images: Iterable[Path],
+    preset: CropPreset,
+    output_dir: Path | None = None,
+    options: PipelineOptions = PipelineOptions(),
+    stats: CascadeStats | None = None,
+    hashes: PanelHashIndex | None = None,
+    indexes: Sequence[int] | None = None,
+    progress: ProgressCallback | None = None,
+) -> Iterator[ScreenshotOCRResult]:
+    """Stream OCR results for screenshots in index order as they finish.
+
+    Each screenshot is decoded once and its crop is handed to preprocessing
+    and OCR in memory. At most ``options.queue_size`` chunks per worker are
+    decoded ahead of the consumer. When ``output_dir`` is given, crops are
+    written as ``cropped_NNN.png`` on a background thread; every file exists
+    once the iterator is exhausted. Pass ``stats`` to count how often the
+    confidence gate escalated to the later engines.
+
+    With ``hashes``, each panel is hashed from the same decoded crop and
+    screenshots that duplicate an indexed panel are skipped; they are listed
+    in ``hashes.duplicates`` and yield no result. Panels indexed before the
+    batch (or, in a single process, earlier in it) are skipped before OCR;
+    other repeats are OCR'd and then dropped. The index is saved at the end.
+
+    Screenshots are numbered from 1 unless ``indexes`` gives their numbers,
+    as when only part of a project is rebuilt.
+
+    ``progress`` is called with stage "ocr" after each screenshot,
+    duplicates included. In a single process, decoding runs ahead of OCR
+    and is also reported as stage "crop"; worker processes crop and OCR a
+    chunk in one call, so pooled batches report "ocr" only. An exception
+    the callback raises stops the batch; pending work is cancelled.
+    """
+
+    jobs = _number_jobs(images, output_dir, indexes)
+    if not jobs:
+        return
+
+    cache = _open_cache(options)
+    writer = _CropWriter(options.queue_size) if output_dir is not None else None
+    workers = resolve_jobs(options.jobs, len(jobs))
+    # Shrink chunks rather than leave workers idle on small batches.
+    chunk_size = max(1, min(options.batch_size, math.ceil(len(jobs) / workers)))
+    if workers == 1:
+        outputs = _iter_serial(jobs, preset, options, cache, chunk_size, hashes, progress)
+    else:
+        outputs = _iter_pooled(jobs, preset, options, workers, chunk_size, hashes)
+    try:
+        for done, output in enumerate(outputs, start=1):
+            result = output.result
+            if hashes is not None:
+                if output.duplicate is not None:
+                    hashes.add_duplicate(output.duplicate)
+                elif output.panel is not None and hashes.check(
+                    output.job.image_path,
+                    output.panel,
+                ) is not None:
+                    result = None
+            if result is not None:
+                if writer is not None and output.cropped is not None and result.cropped_path:
+                    writer.submit(output.cropped, result.cropped_path)
+                if cache is not None:
+                    for key, reading in output.entries.items():
+                        cache.put(key, reading)
+                if stats is not None:
+                    stats.record(result, options.engines[0])
+            if progress is not None:
+                progress("ocr", done, len(jobs))
+            if result is not None:
+                yield result
+    finally:
+        # Cancels chunks not yet started when the batch stops early.
+        outputs.close()
+        if writer is not None:
+            writer.close()
+        if cache is not None:
+            cache.save()
+        if hashes is not None:
+            hashes.save()
+
+
+def _iter_serial(
+    jobs: list[_Job],
+    preset: CropPreset,
+    options: PipelineOptions,
+    cache: OCRCache | None,
+    chunk_size: int,
+    hashes: PanelHashIndex | None,
+    progress: ProgressCallback | None = None,
+) -> Iterator[_Output]:
+    # Shares the consumer's index, which has checked every earlier chunk by
+    # the time the next one is processed.
+    state = _create_state(preset, options, cache, hashes)
+
+    def decode() -> Iterator[tuple[_Job, Image.Image]]:
+        for done, job in enumerate(jobs, start=1):
+            cropped = crop_image(job.image_path, preset, scale=options.ocr_scale)
+            if progress is not None:
+                progress("crop", done, len(jobs))
+            yield job, cropped
+
+    decoded = _prefetch(decode(), options.queue_size * chunk_size)
+    try:
+        for chunk in _chunks(decoded, chunk_size):
+            chunk_jobs = [job for job, _ in chunk]
+            crops = [cropped for _, cropped in chunk]
+            yield from _process_chunk(state, chunk_jobs, crops)
+    finally:
+        decoded.close()
+        state.close()
+
+
+def _iter_pooled(
+    jobs: list[_Job],
+    preset: CropPreset,
+    options: PipelineOptions,
+    workers: int,
+    chunk_size: int,
+    hashes: PanelHashIndex | None,
+) -> Iterator[_Output]:
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    # Each worker gets a snapshot of the index as it was before the batch.
+    # Workers are spawned, not forked: callers such as the GUI's thread pool
+    # run other threads, and a forked child can inherit one of their locks held.
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(preset, options, threads, hashes),
+    )
+    pending: deque[Future] = deque()
+    remaining = _chunks(jobs, chunk_size)
+    window = workers * options.queue_size
+    try:
+        for chunk in itertools.islice(remaining, window):
+            pending.append(executor.submit(_run_pooled_chunk, chunk))
+        while pending:
+            outputs = pending.popleft().result()
+            for chunk in itertools.islice(remaining, 1):
+                pending.append(executor.submit(_run_pooled_chunk, chunk))
+            yield from outputs
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def run_batch(
+    images: Iterable[Path],
+    preset: CropPreset,
+    output_dir: Path | None = None,
+    options: PipelineOptions = PipelineOptions(),
+    stats: CascadeStats | None = None,
+    hashes: PanelHashIndex | None = None,
+) -> list[ScreenshotOCRResult]:
+    """Crop, preprocess and OCR screenshots, returning results in index order.
+
+    Screenshots are numbered from 1 in iteration order. When ``output_dir`` is
+    given, each crop is also saved as ``cropped_NNN.png`` for later review.
+    """
+
+    return list(iter_batch(images, preset, output_dir, options, stats, hashes))
@@ -2,33 +2,309 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from dataclasses import dataclass
+import functools
+import threading
+from typing import Any, Iterable
 
 from PIL import Image, ImageEnhance, ImageFilter, ImageOps
 
 
+PREPROCESS_BACKENDS = ("pil", "numpy")
+ADAPTIVE_THRESHOLDS = ("otsu", "local")
+# Window and offset for local (mean-C) adaptive thresholding.
+_LOCAL_BLOCK_SIZE = 31
+_LOCAL_OFFSET = 10
+
+
+@dataclass(frozen=True)
+class PreprocessSettings:
+    """Preprocessing parameters applied to every crop in a batch.
+
+    ``backend`` picks the implementation only; both produce identical pixels.
+    """
+
+    sharpen: bool = True
+    contrast: float = 1.3
+    threshold: int | None = None
+    invert: bool = False
+    adaptive_threshold: str | None = None
+    backend: str = "pil"
+
+    def apply(self, image: Image.Image) -> Image.Image:
+        return preprocess_image(
+            image,
+            sharpen=self.sharpen,
+            contrast=self.contrast,
+            threshold=self.threshold,
+            invert=self.invert,
+            adaptive_threshold=self.adaptive_threshold,
+            backend=self.backend,
+        )
+
+
 def preprocess_image(
     image: Image.Image,
     *,
     sharpen: bool = True,
     contrast: float = 1.3,
     threshold: int | None = None,
+    invert: bool = False,
+    adaptive_threshold: str | None = None,
+    backend: str = "pil",
 ) -> Image.Image:
-    """Apply common preprocessing steps to improve OCR accuracy."""
+    """Apply common preprocessing steps to improve OCR accuracy.
+
+    ``adaptive_threshold`` (``"otsu"`` or ``"local"``) replaces the fixed
+    ``threshold``. The ``"numpy"`` backend runs every step as array operations
+    on per-thread buffers that are reused across same-sized crops.
+    """
+
+    if backend not in PREPROCESS_BACKENDS:
+        raise ValueError(f"Unknown preprocessing backend: {backend}")
+    if adaptive_threshold is not None and adaptive_threshold not in ADAPTIVE_THRESHOLDS:
+        raise ValueError(f"Unknown adaptive threshold: {adaptive_threshold}")
+    if backend == "numpy":
+        return _preprocess_array(
+            image,
+            sharpen=sharpen,
+            contrast=contrast,
+            threshold=threshold,
+            invert=invert,
+            adaptive_threshold=adaptive_threshold,
+        )
 
     processed = image.convert("L")
     if contrast != 1.0:
         processed = ImageEnhance.Contrast(processed).enhance(contrast)
     if sharpen:
         processed = processed.filter(ImageFilter.SHARPEN)
-    if threshold is not None:
+    if adaptive_threshold is not None:
+        import numpy as np
+
+        pixels = np.array(processed)
+        _adaptive_threshold_into(pixels, adaptive_threshold, _ArrayBuffers(pixels.shape))
+        processed = Image.fromarray(pixels)
+    elif threshold is not None:
         processed = processed.point(lambda x: 255 if x > threshold else 0)
+    if invert:
+        processed = ImageOps.invert(processed)
     return processed
 
 
+class _ArrayBuffers:
+    """Scratch arrays for one crop size, reused by the numpy backend."""
+
+    def __init__(self, shape: tuple[int, int]) -> None:
+        import numpy as np
+
+        height, width = shape
+        self.shape = shape
+        self.gray = np.empty(shape, dtype=np.uint8)
+        self.filtered = np.empty(shape, dtype=np.uint8)
+        self.wide = np.empty(shape, dtype=np.int16)
+        self.rows = np.empty((height, max(width - 2, 0)), dtype=np.int16)
+        self.box = np.empty((max(height - 2, 0), max(width - 2, 0)), dtype=np.int16)
+        self.mask = np.empty(shape, dtype=bool)
+        self._integral: Any = None
+
+    def integral(self) -> Any:
+        import numpy as np
+
+        if self._integral is None:
+            height, width = self.shape
+            self._integral = np.zeros((height + 1, width + 1), dtype=np.int64)
+        return self._integral
+
+
+_THREAD_BUFFERS = threading.local()
+
+
+def _buffers_for(shape: tuple[int, int]) -> _ArrayBuffers:
+    buffers = getattr(_THREAD_BUFFERS, "buffers", None)
+    if buffers is None or buffers.shape != shape:
+        buffers = _ArrayBuffers(shape)
+        _THREAD_BUFFERS.buffers = buffers
+    return buffers
+
+
+@functools.lru_cache(maxsize=1)
+def load_cv2() -> Any:
+    """The optional OpenCV module, or ``None`` when it is not installed."""
+
+    try:
+        import cv2
+    except ImportError:
+        return None
+    return cv2
+
+
+def _preprocess_array(
+    image: Image.Image,
+    *,
+    sharpen: bool,
+    contrast: float,
+    threshold: int | None,
+    invert: bool,
+    adaptive_threshold: str | None,
+) -> Image.Image:
+    """Array implementation of ``preprocess_image``.
+
+    Point operations (contrast, fixed threshold, invert) are folded into
+    256-entry lookup tables, so consecutive ones cost a single pass. Sharpen
+    uses OpenCV's ``filter2D`` when installed and integer numpy otherwise.
+    """
+
+    import numpy as np
+
+    width, height = image.size
+    buffers = _buffers_for((height, width))
+    gray = buffers.gray
+    np.copyto(gray, np.asarray(image if image.mode == "L" else image.convert("L")))
+
+    lut = None
+    if contrast != 1.0:
+        mean = int(gray.sum(dtype=np.int64) / gray.size + 0.5)
+        lut = _contrast_lut(mean, contrast)
+
+    if sharpen and height > 2 and width > 2:
+        _apply_lut(gray, lut)
+        lut = None
+        _sharpen_into(buffers)
+
+    if adaptive_threshold is not None:
+        _apply_lut(gray, lut)
+        lut = None
+        _adaptive_threshold_into(gray, adaptive_threshold, buffers)
+    elif threshold is not None:
+        lut = _compose_lut(lut, np.where(np.arange(256) > threshold, 255, 0).astype(np.uint8))
+    if invert:
+        lut = _compose_lut(lut, np.arange(255, -1, -1, dtype=np.uint8))
+    _apply_lut(gray, lut)
+
+    # The buffer is reused by the next crop, so the result gets its own copy.
+    return Image.fromarray(gray.copy())
+
+
+@functools.lru_cache(maxsize=64)
+def _contrast_lut(mean: int, factor: float) -> Any:
+    """Pillow's contrast blend (float32, truncated) for every gray level."""
+
+    import numpy as np
+
+    levels = np.arange(256, dtype=np.float32)
+    blended = np.float32(mean) + np.float32(factor) * (levels - np.float32(mean))
+    lut = np.clip(blended, 0, 255).astype(np.uint8)
+    lut.flags.writeable = False
+    return lut
+
+
+def _compose_lut(first: Any, second: Any) -> Any:
+    return second if first is None else second[first]
+
+
+def _apply_lut(gray: Any, lut: Any) -> None:
+    if lut is None:
+        return
+    cv2 = load_cv2()
+    if cv2 is not None:
+        cv2.LUT(gray, lut, dst=gray)
+    else:
+        import numpy as np
+
+        np.take(lut, gray, out=gray)
+
+
+def _sharpen_into(buffers: _ArrayBuffers) -> None:
+    """Pillow's SHARPEN: (34*center - 2*box3x3) / 16, rounded half up, edges kept."""
+
+    import numpy as np
+
+    gray = buffers.gray
+    cv2 = load_cv2()
+    if cv2 is not None:
+        # All intermediate sums are exact multiples of 1/16; the 1/32 delta
+        # turns OpenCV's round-half-even into Pillow's round-half-up.
+        cv2.filter2D(gray, -1, _sharpen_kernel(), dst=buffers.filtered, delta=1 / 32)
+        np.copyto(gray[1:-1, 1:-1], buffers.filtered[1:-1, 1:-1])
+        return
+
+    wide = buffers.wide
+    rows = buffers.rows
+    box = buffers.box
+    np.copyto(wide, gray)
+    np.add(wide[:, :-2], wide[:, 1:-1], out=rows)
+    rows += wide[:, 2:]
+    np.add(rows[:-2], rows[1:-1], out=box)
+    box += rows[2:]
+    box *= -2
+    np.multiply(wide[1:-1, 1:-1], 34, out=rows[1:-1])
+    box += rows[1:-1]
+    box += 8
+    np.right_shift(box, 4, out=box)
+    np.clip(box, 0, 255, out=box)
+    np.copyto(gray[1:-1, 1:-1], box, casting="unsafe")
+
+
+@functools.lru_cache(maxsize=1)
+def _sharpen_kernel() -> Any:
+    import numpy as np
+
+    kernel = np.full((3, 3), -2, dtype=np.float32)
+    kernel[1, 1] = 32
+    return kernel / 16
+
+
+def _adaptive_threshold_into(gray: Any, method: str, buffers: _ArrayBuffers) -> None:
+    import numpy as np
+
+    if method == "otsu":
+        histogram = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+        levels = np.arange(256, dtype=np.float64)
+        weight_low = np.cumsum(histogram)
+        weight_high = weight_low[-1] - weight_low
+        sum_low = np.cumsum(histogram * levels)
+        mean_low = np.divide(sum_low, weight_low, out=np.zeros(256), where=weight_low > 0)
+        mean_high = np.divide(
+            sum_low[-1] - sum_low,
+            weight_high,
+            out=np.zeros(256),
+            where=weight_high > 0,
+        )
+        between = weight_low * weight_high * (mean_low - mean_high) ** 2
+        cutoff = int(np.argmax(between))
+        np.greater(gray, cutoff, out=buffers.mask)
+    else:
+        # Mean of the surrounding window (clipped at the borders) minus an offset.
+        height, width = gray.shape
+        integral = buffers.integral()
+        np.cumsum(gray, axis=0, out=integral[1:, 1:])
+        np.cumsum(integral[1:, 1:], axis=1, out=integral[1:, 1:])
+        radius = _LOCAL_BLOCK_SIZE // 2
+        top = np.clip(np.arange(height) - radius, 0, height)
+        bottom = np.clip(np.arange(height) + radius + 1, 0, height)
+        left = np.clip(np.arange(width) - radius, 0, width)
+        right = np.clip(np.arange(width) + radius + 1, 0, width)
+        window = (
+            integral[np.ix_(bottom, right)]
+            - integral[np.ix_(top, right)]
+            - integral[np.ix_(bottom, left)]
+            + integral[np.ix_(top, left)]
+        )
+        area = np.outer(bottom - top, right - left)
+        np.greater(gray.astype(np.int64) * area, window - _LOCAL_OFFSET * area, out=buffers.mask)
+    np.multiply(buffers.mask, 255, out=gray, casting="unsafe")
+
+
+PREPROCESS_VARIANTS: tuple[PreprocessSettings, ...] = (
+    PreprocessSettings(sharpen=True, contrast=1.2),
+    PreprocessSettings(sharpen=True, contrast=1.5, threshold=160),
+    PreprocessSettings(sharpen=False, contrast=1.1, invert=True),
+)
+
+
 def preprocess_variants(image: Image.Image) -> Iterable[Image.Image]:
     """Yield multiple preprocessing variants for OCR cross-validation."""
 
-    yield preprocess_image(image, sharpen=True, contrast=1.2)
-    yield preprocess_image(image, sharpen=True, contrast=1.5, threshold=160)
-    yield ImageOps.invert(preprocess_image(image, sharpen=False, contrast=1.1))
+    for settings in PREPROCESS_VARIANTS:
+        yield settings.apply(image)
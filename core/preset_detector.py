@@ -0,0 +1,304 @@
+"""Locate the profile panel in screenshots taken at any resolution.
+
+A ``PanelTemplate`` is cut once from a manually calibrated screenshot. For a
+screenshot at an unseen resolution the template's edge map is matched over a
+two-level image pyramid: a coarse pass tries a range of panel scales, and a
+fine pass refines the best one in a small window. ``PresetResolver`` caches
+the resulting presets per (width, height, UI scale) so later batches only
+read image headers.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+from PIL import Image, PngImagePlugin
+
+from core.image_cropper import CropPreset, crop_image
+from core.preprocess import load_cv2
+
+
+DEFAULT_MIN_SCORE = 0.45
+_TEMPLATE_METADATA_KEY = "wwm-panel-template"
+# Pyramid heights in pixels; the coarse level is half the fine one.
+_FINE_HEIGHT = 480
+# Panel scales searched on the coarse level, relative to the expected size.
+_COARSE_SCALES = tuple(1.05**step for step in range(-6, 7))
+_FINE_SCALES = tuple(1.02**step for step in range(-2, 3))
+_MIN_TEMPLATE_SIDE = 8
+
+
+def preset_cache_key(size: tuple[int, int], ui_scale: float = 1.0) -> str:
+    """Key a detected preset by screenshot size and in-game UI scale."""
+
+    width, height = size
+    return f"{width}x{height}@{ui_scale:g}"
+
+
+@dataclass(frozen=True)
+class PanelTemplate:
+    """Grayscale profile panel cut from a calibrated screenshot.
+
+    ``preset`` is the calibrated preset; detected presets keep its name and
+    field regions. The panel is assumed to scale with the screen height and
+    the in-game UI scale, which was ``ui_scale`` when the reference was taken.
+    """
+
+    image: Image.Image
+    preset: CropPreset
+    screen_size: tuple[int, int]
+    ui_scale: float = 1.0
+
+    @classmethod
+    def from_screenshot(
+        cls,
+        image_path: Path,
+        preset: CropPreset,
+        ui_scale: float = 1.0,
+    ) -> PanelTemplate:
+        with Image.open(image_path) as image:
+            screen_size = image.size
+        panel = crop_image(image_path, preset).convert("L")
+        return cls(image=panel, preset=preset, screen_size=screen_size, ui_scale=ui_scale)
+
+    def save(self, path: Path) -> None:
+        """Write the panel as PNG with the preset and reference size embedded."""
+
+        metadata = {
+            "preset": self.preset.to_dict(),
+            "screen_size": list(self.screen_size),
+            "ui_scale": self.ui_scale,
+        }
+        info = PngImagePlugin.PngInfo()
+        info.add_text(_TEMPLATE_METADATA_KEY, json.dumps(metadata, ensure_ascii=False))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.image.save(path, format="PNG", pnginfo=info)
+
+    @classmethod
+    def load(cls, path: Path) -> PanelTemplate:
+        """Read a template written by ``save``."""
+
+        with Image.open(path) as image:
+            raw = getattr(image, "text", {}).get(_TEMPLATE_METADATA_KEY)
+            if raw is None:
+                raise ValueError(f"Not a panel template: {path}")
+            panel = image.convert("L")
+        metadata = json.loads(raw)
+        width, height = metadata["screen_size"]
+        return cls(
+            image=panel,
+            preset=CropPreset.from_dict(metadata["preset"]),
+            screen_size=(int(width), int(height)),
+            ui_scale=float(metadata.get("ui_scale", 1.0)),
+        )
+
+    @property
+    def relative_height(self) -> float:
+        """Panel height as a fraction of the reference screen height."""
+
+        return self.image.height / self.screen_size[1]
+
+
+@dataclass(frozen=True)
+class PanelMatch:
+    """A detected panel location and its normalized cross-correlation score."""
+
+    preset: CropPreset
+    score: float
+
+
+def detect_preset(
+    image: Image.Image,
+    template: PanelTemplate,
+    *,
+    ui_scale: float = 1.0,
+    min_score: float = DEFAULT_MIN_SCORE,
+) -> PanelMatch | None:
+    """Find ``template``'s panel in ``image``; ``None`` if nothing scores ``min_score``.
+
+    Pass an image straight from ``Image.open`` so JPEGs can be decoded at a
+    reduced scale.
+    """
+
+    width, height = image.size
+    fine_size = (max(1, round(width * _FINE_HEIGHT / height)), _FINE_HEIGHT)
+    image.draft("L", fine_size)
+    fine = image.convert("L").resize(fine_size, Image.Resampling.BOX)
+    coarse = fine.reduce(2)
+    fine_edges = _edge_map(fine)
+    coarse_edges = _edge_map(coarse)
+
+    panel_height = template.relative_height * (ui_scale / template.ui_scale)
+    best: tuple[float, float, tuple[int, int]] | None = None
+    for scale in _COARSE_SCALES:
+        target = _template_edges(template, panel_height * scale * coarse.height)
+        if target is None or not _fits(target, coarse_edges):
+            continue
+        score, location = _match_template(coarse_edges, target)
+        if best is None or score > best[0]:
+            best = (score, scale, location)
+    if best is None:
+        return None
+
+    _, coarse_scale, (coarse_x, coarse_y) = best
+    refined: tuple[float, tuple[int, int, int, int]] | None = None
+    for scale in _FINE_SCALES:
+        target = _template_edges(template, panel_height * coarse_scale * scale * fine.height)
+        if target is None:
+            continue
+        target_height, target_width = target.shape
+        # Search a few coarse pixels around the coarse hit.
+        margin = 8
+        left = max(0, coarse_x * 2 - margin)
+        top = max(0, coarse_y * 2 - margin)
+        window = fine_edges[
+            top : top + target_height + 2 * margin,
+            left : left + target_width + 2 * margin,
+        ]
+        if not _fits(target, window):
+            continue
+        score, (x, y) = _match_template(window, target)
+        if refined is None or score > refined[0]:
+            refined = (score, (left + x, top + y, target_width, target_height))
+    if refined is None or refined[0] < min_score:
+        return None
+
+    score, (x, y, panel_width, panel_px_height) = refined
+    preset = CropPreset(
+        name=template.preset.name,
+        x=x / fine.width,
+        y=y / fine.height,
+        width=panel_width / fine.width,
+        height=panel_px_height / fine.height,
+        fields=template.preset.fields,
+    )
+    return PanelMatch(preset=preset, score=score)
+
+
+@dataclass
+class PresetResolver:
+    """Returns the crop preset for each screenshot, detecting new resolutions once.
+
+    ``presets`` maps ``preset_cache_key`` values to presets, normally
+    ``AppSettings.crop_presets``. Newly detected presets are added to it;
+    persist them with ``dataclasses.replace(settings, crop_presets=resolver.presets)``.
+    """
+
+    template: PanelTemplate
+    ui_scale: float = 1.0
+    presets: dict[str, CropPreset] = field(default_factory=dict)
+    min_score: float = DEFAULT_MIN_SCORE
+    detected: list[str] = field(default_factory=list, init=False)
+
+    def preset_for(self, image_path: Path) -> CropPreset:
+        """Return the cached preset for the screenshot's size or detect one."""
+
+        with Image.open(image_path) as image:
+            key = preset_cache_key(image.size, self.ui_scale)
+            preset = self.presets.get(key)
+            if preset is not None:
+                return preset
+            match = detect_preset(
+                image,
+                self.template,
+                ui_scale=self.ui_scale,
+                min_score=self.min_score,
+            )
+        if match is None:
+            raise ValueError(
+                f"Profile panel not found in {image_path}; calibrate {key} manually.",
+            )
+        self.presets[key] = match.preset
+        self.detected.append(key)
+        return match.preset
+
+
+def group_by_preset(
+    images: Sequence[Path],
+    presets: CropPreset | PresetResolver,
+) -> list[tuple[CropPreset, list[tuple[int, Path]]]]:
+    """Number screenshots from 1 and group the numbered paths by crop preset.
+
+    A single preset yields one group; a resolver looks up or detects each
+    screenshot's preset. Groups are ordered by where their preset first
+    appears, so a batch of one resolution keeps its order.
+    """
+
+    if isinstance(presets, CropPreset):
+        return [(presets, list(enumerate(images, start=1)))] if images else []
+    groups: dict[CropPreset, list[tuple[int, Path]]] = {}
+    for index, image_path in enumerate(images, start=1):
+        groups.setdefault(presets.preset_for(image_path), []).append((index, image_path))
+    return list(groups.items())
+
+
+def _edge_map(image: Image.Image) -> np.ndarray:
+    pixels = np.asarray(image, dtype=np.float32)
+    edges = np.zeros_like(pixels)
+    edges[:, 1:] += np.abs(np.diff(pixels, axis=1))
+    edges[1:, :] += np.abs(np.diff(pixels, axis=0))
+    return edges
+
+
+def _template_edges(template: PanelTemplate, height: float) -> np.ndarray | None:
+    target_height = round(height)
+    target_width = round(template.image.width * height / template.image.height)
+    if min(target_width, target_height) < _MIN_TEMPLATE_SIDE:
+        return None
+    return _edge_map(template.image.resize((target_width, target_height), Image.Resampling.BOX))
+
+
+def _fits(template: np.ndarray, image: np.ndarray) -> bool:
+    return template.shape[0] <= image.shape[0] and template.shape[1] <= image.shape[1]
+
+
+def _match_template(image: np.ndarray, template: np.ndarray) -> tuple[float, tuple[int, int]]:
+    """Best zero-mean normalized cross-correlation score and its top-left corner."""
+
+    cv2 = load_cv2()
+    if cv2 is not None:
+        scores = cv2.matchTemplate(image, np.ascontiguousarray(template), cv2.TM_CCOEFF_NORMED)
+    else:
+        scores = _normalized_correlation(image, template)
+    scores = np.nan_to_num(scores, nan=-1.0, posinf=-1.0, neginf=-1.0)
+    y, x = np.unravel_index(int(np.argmax(scores)), scores.shape)
+    return float(scores[y, x]), (int(x), int(y))
+
+
+def _normalized_correlation(image: np.ndarray, template: np.ndarray) -> np.ndarray:
+    """``cv2.TM_CCOEFF_NORMED`` computed with FFTs and integral images."""
+
+    image = image.astype(np.float64)
+    template_height, template_width = template.shape
+    image_height, image_width = image.shape
+    centered = template - template.mean()
+    template_norm = np.sqrt(np.square(centered).sum())
+
+    shape = (image_height + template_height - 1, image_width + template_width - 1)
+    spectrum = np.fft.rfft2(image, shape) * np.fft.rfft2(centered[::-1, ::-1], shape)
+    correlation = np.fft.irfft2(spectrum, shape)[
+        template_height - 1 : image_height,
+        template_width - 1 : image_width,
+    ]
+
+    count = template_height * template_width
+    sums = _window_sums(image, template_height, template_width)
+    squares = _window_sums(np.square(image), template_height, template_width)
+    deviation = np.sqrt(np.maximum(squares - sums * sums / count, 0.0)) * template_norm
+    scores = np.zeros_like(correlation)
+    np.divide(correlation, deviation, out=scores, where=deviation > 1e-6)
+    return scores
+
+
+def _window_sums(values: np.ndarray, height: int, width: int) -> np.ndarray:
+    integral = np.pad(values.cumsum(axis=0).cumsum(axis=1), ((1, 0), (1, 0)))
+    return (
+        integral[height:, width:]
+        - integral[:-height, width:]
+        - integral[height:, :-width]
+        + integral[:-height, :-width]
+    )
@@ -1,9 +1,17 @@
-"""Project folder management utilities."""
+"""Project folder management and the weekly member history store."""
 
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import date, timedelta
+import json
 from pathlib import Path
+import sqlite3
+from typing import Iterable
+
+from core.exporter import RecordWriter, export_records
+from core.member_index import MemberIndex, MemberMatch, normalize_nickname
+from models import DEFAULT_FIELDS, GuildMemberRecord
 
 
 @dataclass(frozen=True)
@@ -24,6 +32,18 @@ class ProjectPaths:
     def ocr_raw_dir(self) -> Path:
         return self.root / "ocr_raw"
 
+    @property
+    def panel_hashes(self) -> Path:
+        return self.root / "panel_hashes.json"
+
+    @property
+    def manifest(self) -> Path:
+        return self.root / "manifest.json"
+
+    @property
+    def history_db(self) -> Path:
+        return self.root / "history.sqlite3"
+
     @property
     def output_csv(self) -> Path:
         return self.root / "output.csv"
@@ -41,3 +61,242 @@ def ensure_project_structure(root: Path) -> ProjectPaths:
     paths.cropped_dir.mkdir(parents=True, exist_ok=True)
     paths.ocr_raw_dir.mkdir(parents=True, exist_ok=True)
     return paths
+
+
+_RECORD_COLUMNS = (
+    "nickname",
+    "role",
+    "faction",
+    "days_since_join",
+    "weekly_activity",
+    "martial_realm",
+    "exploration_skill",
+    "tech_mastery",
+)
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS members (
+    member_id INTEGER PRIMARY KEY,
+    nickname TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS member_aliases (
+    alias TEXT PRIMARY KEY,
+    member_id INTEGER NOT NULL REFERENCES members (member_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS member_weeks (
+    member_id INTEGER NOT NULL REFERENCES members (member_id),
+    week TEXT NOT NULL,
+    screenshot_index INTEGER NOT NULL,
+    {", ".join(f"{column} TEXT NOT NULL" for column in _RECORD_COLUMNS)},
+    extras TEXT NOT NULL DEFAULT '{{}}',
+    needs_review INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (member_id, week)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS member_weeks_by_week ON member_weeks (week, screenshot_index);
+"""
+
+_UPSERT = f"""
+INSERT INTO member_weeks (
+    member_id, week, screenshot_index, {", ".join(_RECORD_COLUMNS)}, extras, needs_review
+)
+VALUES ({", ".join("?" for _ in range(len(_RECORD_COLUMNS) + 5))})
+ON CONFLICT (member_id, week) DO UPDATE SET
+    screenshot_index = excluded.screenshot_index,
+    {", ".join(f"{column} = excluded.{column}" for column in _RECORD_COLUMNS)},
+    extras = excluded.extras,
+    needs_review = excluded.needs_review
+"""
+
+_UPSERT_MEMBER = """
+INSERT INTO members (member_id, nickname) VALUES (?, ?)
+ON CONFLICT (member_id) DO UPDATE SET nickname = excluded.nickname
+"""
+
+
+def iso_week(day: date) -> str:
+    """Week label used by ``ProjectStore``, e.g. ``2026-W07``; sorts chronologically."""
+
+    year, week, _ = day.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+class ProjectStore:
+    """SQLite history of member records with one row per (member, week).
+
+    Nicknames are resolved to stable member IDs through a ``MemberIndex``
+    persisted alongside the records, so OCR spelling drift between weeks
+    does not split a member's history. ``extras`` is stored as a JSON
+    column. CSV stays the export format via ``export_week``.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        self._members: MemberIndex | None = None
+
+    def __enter__(self) -> ProjectStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    @property
+    def members(self) -> MemberIndex:
+        """Nickname index loaded from the database on first use."""
+
+        if self._members is None:
+            cursor = self._connection.execute("SELECT alias, member_id FROM member_aliases")
+            self._members = MemberIndex((row["alias"], row["member_id"]) for row in cursor)
+        return self._members
+
+    def upsert_records(
+        self,
+        week: str,
+        records: Iterable[GuildMemberRecord],
+    ) -> list[MemberMatch]:
+        """Insert or replace a week's records in one transaction.
+
+        Returns how each record's nickname was resolved, in input order; see
+        ``MemberIndex.resolve_batch``. Ambiguous matches are stored against
+        the best candidate and flagged for review (see ``flagged_records``).
+        """
+
+        records = list(records)
+        for record in records:
+            if not normalize_nickname(record.nickname):
+                raise ValueError(f"Record {record.index} has no nickname to key it by")
+
+        matches = self.members.resolve_batch([record.nickname for record in records])
+        rows = [
+            (
+                match.member_id,
+                week,
+                record.index,
+                *(getattr(record, column) for column in _RECORD_COLUMNS),
+                json.dumps(record.extras, ensure_ascii=False),
+                int(match.ambiguous),
+            )
+            for record, match in zip(records, matches)
+        ]
+        confirmed = [
+            (record, match) for record, match in zip(records, matches) if not match.ambiguous
+        ]
+        try:
+            with self._connection:
+                self._connection.executemany(
+                    _UPSERT_MEMBER,
+                    [(match.member_id, record.nickname.strip()) for record, match in confirmed],
+                )
+                self._connection.executemany(
+                    "INSERT OR IGNORE INTO member_aliases (alias, member_id) VALUES (?, ?)",
+                    [
+                        (normalize_nickname(record.nickname), match.member_id)
+                        for record, match in confirmed
+                    ],
+                )
+                self._connection.executemany(_UPSERT, rows)
+        except sqlite3.Error:
+            # The in-memory index already learned these aliases; reload it.
+            self._members = None
+            raise
+        return matches
+
+    def weeks(self) -> list[str]:
+        """Every week with stored records, oldest first."""
+
+        cursor = self._connection.execute("SELECT DISTINCT week FROM member_weeks ORDER BY week")
+        return [row["week"] for row in cursor]
+
+    def week_records(self, week: str) -> list[GuildMemberRecord]:
+        """The roster recorded for ``week`` in screenshot order."""
+
+        cursor = self._connection.execute(
+            "SELECT * FROM member_weeks WHERE week = ? ORDER BY screenshot_index",
+            (week,),
+        )
+        return [_record_from_row(row) for row in cursor]
+
+    def flagged_records(self, week: str) -> list[tuple[int, GuildMemberRecord]]:
+        """``(member_id, record)`` pairs of ``week`` whose member match was ambiguous."""
+
+        cursor = self._connection.execute(
+            "SELECT * FROM member_weeks WHERE week = ? AND needs_review "
+            "ORDER BY screenshot_index",
+            (week,),
+        )
+        return [(row["member_id"], _record_from_row(row)) for row in cursor]
+
+    def member_history(
+        self,
+        member: str | int,
+        weeks: int = 12,
+        until: date | None = None,
+    ) -> list[tuple[str, GuildMemberRecord]]:
+        """A member's records over the ``weeks`` weeks ending with ``until``'s week.
+
+        ``member`` is a member ID or any spelling of their nickname. Returns
+        ``(week, record)`` pairs, oldest first; weeks without a record are
+        simply missing.
+        """
+
+        if isinstance(member, str):
+            match = self.members.lookup(member)
+            if match is None:
+                return []
+            member = match.member_id
+        until = until or date.today()
+        first = iso_week(until - timedelta(weeks=weeks - 1))
+        cursor = self._connection.execute(
+            "SELECT * FROM member_weeks WHERE member_id = ? AND week BETWEEN ? AND ? "
+            "ORDER BY week",
+            (member, first, iso_week(until)),
+        )
+        return [(row["week"], _record_from_row(row)) for row in cursor]
+
+    def export_week(self, week: str, path: Path) -> None:
+        """Write one week's roster to CSV."""
+
+        export_records(path, self.week_records(week))
+
+    def export_history(self, path: Path) -> int:
+        """Stream every stored week to one CSV (``.gz`` for gzip) with a ``week`` column.
+
+        The header comes from a schema pass over the JSON keys of ``extras``;
+        rows are then written straight from the cursor, so memory stays flat
+        however long the history is. Returns the number of rows written.
+        """
+
+        cursor = self._connection.execute(
+            "SELECT DISTINCT extras_key.key AS name "
+            "FROM member_weeks, json_each(member_weeks.extras) AS extras_key ORDER BY name",
+        )
+        extra_columns = [row["name"] for row in cursor if row["name"] not in DEFAULT_FIELDS]
+        columns = ["week", *DEFAULT_FIELDS, *extra_columns]
+        cursor = self._connection.execute(
+            f"SELECT week, screenshot_index, {', '.join(_RECORD_COLUMNS)}, extras "
+            "FROM member_weeks ORDER BY week, screenshot_index",
+        )
+        cursor.row_factory = None
+        with RecordWriter(path, columns) as writer:
+            for *cells, extras in cursor:
+                if extra_columns:
+                    values = json.loads(extras) if extras != "{}" else {}
+                    cells.extend(values.get(name, "") for name in extra_columns)
+                writer.write_cells(cells)
+            return writer.rows_written
+
+
+def _record_from_row(row: sqlite3.Row) -> GuildMemberRecord:
+    return GuildMemberRecord(
+        index=row["screenshot_index"],
+        **{column: row[column] for column in _RECORD_COLUMNS},
+        extras=json.loads(row["extras"]),
+    )
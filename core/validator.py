@@ -3,10 +3,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Iterable, Sequence
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
-from models import OCRComparisonResult
+from core.parser import parse_member_fields, parse_member_text
+from models import DEFAULT_FIELDS, GuildMemberRecord, OCRComparisonResult, ScreenshotOCRResult
+
+
+# Fields whose value must match exactly; a single wrong digit is a real error.
+NUMERIC_FIELDS = frozenset(
+    {"days_since_join", "weekly_activity", "martial_realm", "exploration_skill", "tech_mastery"},
+)
+_COMPARED_FIELDS = tuple(name for name in DEFAULT_FIELDS if name != "index")
 
 
 @dataclass(frozen=True)
@@ -16,6 +25,37 @@ class ValidationThresholds:
     text_similarity: float = 85.0
 
 
+@dataclass(frozen=True)
+class FieldComparison:
+    """One field as read by two engines; numeric fields score 0 or 100."""
+
+    name: str
+    primary: str
+    secondary: str
+    score: float
+    is_match: bool
+
+
+@dataclass(frozen=True)
+class RecordComparison:
+    """Field-by-field agreement between two engines' records of one screenshot."""
+
+    index: int
+    primary: GuildMemberRecord
+    secondary: GuildMemberRecord
+    fields: tuple[FieldComparison, ...]
+
+    @property
+    def is_match(self) -> bool:
+        return all(field.is_match for field in self.fields)
+
+    @property
+    def mismatches(self) -> list[str]:
+        """Names of the fields that need review."""
+
+        return [field.name for field in self.fields if not field.is_match]
+
+
 def compare_texts(primary: str, secondary: str, thresholds: ValidationThresholds) -> OCRComparisonResult:
     """Compare OCR texts and return a comparison result."""
 
@@ -29,3 +69,116 @@ def compare_texts(primary: str, secondary: str, thresholds: ValidationThresholds
         similarity_score=score,
         chosen_text=chosen,
     )
+
+
+def compare_records(
+    primary: GuildMemberRecord,
+    secondary: GuildMemberRecord,
+    thresholds: ValidationThresholds = ValidationThresholds(),
+) -> RecordComparison:
+    """Compare two parsed records field by field."""
+
+    return compare_record_batch([(primary, secondary)], thresholds)[0]
+
+
+def compare_record_batch(
+    pairs: Sequence[tuple[GuildMemberRecord, GuildMemberRecord]],
+    thresholds: ValidationThresholds = ValidationThresholds(),
+) -> list[RecordComparison]:
+    """Compare every (primary, secondary) record pair of a run.
+
+    Numeric fields match only when equal after dropping whitespace. Text
+    fields, including extras, are scored with ``fuzz.ratio`` against
+    ``thresholds.text_similarity`` in one ``rapidfuzz.process.cpdist`` call,
+    the element-wise form of ``cdist``, covering the whole batch.
+    """
+
+    values = [_field_values(primary, secondary) for primary, secondary in pairs]
+    text_pairs = [
+        (first, second)
+        for fields in values
+        for name, first, second in fields
+        if name not in NUMERIC_FIELDS
+    ]
+    scores = iter(
+        process.cpdist(
+            [first for first, _ in text_pairs],
+            [second for _, second in text_pairs],
+            scorer=fuzz.ratio,
+            dtype="float64",
+            workers=-1,
+        ).tolist()
+        if text_pairs
+        else (),
+    )
+
+    comparisons = []
+    for (primary, secondary), fields in zip(pairs, values):
+        compared = []
+        for name, first, second in fields:
+            if name in NUMERIC_FIELDS:
+                is_match = "".join(first.split()) == "".join(second.split())
+                score = 100.0 if is_match else 0.0
+            else:
+                score = next(scores)
+                is_match = score >= thresholds.text_similarity
+            compared.append(FieldComparison(name, first, second, score, is_match))
+        comparisons.append(RecordComparison(primary.index, primary, secondary, tuple(compared)))
+    return comparisons
+
+
+def compare_results(
+    results: Iterable[ScreenshotOCRResult],
+    primary: str,
+    secondary: str,
+    thresholds: ValidationThresholds = ValidationThresholds(),
+) -> list[RecordComparison]:
+    """Parse and compare two engines' readings for every result of a run.
+
+    Results missing either engine, e.g. skipped by the confidence gate, are
+    left out.
+    """
+
+    pairs = []
+    for result in results:
+        records = engine_records(result, primary)
+        if primary in records and secondary in records:
+            pairs.append((records[primary], records[secondary]))
+    return compare_record_batch(pairs, thresholds)
+
+
+def engine_records(
+    result: ScreenshotOCRResult,
+    primary: str | None = None,
+) -> dict[str, GuildMemberRecord]:
+    """Parse each engine's reading of a screenshot into a record.
+
+    With field regions the confidence gate may escalate only some fields to
+    later engines; their missing fields take the ``primary`` engine's text so
+    the records compare on the fields both engines actually read.
+    """
+
+    if result.fields:
+        base = result.fields.get(primary, {}) if primary is not None else {}
+        return {
+            engine: parse_member_fields(
+                fields if engine == primary else {**base, **fields},
+                result.index,
+            )
+            for engine, fields in result.fields.items()
+        }
+    return {engine: parse_member_text(text, result.index) for engine, text in result.texts.items()}
+
+
+def _field_values(
+    primary: GuildMemberRecord,
+    secondary: GuildMemberRecord,
+) -> list[tuple[str, str, str]]:
+    values = [
+        (name, str(getattr(primary, name)), str(getattr(secondary, name)))
+        for name in _COMPARED_FIELDS
+    ]
+    for name in dict.fromkeys([*primary.extras, *secondary.extras]):
+        first, second = primary.extras.get(name), secondary.extras.get(name)
+        values.append((name, "" if first is None else str(first), "" if second is None else str(second)))
+    return values
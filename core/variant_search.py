@@ -0,0 +1,94 @@
+"""Lazy, early-exit search over preprocessing variants."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, Sequence
+
+from rapidfuzz import fuzz
+
+from core.ocr_engine import OCRReading
+from core.preprocess import PREPROCESS_VARIANTS, PreprocessSettings
+from core.validator import ValidationThresholds
+
+
+VariantReader = Callable[[str, PreprocessSettings], OCRReading]
+
+
+@dataclass(frozen=True)
+class VariantOutcome:
+    """Readings from the variant the search settled on."""
+
+    variant: int
+    readings: dict[str, OCRReading]
+    accepted: bool
+
+
+@dataclass
+class VariantSearch:
+    """OCRs one preprocessing variant at a time and stops at the first good one.
+
+    A variant is accepted once the first engine's confidence reaches
+    ``confidence_threshold`` (later engines are then skipped) or all engines
+    agree within ``thresholds.text_similarity``. The winning variant is
+    remembered per search key, typically the crop preset name, and tried
+    first for later images.
+    """
+
+    variants: tuple[PreprocessSettings, ...] = PREPROCESS_VARIANTS
+    confidence_threshold: float | None = None
+    thresholds: ValidationThresholds = field(default_factory=ValidationThresholds)
+    _winners: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    def order(self, key: str) -> list[int]:
+        """Variant indexes to try for ``key``, last winner first."""
+
+        order = list(range(len(self.variants)))
+        winner = self._winners.get(key)
+        if winner is not None:
+            order.remove(winner)
+            order.insert(0, winner)
+        return order
+
+    def run(self, key: str, engines: Sequence[str], read: VariantReader) -> VariantOutcome:
+        """Search variants for ``key``; ``read(engine, settings)`` performs one OCR.
+
+        When no variant is accepted, the one with the most confident first
+        reading is returned with ``accepted=False``.
+        """
+
+        primary, *others = engines
+        best: VariantOutcome | None = None
+        for variant in self.order(key):
+            settings = self.variants[variant]
+            readings = {primary: read(primary, settings)}
+            if self._is_confident(readings[primary]):
+                return self._accept(key, variant, readings)
+
+            for name in others:
+                readings[name] = read(name, settings)
+            if others and self._engines_agree(readings, primary):
+                return self._accept(key, variant, readings)
+
+            if best is None or readings[primary].confidence > best.readings[primary].confidence:
+                best = VariantOutcome(variant=variant, readings=readings, accepted=False)
+
+        if best is None:
+            raise ValueError("VariantSearch needs at least one variant")
+        return best
+
+    def _is_confident(self, reading: OCRReading) -> bool:
+        threshold = self.confidence_threshold
+        return threshold is not None and reading.confidence >= threshold
+
+    def _engines_agree(self, readings: dict[str, OCRReading], primary: str) -> bool:
+        reference = readings[primary].text
+        return all(
+            fuzz.ratio(reference, reading.text) >= self.thresholds.text_similarity
+            for name, reading in readings.items()
+            if name != primary
+        )
+
+    def _accept(self, key: str, variant: int, readings: dict[str, OCRReading]) -> VariantOutcome:
+        self._winners[key] = variant
+        return VariantOutcome(variant=variant, readings=readings, accepted=True)
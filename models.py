@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass, field
-from typing import Any
+from pathlib import Path
+import sys
+from typing import Any, Iterable, Iterator, Mapping, Sequence
 
 
 DEFAULT_FIELDS: tuple[str, ...] = (
@@ -58,6 +61,231 @@ class GuildMemberRecord:
         return ordered
 
 
+# Fields kept as machine integers in ``RecordTable``; ``days_since_join`` is
+# stored without its "일" suffix.
+_INT_FIELDS: tuple[str, ...] = (
+    "index",
+    "days_since_join",
+    "weekly_activity",
+    "exploration_skill",
+    "tech_mastery",
+)
+_INTERNED_FIELDS: tuple[str, ...] = ("role", "faction")
+_DAYS_SUFFIX = "일"
+_MISSING = -1
+# Largest value an ``array('q')`` cell holds; longer digit runs stay as text.
+_INT_MAX = 2**63 - 1
+
+
+class RecordTable:
+    """Columnar storage for many ``GuildMemberRecord`` rows.
+
+    Each default field is one column: integer fields live in ``array('q')``
+    (``-1`` when empty), role and faction hold interned strings, and other
+    text fields are plain lists. Extra columns are sparse ``row -> value``
+    maps, so an extra set on a few rows costs nothing for the rest. Integer
+    cells whose text would not survive a round trip (``"007"``, OCR junk)
+    keep their original text in a sparse override map instead.
+    """
+
+    def __init__(self) -> None:
+        self._size = 0
+        self._ints: dict[str, array[int]] = {name: array("q") for name in _INT_FIELDS}
+        self._texts: dict[str, list[str]] = {
+            name: [] for name in DEFAULT_FIELDS if name not in _INT_FIELDS
+        }
+        self._raw: dict[str, dict[int, str]] = {name: {} for name in _INT_FIELDS}
+        self._extras: dict[str, dict[int, Any]] = {}
+
+    @classmethod
+    def from_records(cls, records: Iterable[GuildMemberRecord]) -> RecordTable:
+        table = cls()
+        for record in records:
+            table.append(record)
+        return table
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def columns(self) -> list[str]:
+        """Default fields followed by extra columns in the order they appeared."""
+
+        return [*DEFAULT_FIELDS, *self._extras]
+
+    def add_column(self, name: str) -> None:
+        """Add an empty extra column."""
+
+        if name not in DEFAULT_FIELDS:
+            self._extras.setdefault(name, {})
+
+    def append(self, record: GuildMemberRecord) -> int:
+        """Append a record and return its row number."""
+
+        row = self._new_row()
+        for name in DEFAULT_FIELDS:
+            self.set_value(row, name, getattr(record, name))
+        for name, value in record.extras.items():
+            if name not in DEFAULT_FIELDS:
+                self.add_column(name)
+                self.set_value(row, name, value)
+        return row
+
+    def append_row(self, values: Mapping[str, Any]) -> int:
+        """Append a row given as ``column -> text``, as read from CSV."""
+
+        row = self._new_row()
+        for name, value in values.items():
+            # csv.DictReader files surplus cells under None.
+            if name is not None:
+                self.set_value(row, name, value)
+        return row
+
+    def extend_rows(self, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> None:
+        """Append many rows of cells in ``columns`` order, filling column by column."""
+
+        rows = list(rows)
+        start = self._size
+        count = len(rows)
+        self._size += count
+        for name in self._ints:
+            self._ints[name].extend(array("q", [_MISSING]) * count)
+        for texts in self._texts.values():
+            texts.extend([""] * count)
+        for position, name in enumerate(columns):
+            if name is None:
+                continue
+            cells = [row[position] if position < len(row) else "" for row in rows]
+            if name in self._ints:
+                numbers = self._ints[name]
+                raw = self._raw[name]
+                for offset, cell in enumerate(cells):
+                    if cell:
+                        number = _parse_int(name, str(cell))
+                        if number is None:
+                            raw[start + offset] = cell
+                        else:
+                            numbers[start + offset] = number
+            elif name in self._texts:
+                if name in _INTERNED_FIELDS:
+                    cells = [sys.intern(str(cell)) for cell in cells]
+                self._texts[name][start:] = cells
+            else:
+                sparse = self._extras.setdefault(name, {})
+                sparse.update(
+                    (start + offset, cell) for offset, cell in enumerate(cells) if cell != ""
+                )
+
+    def value(self, row: int, name: str) -> Any:
+        """Display/CSV value of one cell; empty cells are ``""``."""
+
+        if name in self._ints:
+            raw = self._raw[name].get(row)
+            if raw is not None:
+                return raw
+            number = self._ints[name][row]
+            if number == _MISSING:
+                return ""
+            return f"{number}{_DAYS_SUFFIX}" if name == "days_since_join" else number
+        if name in self._texts:
+            return self._texts[name][row]
+        return self._extras.get(name, {}).get(row, "")
+
+    def set_value(self, row: int, name: str, value: Any) -> None:
+        if name in self._ints:
+            self._set_int(row, name, value)
+        elif name in self._texts:
+            text = "" if value is None else str(value)
+            self._texts[name][row] = sys.intern(text) if name in _INTERNED_FIELDS else text
+        else:
+            column = self._extras.setdefault(name, {})
+            if value in (None, ""):
+                column.pop(row, None)
+            else:
+                column[row] = value
+
+    def column(self, name: str) -> Sequence[Any]:
+        """The typed storage of a default field (integers use ``-1`` for empty)."""
+
+        if name in self._ints:
+            return self._ints[name]
+        return self._texts[name]
+
+    def record(self, row: int) -> GuildMemberRecord:
+        values = {name: self.value(row, name) for name in DEFAULT_FIELDS}
+        index = values.pop("index")
+        return GuildMemberRecord(
+            index=index if isinstance(index, int) else 0,
+            **{name: str(value) for name, value in values.items()},
+            extras={
+                name: column[row] for name, column in self._extras.items() if row in column
+            },
+        )
+
+    def records(self) -> Iterator[GuildMemberRecord]:
+        for row in range(self._size):
+            yield self.record(row)
+
+    def iter_rows(self, columns: Sequence[str] | None = None) -> Iterator[list[Any]]:
+        """Yield each row as a list of cell values in ``columns`` order."""
+
+        columns = list(columns) if columns is not None else self.columns
+        # Format column by column, then transpose: far fewer calls than per cell.
+        for cells in zip(*(self._display_column(name) for name in columns)):
+            yield list(cells)
+
+    def _display_column(self, name: str) -> list[Any]:
+        if name in self._texts:
+            return self._texts[name]
+        if name not in self._ints:
+            sparse = self._extras.get(name, {})
+            return [sparse.get(row, "") for row in range(self._size)]
+        suffix = _DAYS_SUFFIX if name == "days_since_join" else None
+        cells: list[Any] = [
+            "" if number == _MISSING else f"{number}{suffix}" if suffix else number
+            for number in self._ints[name]
+        ]
+        for row, raw in self._raw[name].items():
+            cells[row] = raw
+        return cells
+
+    def _new_row(self) -> int:
+        row = self._size
+        self._size += 1
+        for column in self._ints.values():
+            column.append(_MISSING)
+        for texts in self._texts.values():
+            texts.append("")
+        return row
+
+    def _set_int(self, row: int, name: str, value: Any) -> None:
+        text = "" if value is None else str(value)
+        self._raw[name].pop(row, None)
+        number = _parse_int(name, text) if text else _MISSING
+        if number is None:
+            self._ints[name][row] = _MISSING
+            self._raw[name][row] = text
+        else:
+            self._ints[name][row] = number
+
+
+def _parse_int(name: str, text: str) -> int | None:
+    """Integer stored for ``text``, or ``None`` if it would not format back identically.
+
+    Values outside the int64 range of the column arrays also give ``None``.
+    """
+
+    if name == "days_since_join":
+        if not text.endswith(_DAYS_SUFFIX):
+            return None
+        text = text[: -len(_DAYS_SUFFIX)]
+    if text.isascii() and text.isdigit() and (text[0] != "0" or text == "0"):
+        number = int(text)
+        if number <= _INT_MAX:
+            return number
+    return None
+
+
 @dataclass
 class OCRComparisonResult:
     """Stores OCR results from two engines and validation outcome."""
@@ -67,3 +295,21 @@ class OCRComparisonResult:
     is_match: bool
     similarity_score: float
     chosen_text: str | None = None
+
+
+@dataclass
+class ScreenshotOCRResult:
+    """OCR output for one numbered screenshot, keyed by engine name.
+
+    ``texts`` holds whole-panel OCR; presets with field regions fill
+    ``fields`` (engine name -> field name -> text) instead. Confidences use a
+    0-100 scale. Engines skipped by the confidence gate have no entries.
+    """
+
+    index: int
+    source_path: Path
+    cropped_path: Path | None = None
+    texts: dict[str, str] = field(default_factory=dict)
+    fields: dict[str, dict[str, str]] = field(default_factory=dict)
+    confidences: dict[str, float] = field(default_factory=dict)
+    field_confidences: dict[str, dict[str, float]] = field(default_factory=dict)
@@ -0,0 +1,111 @@
+import random
+
+import pytest
+
+pytest.importorskip("PIL")
+
+from PIL import Image, ImageDraw  # noqa: E402
+
+from core import pipeline  # noqa: E402
+from core.dedup import PanelHashIndex, dhash, hamming_distance, panel_hash  # noqa: E402
+from core.image_cropper import CropPreset, FieldRegion, crop_fields  # noqa: E402
+from core.ocr_engine import OCRReading  # noqa: E402
+
+
+FIELDS = (
+    FieldRegion("nickname", 0.35, 0.05, 0.6, 0.08),
+    FieldRegion("weekly_activity", 0.35, 0.2, 0.6, 0.08, numeric=True),
+    FieldRegion("tech_mastery", 0.35, 0.35, 0.6, 0.08, numeric=True),
+)
+PRESET = CropPreset("test", 0.0, 0.0, 1.0, 1.0, FIELDS)
+
+
+def _panel(name: str, activity: int, mastery: int) -> Image.Image:
+    """A profile panel: fixed labels and frame, varying values."""
+
+    image = Image.new("L", (320, 360), 40)
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((4, 4, 315, 355), outline=200, width=2)
+    rows = (("Name", name), ("Weekly", str(activity)), ("Tech", str(mastery)))
+    for row, (label, value) in enumerate(rows):
+        top = 22 + row * 54
+        draw.text((12, top), label, fill=220)
+        draw.text((120, top), value, fill=230)
+    return image
+
+
+def _hash(image: Image.Image):
+    return panel_hash(image, crop_fields(image, PRESET).values())
+
+
+def test_dhash_distance():
+    image = _panel("Alpha", 100, 5)
+
+    assert dhash(image).bit_length() <= 256
+    assert hamming_distance(dhash(image), dhash(image.copy())) == 0
+
+
+def test_same_layout_different_members_are_not_duplicates(tmp_path):
+    rng = random.Random(7)
+    panels = [
+        _panel(f"Member{number}", rng.randint(1, 99999), rng.randint(1, 999))
+        for number in range(20)
+    ]
+    index = PanelHashIndex()
+
+    for number, image in enumerate(panels):
+        assert index.check(tmp_path / f"{number}.png", _hash(image)) is None
+    assert not index.duplicates
+    assert len({_hash(image).digest for image in panels}) == len(panels)
+
+
+def test_updated_profile_is_not_a_duplicate(tmp_path):
+    index = PanelHashIndex()
+    index.check(tmp_path / "week1.png", _hash(_panel("Alpha", 12345, 80)))
+
+    assert index.check(tmp_path / "week2.png", _hash(_panel("Alpha", 12346, 80))) is None
+
+
+def test_identical_panel_is_a_duplicate_and_persists(tmp_path):
+    path = tmp_path / "hashes.json"
+    first = PanelHashIndex(path=path, batch="2026-10-01")
+    first.check(tmp_path / "a.png", _hash(_panel("Alpha", 1, 2)))
+    first.save()
+
+    second = PanelHashIndex(path=path, batch="2026-10-08")
+    duplicate = second.check(tmp_path / "b.png", _hash(_panel("Alpha", 1, 2)))
+
+    assert duplicate is not None
+    assert duplicate.original == (tmp_path / "a.png").resolve()
+    assert duplicate.previous_batch == "2026-10-01"
+    # Re-checking the original file never flags it against itself.
+    assert second.check(tmp_path / "a.png", _hash(_panel("Alpha", 1, 2))) is None
+
+
+class _CountingEngine:
+    reads = 0
+
+    def read_fields(self, images, *, numeric=False):
+        _CountingEngine.reads += len(images)
+        return [OCRReading("1", (95.0,)) for _ in images]
+
+    def close(self):
+        pass
+
+
+def test_pipeline_skips_duplicates_before_ocr(tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline, "build_engine", lambda name, language: _CountingEngine())
+    _CountingEngine.reads = 0
+    images = []
+    for number, values in enumerate([("Alpha", 1, 2), ("Bravo", 3, 4), ("Alpha", 1, 2)]):
+        image_path = tmp_path / f"{number}.png"
+        _panel(*values).save(image_path)
+        images.append(image_path)
+    hashes = PanelHashIndex()
+    options = pipeline.PipelineOptions(engines=("counting",), batch_size=2)
+
+    results = pipeline.run_batch(images, PRESET, options=options, hashes=hashes)
+
+    assert [result.index for result in results] == [1, 2]
+    assert [duplicate.path for duplicate in hashes.duplicates] == [images[2]]
+    assert _CountingEngine.reads == 2 * len(FIELDS)
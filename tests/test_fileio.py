@@ -0,0 +1,26 @@
+import os
+import stat
+import sys
+
+import pytest
+
+from core.fileio import atomic_write_text
+
+
+def test_atomic_write_text_replaces_and_leaves_no_temp_file(tmp_path):
+    path = tmp_path / "index.json"
+    path.write_text("old", encoding="utf-8")
+
+    atomic_write_text(path, '{"명": 1}')
+
+    assert path.read_text(encoding="utf-8") == '{"명": 1}'
+    assert [entry.name for entry in tmp_path.iterdir()] == ["index.json"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+def test_atomic_write_text_private_mode(tmp_path):
+    path = tmp_path / "host.json"
+
+    atomic_write_text(path, "secret", mode=0o600)
+
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
@@ -0,0 +1,50 @@
+import pytest
+
+pytest.importorskip("rapidfuzz")
+
+from core.member_index import MemberIndex  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    ("known", "read"),
+    [("홍길동", "홍길둥"), ("검객1", "검객l"), ("바람의검객", "바람의검걕")],
+)
+def test_one_character_ocr_slip_keeps_the_member(known, read):
+    index = MemberIndex([(known, 7)])
+
+    match = index.lookup(read)
+
+    assert match is not None
+    assert match.member_id == 7
+    assert match.score >= index.score_cutoff
+
+
+@pytest.mark.parametrize(("known", "read"), [("홍길동", "홍길순"), ("홍길동", "김철수")])
+def test_different_names_stay_apart(known, read):
+    assert MemberIndex([(known, 1)]).lookup(read) is None
+
+
+def test_exact_alias_ignores_case_and_spaces():
+    match = MemberIndex([("Sword Master", 3)]).lookup("swordmaster")
+
+    assert match is not None
+    assert (match.member_id, match.score) == (3, 100.0)
+
+
+def test_resolve_learns_fuzzy_spellings_and_creates_new_members():
+    index = MemberIndex([("홍길동", 1)])
+
+    assert index.resolve("홍길둥").member_id == 1
+    assert index.aliases()["홍길둥"] == 1
+    created = index.resolve("김철수")
+    assert created.created
+    assert created.member_id == 2
+
+
+def test_resolve_batch_never_merges_names_on_one_roster():
+    index = MemberIndex([("검객1", 1)])
+
+    matches = index.resolve_batch(["검객1", "검객l"])
+
+    assert matches[0].member_id == 1
+    assert matches[1].created
@@ -0,0 +1,64 @@
+from models import GuildMemberRecord, RecordTable
+
+
+def _record(index: int = 1, **values: str) -> GuildMemberRecord:
+    fields = {
+        "nickname": "홍길동",
+        "role": "단원",
+        "faction": "청풍",
+        "days_since_join": "12일",
+        "weekly_activity": "3400",
+        "martial_realm": "5.2",
+        "exploration_skill": "120",
+        "tech_mastery": "88",
+    }
+    fields.update(values)
+    return GuildMemberRecord(index=index, **fields)
+
+
+def test_records_round_trip():
+    records = [_record(1), _record(2, nickname="검객1")]
+    records[1].extras["note"] = "신입"
+    table = RecordTable.from_records(records)
+
+    assert list(table.records()) == records
+    assert table.columns[-1] == "note"
+    assert table.column("weekly_activity")[0] == 3400
+    assert table.value(0, "days_since_join") == "12일"
+
+
+def test_text_that_does_not_format_back_is_kept_raw():
+    table = RecordTable.from_records([_record(weekly_activity="007", tech_mastery="8O")])
+
+    assert table.value(0, "weekly_activity") == "007"
+    assert table.value(0, "tech_mastery") == "8O"
+    assert table.column("weekly_activity")[0] == -1
+
+
+def test_integers_beyond_int64_are_kept_raw():
+    huge = "99999999999999999999"
+    table = RecordTable()
+    table.append(_record(weekly_activity=huge, days_since_join=f"{huge}일"))
+    table.append_row({"index": "2", "tech_mastery": huge})
+    table.extend_rows(["index", "exploration_skill"], [["3", huge]])
+
+    assert table.value(0, "weekly_activity") == huge
+    assert table.value(0, "days_since_join") == f"{huge}일"
+    assert table.value(1, "tech_mastery") == huge
+    assert table.value(2, "exploration_skill") == huge
+    assert table.value(2, "index") == 3
+
+    table.set_value(2, "index", str(2**63 - 1))
+    assert table.column("index")[2] == 2**63 - 1
+
+
+def test_extend_rows_matches_append_row():
+    columns = ["index", "nickname", "days_since_join", "weekly_activity", "note"]
+    rows = [["1", "홍길동", "12일", "3400", ""], ["2", "검객1", "", "x1", "신입"]]
+    bulk = RecordTable()
+    bulk.extend_rows(columns, rows)
+    single = RecordTable()
+    for row in rows:
+        single.append_row(dict(zip(columns, row)))
+
+    assert list(bulk.iter_rows()) == list(single.iter_rows())
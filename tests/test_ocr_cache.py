@@ -0,0 +1,59 @@
+import pytest
+
+pytest.importorskip("PIL")
+
+from core.ocr_cache import OCRCache  # noqa: E402
+from core.ocr_engine import OCRReading  # noqa: E402
+
+
+def _entry_size(tmp_path) -> int:
+    probe = OCRCache(tmp_path / "probe")
+    probe.put("00", OCRReading("text", (90.0,)))
+    return probe.total_bytes
+
+
+def test_put_and_get_round_trip(tmp_path):
+    cache = OCRCache(tmp_path)
+    cache.put("ab" * 32, OCRReading("홍길동", (91.5, 80.0)))
+
+    assert cache.get("ab" * 32) == OCRReading("홍길동", (91.5, 80.0))
+    assert cache.get("cd" * 32) is None
+
+
+def test_evicts_least_recently_used(tmp_path):
+    size = _entry_size(tmp_path)
+    cache = OCRCache(tmp_path / "cache", max_bytes=size * 3)
+    for key in ("00", "11", "22"):
+        cache.put(key, OCRReading("text", (90.0,)))
+    cache.get("00")
+    cache.put("33", OCRReading("text", (90.0,)))
+
+    assert "11" not in cache
+    assert [key in cache for key in ("00", "22", "33")] == [True, True, True]
+    assert cache.total_bytes == size * 3
+    assert not (tmp_path / "cache" / "11" / "11.json").exists()
+
+
+def test_index_keeps_order_and_total_across_loads(tmp_path):
+    size = _entry_size(tmp_path)
+    cache = OCRCache(tmp_path / "cache", max_bytes=size * 2)
+    cache.put("00", OCRReading("text", (90.0,)))
+    cache.put("11", OCRReading("text", (90.0,)))
+    cache.get("00")
+    cache.save()
+
+    reopened = OCRCache(tmp_path / "cache", max_bytes=size * 2)
+    assert reopened.total_bytes == size * 2
+    reopened.put("22", OCRReading("text", (90.0,)))
+    assert "11" not in reopened
+    assert "00" in reopened
+
+
+def test_unreadable_entry_is_dropped_from_total(tmp_path):
+    cache = OCRCache(tmp_path)
+    cache.put("00", OCRReading("text", (90.0,)))
+    (tmp_path / "00" / "00.json").write_text("{", encoding="utf-8")
+
+    assert cache.get("00") is None
+    assert cache.total_bytes == 0
+    assert len(cache) == 0
@@ -0,0 +1,42 @@
+from core.parser import parse_member_fields, parse_member_text
+
+
+def test_parse_member_fields_cleans_numeric_noise():
+    record = parse_member_fields(
+        {
+            "nickname": " 홍길동 ",
+            "role": "단  원",
+            "faction": "청풍",
+            "days_since_join": "12 일",
+            "weekly_activity": "3,400",
+            "martial_realm": "5.2단",
+            "exploration_skill": "1 20",
+            "tech_mastery": "",
+        },
+        index=4,
+    )
+
+    assert record.index == 4
+    assert record.nickname == "홍길동"
+    assert record.role == "단 원"
+    assert record.days_since_join == "12일"
+    assert record.weekly_activity == "3400"
+    assert record.martial_realm == "5.2"
+    assert record.exploration_skill == "120"
+    assert record.tech_mastery == ""
+
+
+def test_parse_member_fields_prefers_the_ocr_panel_index():
+    assert parse_member_fields({"index": "No. 17"}, index=4).index == 17
+    assert parse_member_fields({"index": "--"}, index=4).index == 4
+
+
+def test_parse_member_text_tolerates_split_and_misread_labels():
+    text = "닉네임 홍길동 직책 단원 문파 청풍 가입 일수 12일 이번 주 활약도 3400 넥네임 가짜 "
+    record = parse_member_text(text, index=2)
+
+    assert record.nickname == "홍길동"
+    assert record.role == "단원"
+    assert record.faction == "청풍"
+    assert record.days_since_join == "12일"
+    assert record.weekly_activity == "3400"
@@ -0,0 +1,49 @@
+import pytest
+
+pytest.importorskip("PIL")
+
+from PIL import Image  # noqa: E402
+
+from core.image_cropper import CropPreset  # noqa: E402
+from core.preset_detector import (  # noqa: E402
+    PanelTemplate,
+    PresetResolver,
+    group_by_preset,
+    preset_cache_key,
+)
+
+
+def _screenshot(path, size):
+    Image.new("RGB", size).save(path)
+    return path
+
+
+def test_group_by_preset_splits_resolutions_and_keeps_numbers(tmp_path):
+    wide = CropPreset("profile", 0.6, 0.1, 0.3, 0.8)
+    small = CropPreset("profile", 0.5, 0.1, 0.4, 0.8)
+    images = [
+        _screenshot(tmp_path / "1.png", (64, 36)),
+        _screenshot(tmp_path / "2.png", (48, 36)),
+        _screenshot(tmp_path / "3.png", (64, 36)),
+    ]
+    template = PanelTemplate(Image.new("L", (8, 8)), wide, (64, 36))
+    resolver = PresetResolver(
+        template,
+        presets={preset_cache_key((64, 36)): wide, preset_cache_key((48, 36)): small},
+    )
+
+    groups = group_by_preset(images, resolver)
+
+    assert groups == [
+        (wide, [(1, images[0]), (3, images[2])]),
+        (small, [(2, images[1])]),
+    ]
+    assert resolver.detected == []
+
+
+def test_group_by_preset_with_a_fixed_preset(tmp_path):
+    preset = CropPreset("profile", 0.0, 0.0, 1.0, 1.0)
+    images = [tmp_path / "a.png", tmp_path / "b.png"]
+
+    assert group_by_preset(images, preset) == [(preset, [(1, images[0]), (2, images[1])])]
+    assert group_by_preset([], preset) == []
@@ -0,0 +1,53 @@
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("rapidfuzz")
+
+from core.validator import compare_results, engine_records  # noqa: E402
+from models import ScreenshotOCRResult  # noqa: E402
+
+
+_PRIMARY_FIELDS = {
+    "nickname": "홍길동",
+    "role": "단원",
+    "faction": "청풍",
+    "days_since_join": "12일",
+    "weekly_activity": "3400",
+    "martial_realm": "5.2",
+    "exploration_skill": "120",
+    "tech_mastery": "88",
+}
+
+
+def _result(secondary: dict[str, str]) -> ScreenshotOCRResult:
+    return ScreenshotOCRResult(
+        index=3,
+        source_path=Path("3.png"),
+        fields={"tesseract": dict(_PRIMARY_FIELDS), "easyocr": secondary},
+    )
+
+
+def test_partial_secondary_reading_compares_only_escalated_fields():
+    [comparison] = compare_results([_result({"weekly_activity": "3400"})], "tesseract", "easyocr")
+
+    assert comparison.is_match
+    assert comparison.secondary.nickname == "홍길동"
+    assert comparison.secondary.tech_mastery == "88"
+
+
+def test_partial_secondary_reading_flags_a_disagreeing_field():
+    [comparison] = compare_results(
+        [_result({"weekly_activity": "3490", "nickname": "홍길동"})],
+        "tesseract",
+        "easyocr",
+    )
+
+    assert comparison.mismatches == ["weekly_activity"]
+
+
+def test_engine_records_without_primary_keeps_readings_as_read():
+    records = engine_records(_result({"weekly_activity": "3400"}))
+
+    assert records["easyocr"].nickname == ""
+    assert records["tesseract"].nickname == "홍길동"
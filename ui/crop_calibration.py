@@ -5,8 +5,19 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional
 
+from PIL import Image
 from PySide6 import QtCore, QtGui, QtWidgets
 
+from core.ocr_engine import OCREngine, build_engine
+
+
+_RESIZE_DEBOUNCE_MS = 150
+# At most one preview OCR starts per interval while the selection changes.
+_PREVIEW_INTERVAL_MS = 400
+# Longest side of the region handed to the preview OCR.
+_PREVIEW_MAX_SIDE = 800
+_SELECTION_PEN_WIDTH = 2
+
 
 @dataclass(frozen=True)
 class CropRegion:
@@ -18,30 +29,187 @@ class CropRegion:
     height: float
 
 
-class CropCalibrationDialog(QtWidgets.QDialog):
-    """Dialog that allows users to define a crop region for screenshots."""
+class _SelectionCanvas(QtWidgets.QWidget):
+    """Shows a screenshot scaled to fit and a selection rectangle over it.
 
-    def __init__(self, image_path: str, parent: Optional[QtWidgets.QWidget] = None) -> None:
+    The smooth-scaled base pixmap is cached per widget size; dragging only
+    repaints the area the rectangle covered, drawing it over the cached base.
+    While the widget is being resized the base is stretched cheaply and the
+    smooth rescale runs once resizing pauses.
+    """
+
+    selection_changed = QtCore.Signal()
+    selection_finished = QtCore.Signal()
+
+    def __init__(self, pixmap: QtGui.QPixmap, parent: Optional[QtWidgets.QWidget] = None) -> None:
+        super().__init__(parent)
+        self._pixmap = pixmap
+        self._base = QtGui.QPixmap()
+        self._base_smooth = False
+        self._selection = QtCore.QRect()
+        self._origin = QtCore.QPoint()
+        self._dragging = False
+        self._rescale_timer = QtCore.QTimer(self)
+        self._rescale_timer.setSingleShot(True)
+        self._rescale_timer.setInterval(_RESIZE_DEBOUNCE_MS)
+        self._rescale_timer.timeout.connect(self._smooth_rescale)
+        self.setMouseTracking(True)
+
+    @property
+    def selection(self) -> QtCore.QRect:
+        return QtCore.QRect(self._selection)
+
+    def pixmap_rect(self) -> QtCore.QRect:
+        """Where the scaled screenshot sits inside the widget."""
+
+        if self._pixmap.isNull():
+            return QtCore.QRect()
+        size = self._pixmap.size().scaled(self.size(), QtCore.Qt.AspectRatioMode.KeepAspectRatio)
+        x = int((self.width() - size.width()) / 2)
+        y = int((self.height() - size.height()) / 2)
+        return QtCore.QRect(QtCore.QPoint(x, y), size)
+
+    def paintEvent(self, event: QtGui.QPaintEvent) -> None:
+        painter = QtGui.QPainter(self)
+        if self._pixmap.isNull():
+            painter.drawText(self.rect(), QtCore.Qt.AlignmentFlag.AlignCenter, "Image not found")
+            return
+        target = self.pixmap_rect()
+        if self._base.size() != target.size():
+            # Only the very first paint waits for a smooth scale.
+            smooth = self._base.isNull()
+            self._base = self._scaled(target.size(), smooth)
+            self._base_smooth = smooth
+        painter.drawPixmap(target.topLeft(), self._base)
+        if not self._selection.isNull():
+            painter.setPen(QtGui.QPen(QtGui.QColor(255, 165, 0), _SELECTION_PEN_WIDTH))
+            painter.drawRect(self._selection)
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        super().resizeEvent(event)
+        self._base_smooth = False
+        self._rescale_timer.start()
+
+    def mousePressEvent(self, event: QtGui.QMouseEvent) -> None:
+        position = event.position().toPoint()
+        inside = self.pixmap_rect().contains(position)
+        if event.button() != QtCore.Qt.MouseButton.LeftButton or not inside:
+            super().mousePressEvent(event)
+            return
+        self._dragging = True
+        self._origin = position
+        self._set_selection(QtCore.QRect(position, QtCore.QSize()))
+
+    def mouseMoveEvent(self, event: QtGui.QMouseEvent) -> None:
+        if not self._dragging:
+            super().mouseMoveEvent(event)
+            return
+        self._set_selection(QtCore.QRect(self._origin, event.position().toPoint()).normalized())
+
+    def mouseReleaseEvent(self, event: QtGui.QMouseEvent) -> None:
+        if event.button() != QtCore.Qt.MouseButton.LeftButton or not self._dragging:
+            super().mouseReleaseEvent(event)
+            return
+        self._dragging = False
+        self.selection_finished.emit()
+
+    def _set_selection(self, selection: QtCore.QRect) -> None:
+        margin = _SELECTION_PEN_WIDTH + 1
+        dirty = self._selection.united(selection).adjusted(-margin, -margin, margin, margin)
+        self._selection = selection
+        self.update(dirty)
+        self.selection_changed.emit()
+
+    def _scaled(self, size: QtCore.QSize, smooth: bool) -> QtGui.QPixmap:
+        mode = (
+            QtCore.Qt.TransformationMode.SmoothTransformation
+            if smooth
+            else QtCore.Qt.TransformationMode.FastTransformation
+        )
+        return self._pixmap.scaled(size, QtCore.Qt.AspectRatioMode.IgnoreAspectRatio, mode)
+
+    def _smooth_rescale(self) -> None:
+        if self._pixmap.isNull() or self._base_smooth:
+            return
+        self._base = self._scaled(self.pixmap_rect().size(), smooth=True)
+        self._base_smooth = True
+        self.update()
+
+
+class _PreviewReader(QtCore.QObject):
+    """Runs preview OCR of a screenshot region on a worker thread."""
+
+    finished = QtCore.Signal(int, str)
+
+    def __init__(self, image_path: str, engine_name: str, language: str) -> None:
+        super().__init__()
+        self._image_path = image_path
+        self._engine_name = engine_name
+        self._language = language
+        self._engine: OCREngine | None = None
+        self._image: Image.Image | None = None
+
+    @QtCore.Slot(int, QtCore.QRect)
+    def read(self, request: int, region: QtCore.QRect) -> None:
+        try:
+            if self._image is None:
+                with Image.open(self._image_path) as image:
+                    self._image = image.convert("L")
+            if self._engine is None:
+                self._engine = build_engine(self._engine_name, self._language)
+            crop = self._image.crop(
+                (region.left(), region.top(), region.right() + 1, region.bottom() + 1),
+            )
+            crop.thumbnail((_PREVIEW_MAX_SIDE, _PREVIEW_MAX_SIDE), Image.Resampling.BILINEAR)
+            text = self._engine.read_batch([crop])[0].text.strip()
+        except Exception as error:  # worker-thread boundary: always answer the request
+            text = f"Preview unavailable: {error}"
+        self.finished.emit(request, text)
+
+    @QtCore.Slot()
+    def close(self) -> None:
+        if self._engine is not None:
+            self._engine.close()
+            self._engine = None
+
+
+class CropCalibrationDialog(QtWidgets.QDialog):
+    """Dialog that allows users to define a crop region for screenshots.
+
+    With ``preview_engine`` set, the selected region is OCR'd on a worker
+    thread and the text is shown below the screenshot. Previews start at
+    most every ``_PREVIEW_INTERVAL_MS`` while dragging, one at a time; the
+    latest selection is always read last.
+    """
+
+    _preview_requested = QtCore.Signal(int, QtCore.QRect)
+
+    def __init__(
+        self,
+        image_path: str,
+        parent: Optional[QtWidgets.QWidget] = None,
+        *,
+        preview_engine: Optional[str] = "tesseract",
+        language: str = "kor+eng",
+    ) -> None:
         super().__init__(parent)
         self._image_path = image_path
         self._pixmap = QtGui.QPixmap(image_path)
-        self._selection_rect = QtCore.QRect()
-        self._dragging = False
-        self._origin = QtCore.QPoint()
-        self._displayed_pixmap_size = QtCore.QSize()
 
         self.setWindowTitle("Crop Calibration")
         self.resize(900, 600)
 
-        self.image_label = QtWidgets.QLabel()
-        self.image_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        self.image_label.setMinimumSize(640, 360)
-        self.image_label.setMouseTracking(True)
-        self.image_label.installEventFilter(self)
+        self.canvas = _SelectionCanvas(self._pixmap)
+        self.canvas.setMinimumSize(640, 360)
 
         self.instructions = QtWidgets.QLabel(
             "Drag to select the profile panel area to crop.",
         )
+        self.preview_label = QtWidgets.QLabel()
+        self.preview_label.setWordWrap(True)
+        self.preview_label.setTextInteractionFlags(
+            QtCore.Qt.TextInteractionFlag.TextSelectableByMouse,
+        )
 
         self.confirm_button = QtWidgets.QPushButton("Use Selection")
         self.cancel_button = QtWidgets.QPushButton("Cancel")
@@ -56,105 +224,94 @@ class CropCalibrationDialog(QtWidgets.QDialog):
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.addWidget(self.instructions)
-        layout.addWidget(self.image_label, 1)
+        layout.addWidget(self.canvas, 1)
+        layout.addWidget(self.preview_label)
         layout.addLayout(action_layout)
 
-        self._render_image()
-
-    def _render_image(self) -> None:
-        if self._pixmap.isNull():
-            self.image_label.setText("Image not found")
+        self._preview_thread: QtCore.QThread | None = None
+        self._preview_request = 0
+        self._preview_busy = False
+        self._preview_stale = False
+        self._preview_timer = QtCore.QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(_PREVIEW_INTERVAL_MS)
+        self._preview_timer.timeout.connect(self._start_preview)
+        if preview_engine is not None and not self._pixmap.isNull():
+            self._start_preview_thread(preview_engine, language)
+        else:
+            self.preview_label.hide()
+
+    def _start_preview_thread(self, engine_name: str, language: str) -> None:
+        self._preview_thread = QtCore.QThread(self)
+        self._preview_reader = _PreviewReader(self._image_path, engine_name, language)
+        self._preview_reader.moveToThread(self._preview_thread)
+        self._preview_requested.connect(self._preview_reader.read)
+        self._preview_reader.finished.connect(self._show_preview)
+        self._preview_thread.finished.connect(self._preview_reader.close)
+        self._preview_thread.finished.connect(self._preview_reader.deleteLater)
+        self.canvas.selection_changed.connect(self._schedule_preview)
+        self.canvas.selection_finished.connect(self._schedule_preview)
+        self._preview_thread.start()
+
+    def _schedule_preview(self) -> None:
+        # Throttle rather than debounce, so a long drag still updates.
+        if not self._preview_timer.isActive():
+            self._preview_timer.start()
+
+    def _start_preview(self) -> None:
+        if self._preview_busy:
+            self._preview_stale = True
             return
-
-        scaled = self._pixmap.scaled(
-            self.image_label.size(),
-            QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-            QtCore.Qt.TransformationMode.SmoothTransformation,
-        )
-        self._displayed_pixmap_size = scaled.size()
-        overlay = QtGui.QPixmap(scaled)
-        painter = QtGui.QPainter(overlay)
-        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-        if not self._selection_rect.isNull():
-            pen = QtGui.QPen(QtGui.QColor(255, 165, 0), 2)
-            painter.setPen(pen)
-            painter.drawRect(self._selection_rect)
-        painter.end()
-        self.image_label.setPixmap(overlay)
-
-    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
-        super().resizeEvent(event)
-        self._render_image()
-
-    def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
-        if watched is not self.image_label:
-            return super().eventFilter(watched, event)
-
-        if event.type() == QtCore.QEvent.Type.MouseButtonPress:
-            mouse_event = event
-            if mouse_event.button() != QtCore.Qt.MouseButton.LeftButton:
-                return False
-            label_pos = mouse_event.position().toPoint()
-            if not self._pixmap_rect().contains(label_pos):
-                return False
-            self._dragging = True
-            self._origin = label_pos
-            self._selection_rect = QtCore.QRect(self._origin, QtCore.QSize())
-            self._render_image()
-            return True
-
-        if event.type() == QtCore.QEvent.Type.MouseMove:
-            if not self._dragging:
-                return False
-            mouse_event = event
-            label_pos = mouse_event.position().toPoint()
-            self._selection_rect = QtCore.QRect(self._origin, label_pos).normalized()
-            self._render_image()
-            return True
-
-        if event.type() == QtCore.QEvent.Type.MouseButtonRelease:
-            mouse_event = event
-            if mouse_event.button() != QtCore.Qt.MouseButton.LeftButton:
-                return False
-            if self._dragging:
-                self._dragging = False
-                self._render_image()
-            return True
-
-        return super().eventFilter(watched, event)
-
-    def _pixmap_rect(self) -> QtCore.QRect:
-        if not self._displayed_pixmap_size.isValid():
-            return QtCore.QRect()
-        label_size = self.image_label.size()
-        x = int((label_size.width() - self._displayed_pixmap_size.width()) / 2)
-        y = int((label_size.height() - self._displayed_pixmap_size.height()) / 2)
-        return QtCore.QRect(QtCore.QPoint(x, y), self._displayed_pixmap_size)
-
-    def selected_region(self) -> Optional[CropRegion]:
-        if self._pixmap.isNull() or self._selection_rect.isNull():
-            return None
-
-        label_pixmap = self.image_label.pixmap()
-        if label_pixmap is None or self._displayed_pixmap_size.isEmpty():
+        region = self._image_rect()
+        if region is None or region.width() < 2 or region.height() < 2:
+            return
+        self._preview_busy = True
+        self._preview_stale = False
+        self._preview_request += 1
+        self.preview_label.setText("Reading selection…")
+        self._preview_requested.emit(self._preview_request, region)
+
+    def _show_preview(self, request: int, text: str) -> None:
+        self._preview_busy = False
+        if request == self._preview_request:
+            self.preview_label.setText(text or "(no text recognized)")
+        if self._preview_stale:
+            self._start_preview()
+
+    def done(self, result: int) -> None:
+        if self._preview_thread is not None:
+            self._preview_thread.quit()
+            self._preview_thread.wait()
+            self._preview_thread = None
+        super().done(result)
+
+    def _image_rect(self) -> Optional[QtCore.QRect]:
+        """The selection in full-resolution image pixels."""
+
+        displayed = self.canvas.pixmap_rect()
+        selection = self.canvas.selection
+        if self._pixmap.isNull() or selection.isNull() or displayed.isEmpty():
             return None
 
-        offset = self._pixmap_rect().topLeft()
-        selection = self._selection_rect.translated(-offset)
-        selection = selection.intersected(QtCore.QRect(QtCore.QPoint(0, 0), self._displayed_pixmap_size))
+        selection = selection.translated(-displayed.topLeft())
+        selection = selection.intersected(QtCore.QRect(QtCore.QPoint(0, 0), displayed.size()))
         if selection.isNull():
             return None
 
-        scale_x = self._pixmap.width() / self._displayed_pixmap_size.width()
-        scale_y = self._pixmap.height() / self._displayed_pixmap_size.height()
-
-        rect = QtCore.QRect(
+        scale_x = self._pixmap.width() / displayed.width()
+        scale_y = self._pixmap.height() / displayed.height()
+        return QtCore.QRect(
             int(selection.x() * scale_x),
             int(selection.y() * scale_y),
             int(selection.width() * scale_x),
             int(selection.height() * scale_y),
         )
 
+    def selected_region(self) -> Optional[CropRegion]:
+        rect = self._image_rect()
+        if rect is None:
+            return None
+
         return CropRegion(
             x=rect.x() / self._pixmap.width(),
             y=rect.y() / self._pixmap.height(),
@@ -0,0 +1,204 @@
+"""Background ingest of screenshots into the main window's table."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+import threading
+import time
+from typing import Optional, Sequence
+
+from PySide6 import QtCore
+
+from core.dedup import PanelHashIndex
+from core.image_cropper import CropPreset
+from core.pipeline import PipelineOptions, iter_batch
+from core.preset_detector import PresetResolver, group_by_preset
+from core.validator import RecordComparison, ValidationThresholds, compare_records, engine_records
+from models import DEFAULT_FIELDS, GuildMemberRecord, OCRComparisonResult
+from ui.review_dialog import ReviewItem
+
+
+_REVIEW_FIELDS = tuple(name for name in DEFAULT_FIELDS if name != "index")
+
+
+class IngestCancelled(Exception):
+    """Raised inside the pipeline to stop a cancelled ingest."""
+
+
+@dataclass(frozen=True)
+class IngestProgress:
+    """How far one stage ("crop" or "ocr") of an ingest has come."""
+
+    stage: str
+    done: int
+    total: int
+    elapsed: float
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Seconds left in this stage at the rate so far, once known."""
+
+        if not self.done or self.done >= self.total:
+            return None
+        return self.elapsed / self.done * (self.total - self.done)
+
+
+class IngestSignals(QtCore.QObject):
+    """Signals of an ``IngestWorker``, delivered on the GUI thread.
+
+    ``record_ready`` carries the screenshot number and parsed record as each
+    screenshot finishes; ``mismatch`` follows it with a ``ReviewItem`` when
+    the engines disagree. Records are keyed by screenshot number because a
+    field-mode record takes its ``index`` from the OCR'd panel instead.
+    ``duplicates`` lists the ``Duplicate`` screenshots skipped by the run,
+    just before ``finished`` reports whether the ingest was cancelled.
+    """
+
+    record_ready = QtCore.Signal(int, object)
+    mismatch = QtCore.Signal(object)
+    progress = QtCore.Signal(object)
+    duplicates = QtCore.Signal(object)
+    finished = QtCore.Signal(bool)
+    failed = QtCore.Signal(str)
+
+
+class IngestWorker(QtCore.QRunnable):
+    """Crops, OCRs and parses a batch of screenshots on a thread pool thread.
+
+    The pipeline itself may fan out to worker processes (``options.jobs``).
+    ``cancel`` stops the batch after the screenshot in progress; chunks not
+    yet started are dropped. Mismatches are routed to review while the rest
+    of the batch keeps going. With a ``PresetResolver`` as ``preset``, the
+    screenshots are grouped by resolution and each group is cropped with
+    its own preset.
+    """
+
+    def __init__(
+        self,
+        images: Sequence[Path],
+        preset: CropPreset | PresetResolver,
+        options: PipelineOptions = PipelineOptions(),
+        output_dir: Path | None = None,
+        hashes: PanelHashIndex | None = None,
+        thresholds: ValidationThresholds = ValidationThresholds(),
+    ) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = IngestSignals()
+        self._images = list(images)
+        self._preset = preset
+        self._options = options
+        self._output_dir = output_dir
+        self._hashes = hashes
+        self._thresholds = thresholds
+        self._cancelled = threading.Event()
+        self._stage_started: dict[str, float] = {}
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def run(self) -> None:
+        known = len(self._hashes.duplicates) if self._hashes is not None else 0
+        try:
+            offset = 0
+            for preset, numbered in group_by_preset(self._images, self._preset):
+                for result in iter_batch(
+                    [image_path for _, image_path in numbered],
+                    preset,
+                    self._output_dir,
+                    self._options,
+                    hashes=self._hashes,
+                    indexes=[index for index, _ in numbered],
+                    progress=lambda stage, done, _, offset=offset: self._report(
+                        stage,
+                        offset + done,
+                        len(self._images),
+                    ),
+                ):
+                    self._publish(
+                        result.index,
+                        engine_records(result, self._options.engines[0]),
+                        result.cropped_path or result.source_path,
+                    )
+                offset += len(numbered)
+        except IngestCancelled:
+            pass
+        except Exception as error:  # surfaced in the GUI instead of killing the thread
+            self.signals.failed.emit(str(error))
+            return
+        if self._hashes is not None:
+            self.signals.duplicates.emit(list(self._hashes.duplicates[known:]))
+        self.signals.finished.emit(self._cancelled.is_set())
+
+    def _report(self, stage: str, done: int, total: int) -> None:
+        if self._cancelled.is_set():
+            raise IngestCancelled
+        now = time.monotonic()
+        started = self._stage_started.setdefault(stage, now)
+        self.signals.progress.emit(IngestProgress(stage, done, total, now - started))
+
+    def _publish(
+        self,
+        index: int,
+        records: dict[str, GuildMemberRecord],
+        image_path: Path,
+    ) -> None:
+        engines = [name for name in self._options.engines if name in records]
+        if not engines:
+            return
+        primary = records[engines[0]]
+        self.signals.record_ready.emit(index, primary)
+        if len(engines) < 2:
+            return
+        comparison = compare_records(primary, records[engines[1]], self._thresholds)
+        if not comparison.is_match:
+            self.signals.mismatch.emit(review_item(comparison, image_path, index))
+
+
+def review_item(comparison: RecordComparison, image_path: Path, index: int) -> ReviewItem:
+    """A review queue entry for screenshot ``index`` showing both engines' records."""
+
+    return ReviewItem(
+        image_path=str(image_path),
+        comparison=OCRComparisonResult(
+            primary_text=review_text(comparison.primary),
+            secondary_text=review_text(comparison.secondary),
+            is_match=False,
+            similarity_score=min(field.score for field in comparison.fields),
+        ),
+        label=f"#{index}: {', '.join(comparison.mismatches)}",
+        record_index=index,
+    )
+
+
+def review_text(record: GuildMemberRecord) -> str:
+    """One ``field: value`` line per field, as shown in the review queue."""
+
+    lines = [f"{name}: {getattr(record, name)}" for name in _REVIEW_FIELDS]
+    lines.extend(f"{name}: {value}" for name, value in record.extras.items())
+    return "\n".join(lines)
+
+
+def record_from_review_text(text: str, index: int) -> GuildMemberRecord:
+    """Parse text in the ``review_text`` format back into a record.
+
+    Values are taken as the reviewer left them. They were shown already
+    parsed by whichever mode produced the record, so re-parsing them as
+    field OCR would strip what whole-panel parsing keeps (the martial realm
+    suffix) and drop edits that are not plain digits.
+    """
+
+    fields: dict[str, str] = {}
+    for line in text.splitlines():
+        name, separator, value = line.partition(":")
+        if separator:
+            fields[name.strip()] = value.strip()
+    record = GuildMemberRecord(
+        index=index,
+        **{name: fields.get(name, "") for name in _REVIEW_FIELDS},
+    )
+    record.extras.update(
+        (name, value) for name, value in fields.items() if name not in DEFAULT_FIELDS
+    )
+    return record
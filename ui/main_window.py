@@ -2,22 +2,56 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from dataclasses import replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence
 
-from PySide6 import QtCore, QtWidgets
+from PySide6 import QtCore, QtGui, QtWidgets
 
-from config import AppSettings
-from models import DEFAULT_FIELDS, GuildMemberRecord
+from models import GuildMemberRecord, RecordTable
+from ui.record_model import RecordProxyModel, RecordTableModel
+
+if TYPE_CHECKING:
+    # The OCR pipeline and review queue are imported on first use so that
+    # opening the window only pays for Qt and the table model.
+    from config import AppSettings
+    from core.dedup import Duplicate, PanelHashIndex
+    from core.image_cropper import CropPreset
+    from core.pipeline import PipelineOptions
+    from core.preset_detector import PresetResolver
+    from ui.ingest import IngestProgress, IngestWorker
+    from ui.review_dialog import ReviewItem, ReviewQueueDialog
+
+
+_FILTER_DELAY_MS = 200
+_STAGE_LABELS = {"crop": "Cropping", "ocr": "Reading screenshots"}
 
 
 class MainWindow(QtWidgets.QMainWindow):
     """Main application window with a table-based editor."""
 
-    def __init__(self, settings: AppSettings) -> None:
+    def __init__(self, settings: AppSettings, settings_path: Path | None = None) -> None:
         super().__init__()
         self.settings = settings
-        self.table = QtWidgets.QTableWidget(0, len(DEFAULT_FIELDS))
-        self.table.setHorizontalHeaderLabels(list(DEFAULT_FIELDS))
+        self.settings_path = settings_path
+        self.records = RecordTable()
+        self.model = RecordTableModel(self.records, self)
+        self.proxy = RecordProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.filter_edit = QtWidgets.QLineEdit()
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.proxy)
+        self._filter_timer = QtCore.QTimer(self)
+        self._pool = QtCore.QThreadPool(self)
+        self._ingest: Optional[IngestWorker] = None
+        self._resolver: Optional[PresetResolver] = None
+        self._ingest_rows: dict[int, int] = {}
+        self._ingest_duplicates: list[Duplicate] = []
+        self._ingest_progress: dict[str, IngestProgress] = {}
+        self._review_queue: Optional[ReviewQueueDialog] = None
+        self.progress_label = QtWidgets.QLabel()
+        self.progress_bar = QtWidgets.QProgressBar()
+        self.cancel_button = QtWidgets.QPushButton("Cancel")
         self._configure_ui()
 
     def _configure_ui(self) -> None:
@@ -26,39 +60,223 @@ class MainWindow(QtWidgets.QMainWindow):
 
         central = QtWidgets.QWidget(self)
         layout = QtWidgets.QVBoxLayout(central)
+        layout.addWidget(self.filter_edit)
         layout.addWidget(self.table)
         self.setCentralWidget(central)
 
+        self.filter_edit.setPlaceholderText("Filter")
+        self.filter_edit.setClearButtonEnabled(True)
+        # Filter once typing pauses rather than rescanning on every keystroke.
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(_FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self.filter_edit.textChanged.connect(self._filter_timer.start)
+
         self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(-1, QtCore.Qt.SortOrder.AscendingOrder)
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setEditTriggers(
             QtWidgets.QAbstractItemView.EditTrigger.DoubleClicked
             | QtWidgets.QAbstractItemView.EditTrigger.SelectedClicked
         )
 
-    def load_records(self, records: Iterable[GuildMemberRecord]) -> None:
-        self.table.setRowCount(0)
-        for record in records:
-            self.add_record(record)
+        status = self.statusBar()
+        status.addPermanentWidget(self.progress_label)
+        status.addPermanentWidget(self.progress_bar)
+        status.addPermanentWidget(self.cancel_button)
+        self.cancel_button.clicked.connect(self.cancel_ingest)
+        self._set_ingest_widgets_visible(False)
 
-    def add_record(self, record: GuildMemberRecord) -> None:
-        row_index = self.table.rowCount()
-        self.table.insertRow(row_index)
-        row_data = record.to_csv_row(DEFAULT_FIELDS)
+    def load_records(self, records: RecordTable | Iterable[GuildMemberRecord]) -> None:
+        if not isinstance(records, RecordTable):
+            records = RecordTable.from_records(records)
+        self.records = records
+        self.model.set_table(records)
 
-        for column, field_name in enumerate(DEFAULT_FIELDS):
-            item = QtWidgets.QTableWidgetItem(str(row_data.get(field_name, "")))
-            item.setData(QtCore.Qt.ItemDataRole.UserRole, field_name)
-            self.table.setItem(row_index, column, item)
+    def add_record(self, record: GuildMemberRecord) -> None:
+        self.model.append_record(record)
 
     def add_custom_column(self, label: str) -> None:
-        column_index = self.table.columnCount()
-        self.table.insertColumn(column_index)
-        self.table.setHorizontalHeaderItem(column_index, QtWidgets.QTableWidgetItem(label))
+        self.model.add_column(label)
+
+    def _apply_filter(self) -> None:
+        self.proxy.set_filter_text(self.filter_edit.text().strip())
 
     def current_csv_headers(self) -> list[str]:
-        headers: list[str] = []
-        for column in range(self.table.columnCount()):
-            item = self.table.horizontalHeaderItem(column)
-            headers.append(item.text() if item else "")
-        return headers
+        return self.model.columns
+
+    def start_ingest(
+        self,
+        images: Sequence[Path],
+        preset: CropPreset | None = None,
+        options: PipelineOptions | None = None,
+        output_dir: Path | None = None,
+        hashes: PanelHashIndex | None = None,
+    ) -> IngestWorker:
+        """Crop and OCR ``images`` in the background, adding records as they finish.
+
+        Mismatches between the engines go to a non-modal review queue while
+        the batch continues. Without ``preset``, each screenshot's preset is
+        looked up or detected from the settings' panel template by
+        resolution. Without ``options``, the worker count and OCR language
+        come from the app settings.
+        """
+
+        from config import pipeline_options
+        from ui.ingest import IngestWorker
+
+        if self._ingest is not None:
+            raise RuntimeError("An ingest is already running")
+        if options is None:
+            options = pipeline_options(self.settings)
+        self._resolver = self.preset_resolver() if preset is None else None
+        worker = IngestWorker(images, preset or self._resolver, options, output_dir, hashes)
+        self._ingest_rows.clear()
+        self._ingest_duplicates = []
+        self._ingest_progress.clear()
+        worker.signals.record_ready.connect(self._add_ingested_record)
+        worker.signals.mismatch.connect(self._queue_review)
+        worker.signals.progress.connect(self._show_progress)
+        worker.signals.duplicates.connect(self._record_duplicates)
+        worker.signals.finished.connect(self._finish_ingest)
+        worker.signals.failed.connect(self._fail_ingest)
+        self._ingest = worker
+        self.progress_label.setText("Starting…")
+        self.progress_bar.setRange(0, 0)
+        self._set_ingest_widgets_visible(True)
+        self._pool.start(worker)
+        return worker
+
+    def preset_resolver(self) -> PresetResolver:
+        """A resolver seeded with the presets already detected for the settings' template."""
+
+        from core.preset_detector import PanelTemplate, PresetResolver
+
+        if self.settings.panel_template is None:
+            raise RuntimeError("No panel template is set; calibrate a crop preset first")
+        return PresetResolver(
+            PanelTemplate.load(self.settings.panel_template),
+            ui_scale=self.settings.ui_scale,
+            presets=dict(self.settings.crop_presets),
+        )
+
+    def cancel_ingest(self) -> None:
+        if self._ingest is not None:
+            self._ingest.cancel()
+            self.progress_label.setText("Cancelling…")
+            self.cancel_button.setEnabled(False)
+
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        self.cancel_ingest()
+        self._pool.waitForDone()
+        super().closeEvent(event)
+
+    def _add_ingested_record(self, index: int, record: GuildMemberRecord) -> None:
+        # Keyed by screenshot number; review items refer to rows the same way.
+        self._ingest_rows[index] = self.model.append_record(record)
+
+    def _queue_review(self, item: ReviewItem) -> None:
+        if self._review_queue is not None and self._review_queue.isVisible():
+            self._review_queue.add_item(item)
+            return
+        self._reopen_review_queue([item])
+
+    def _reopen_review_queue(self, items: Sequence[ReviewItem] = ()) -> None:
+        """Show a fresh queue holding the closed queue's undecided items plus ``items``.
+
+        A closed queue has stopped its image loader, so it is replaced rather
+        than shown again.
+        """
+
+        from ui.review_dialog import ReviewQueueDialog
+
+        pending: list[ReviewItem] = []
+        if self._review_queue is not None:
+            pending = self._review_queue.pending_items()
+            self._review_queue.deleteLater()
+            self._review_queue = None
+        pending.extend(items)
+        if not pending:
+            return
+        self._review_queue = ReviewQueueDialog(pending, self)
+        self._review_queue.decided.connect(self._apply_review)
+        self._review_queue.show()
+
+    def _apply_review(self, position: int, text: str) -> None:
+        if self._review_queue is None:
+            return
+        index = self._review_queue.items[position].record_index
+        row = self._ingest_rows.get(index) if index is not None else None
+        if row is not None:
+            from ui.ingest import record_from_review_text
+
+            # The review text has no index line; keep the row's own index.
+            record_index = self.model.table.record(row).index
+            self.model.set_record(row, record_from_review_text(text, record_index))
+
+    def _show_progress(self, progress: IngestProgress) -> None:
+        # Cropping runs ahead of OCR, so show every stage that is still going
+        # and let the bar follow the slowest one.
+        self._ingest_progress[progress.stage] = progress
+        active = [
+            stage for stage in self._ingest_progress.values() if stage.done < stage.total
+        ] or [progress]
+        parts = []
+        for stage in active:
+            label = _STAGE_LABELS.get(stage.stage, stage.stage)
+            text = f"{label} {stage.done}/{stage.total}"
+            if stage.eta is not None:
+                minutes, seconds = divmod(round(stage.eta), 60)
+                text += f", about {minutes}:{seconds:02d} left"
+            parts.append(text)
+        self.progress_label.setText("; ".join(parts))
+        slowest = min(active, key=lambda stage: stage.done / max(stage.total, 1))
+        self.progress_bar.setRange(0, slowest.total)
+        self.progress_bar.setValue(slowest.done)
+
+    def _record_duplicates(self, duplicates: list[Duplicate]) -> None:
+        self._ingest_duplicates = duplicates
+
+    def _save_detected_presets(self) -> None:
+        resolver, self._resolver = self._resolver, None
+        if resolver is None or not resolver.detected:
+            return
+        from config import save_settings
+
+        self.settings = replace(self.settings, crop_presets=dict(resolver.presets))
+        if self.settings_path is not None:
+            save_settings(self.settings, self.settings_path)
+
+    def _finish_ingest(self, cancelled: bool) -> None:
+        self._ingest = None
+        self._save_detected_presets()
+        self._set_ingest_widgets_visible(False)
+        if self._review_queue is not None and not self._review_queue.isVisible():
+            # Bring back mismatches left undecided when the queue was closed.
+            self._reopen_review_queue()
+        message = "Ingest cancelled" if cancelled else "Ingest finished"
+        duplicates = self._ingest_duplicates
+        if duplicates:
+            earlier = sum(1 for duplicate in duplicates if duplicate.previous_batch)
+            names = ", ".join(
+                f"{duplicate.path.name} = {duplicate.original.name}" for duplicate in duplicates
+            )
+            message += (
+                f"; skipped {len(duplicates)} duplicate screenshots "
+                f"({earlier} seen in earlier batches): {names}"
+            )
+        # Duplicates stay listed until the next message replaces them.
+        self.statusBar().showMessage(message, 0 if duplicates else 5000)
+
+    def _fail_ingest(self, message: str) -> None:
+        self._ingest = None
+        # Presets detected before the failure are still valid.
+        self._save_detected_presets()
+        self._set_ingest_widgets_visible(False)
+        QtWidgets.QMessageBox.warning(self, "Ingest failed", message)
+
+    def _set_ingest_widgets_visible(self, visible: bool) -> None:
+        for widget in (self.progress_label, self.progress_bar, self.cancel_button):
+            widget.setVisible(visible)
+        self.cancel_button.setEnabled(visible)
@@ -0,0 +1,283 @@
+"""Qt models that show a RecordTable without copying it into items."""
+
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+from PySide6 import QtCore
+
+from models import DEFAULT_FIELDS, GuildMemberRecord, RecordTable
+
+
+_EDIT_ROLES = (QtCore.Qt.ItemDataRole.DisplayRole, QtCore.Qt.ItemDataRole.EditRole)
+# Separates cells when a row is flattened for filtering, so a match cannot
+# span two cells.
+_CELL_SEPARATOR = "\x1f"
+
+
+class RecordTableModel(QtCore.QAbstractTableModel):
+    """Editable view of a RecordTable.
+
+    Cells are formatted only when the view asks for them, i.e. for the rows
+    on screen. Loading a table is a single model reset and appending a record
+    inserts one row, so no per-cell objects are created.
+    """
+
+    def __init__(
+        self,
+        table: RecordTable | None = None,
+        parent: QtCore.QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._table = table if table is not None else RecordTable()
+        self._columns = self._table.columns
+
+    @property
+    def table(self) -> RecordTable:
+        return self._table
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self._columns)
+
+    def set_table(self, table: RecordTable) -> None:
+        self.beginResetModel()
+        self._table = table
+        self._columns = table.columns
+        self.endResetModel()
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._table)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(
+        self,
+        index: QtCore.QModelIndex,
+        role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if not index.isValid() or role not in _EDIT_ROLES:
+            return None
+        return self.cell_text(index.row(), index.column())
+
+    def cell_text(self, row: int, column: int) -> str:
+        return str(self._table.value(row, self._columns[column]))
+
+    def setData(
+        self,
+        index: QtCore.QModelIndex,
+        value: Any,
+        role: int = QtCore.Qt.ItemDataRole.EditRole,
+    ) -> bool:
+        if not index.isValid() or role != QtCore.Qt.ItemDataRole.EditRole:
+            return False
+        self._table.set_value(index.row(), self._columns[index.column()], value)
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlag:
+        return super().flags(index) | QtCore.Qt.ItemFlag.ItemIsEditable
+
+    def headerData(
+        self,
+        section: int,
+        orientation: QtCore.Qt.Orientation,
+        role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if role != QtCore.Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == QtCore.Qt.Orientation.Horizontal:
+            return self._columns[section]
+        return section + 1
+
+    def append_record(self, record: GuildMemberRecord) -> int:
+        """Append ``record``, adding any new extra columns first; returns its row."""
+
+        for name in record.extras:
+            self.add_column(name)
+        row = len(self._table)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self._table.append(record)
+        self.endInsertRows()
+        return row
+
+    def set_record(self, row: int, record: GuildMemberRecord) -> None:
+        """Replace every default field of ``row`` and merge ``record.extras`` into it."""
+
+        for name in record.extras:
+            self.add_column(name)
+        for name in DEFAULT_FIELDS:
+            self._table.set_value(row, name, getattr(record, name))
+        for name, value in record.extras.items():
+            self._table.set_value(row, name, value)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self._columns) - 1))
+
+    def add_column(self, name: str) -> None:
+        if name in DEFAULT_FIELDS or name in self._columns:
+            return
+        column = len(self._columns)
+        self.beginInsertColumns(QtCore.QModelIndex(), column, column)
+        self._table.add_column(name)
+        self._columns = self._table.columns
+        self.endInsertColumns()
+
+    def sort_keys(self, column: int) -> Sequence[Any]:
+        """One sort key per row: typed storage for default fields, text for extras."""
+
+        name = self._columns[column]
+        if name in DEFAULT_FIELDS:
+            return self._table.column(name)
+        return [str(self._table.value(row, name)) for row in range(len(self._table))]
+
+    def matching_rows(self, text: str, rows: Sequence[int] | None = None) -> list[int]:
+        """Rows with a cell containing ``text``, ignoring case."""
+
+        needle = text.casefold()
+        if rows is None:
+            flattened = enumerate(self._table.iter_rows(self._columns))
+        else:
+            flattened = (
+                (row, [self._table.value(row, name) for name in self._columns]) for row in rows
+            )
+        return [
+            row
+            for row, cells in flattened
+            if needle in _CELL_SEPARATOR.join(map(str, cells)).casefold()
+        ]
+
+
+class RecordProxyModel(QtCore.QAbstractProxyModel):
+    """Sorted and filtered view of a RecordTableModel.
+
+    The proxy only holds a row order: sorting runs ``sorted`` once over the
+    column's storage instead of comparing cells through the model, and
+    filtering scans the table column-wise. Records appended to the source
+    show up at the end until the next sort.
+    """
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._rows: list[int] = []
+        self._positions: list[int] = []
+        self._sort_column = -1
+        self._sort_order = QtCore.Qt.SortOrder.AscendingOrder
+        self._filter_text = ""
+
+    def setSourceModel(self, model: RecordTableModel) -> None:
+        previous = self.sourceModel()
+        if previous is not None:
+            previous.modelReset.disconnect(self._rebuild)
+            previous.columnsInserted.disconnect(self._rebuild)
+            previous.rowsInserted.disconnect(self._on_rows_inserted)
+            previous.dataChanged.disconnect(self._on_data_changed)
+        super().setSourceModel(model)
+        model.modelReset.connect(self._rebuild)
+        model.columnsInserted.connect(self._rebuild)
+        model.rowsInserted.connect(self._on_rows_inserted)
+        model.dataChanged.connect(self._on_data_changed)
+        self._rebuild()
+
+    def sort(
+        self,
+        column: int,
+        order: QtCore.Qt.SortOrder = QtCore.Qt.SortOrder.AscendingOrder,
+    ) -> None:
+        self._sort_column = column
+        self._sort_order = order
+        self._rebuild()
+
+    def set_filter_text(self, text: str) -> None:
+        if text != self._filter_text:
+            self._filter_text = text
+            self._rebuild()
+
+    def mapToSource(self, proxy_index: QtCore.QModelIndex) -> QtCore.QModelIndex:
+        if not proxy_index.isValid():
+            return QtCore.QModelIndex()
+        return self.sourceModel().index(self._rows[proxy_index.row()], proxy_index.column())
+
+    def mapFromSource(self, source_index: QtCore.QModelIndex) -> QtCore.QModelIndex:
+        if not source_index.isValid() or source_index.row() >= len(self._positions):
+            return QtCore.QModelIndex()
+        position = self._positions[source_index.row()]
+        if position < 0:
+            return QtCore.QModelIndex()
+        return self.index(position, source_index.column())
+
+    def index(
+        self,
+        row: int,
+        column: int,
+        parent: QtCore.QModelIndex = QtCore.QModelIndex(),
+    ) -> QtCore.QModelIndex:
+        in_range = 0 <= row < len(self._rows) and 0 <= column < self.columnCount()
+        if parent.isValid() or not in_range:
+            return QtCore.QModelIndex()
+        return self.createIndex(row, column)
+
+    def data(
+        self,
+        index: QtCore.QModelIndex,
+        role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        # Views ask for a dozen roles per cell; answer the unused ones here
+        # rather than mapping every request through to the source.
+        if not index.isValid() or role not in _EDIT_ROLES:
+            return None
+        return self.sourceModel().cell_text(self._rows[index.row()], index.column())
+
+    def parent(self, index: QtCore.QModelIndex | None = None) -> QtCore.QModelIndex:
+        return QtCore.QModelIndex()
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        source = self.sourceModel()
+        return 0 if parent.isValid() or source is None else source.columnCount()
+
+    def _rebuild(self) -> None:
+        source: RecordTableModel = self.sourceModel()
+        self.beginResetModel()
+        count = source.rowCount()
+        rows = source.matching_rows(self._filter_text) if self._filter_text else list(range(count))
+        if 0 <= self._sort_column < source.columnCount():
+            rows.sort(
+                key=source.sort_keys(self._sort_column).__getitem__,
+                reverse=self._sort_order == QtCore.Qt.SortOrder.DescendingOrder,
+            )
+        self._rows = rows
+        self._positions = [-1] * count
+        for position, row in enumerate(rows):
+            self._positions[row] = position
+        self.endResetModel()
+
+    def _on_rows_inserted(self, parent: QtCore.QModelIndex, first: int, last: int) -> None:
+        added = range(first, last + 1)
+        self._positions.extend([-1] * len(added))
+        visible = (
+            self.sourceModel().matching_rows(self._filter_text, added)
+            if self._filter_text
+            else added
+        )
+        if not visible:
+            return
+        start = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), start, start + len(visible) - 1)
+        for position, row in enumerate(visible, start=start):
+            self._positions[row] = position
+        self._rows.extend(visible)
+        self.endInsertRows()
+
+    def _on_data_changed(
+        self,
+        top_left: QtCore.QModelIndex,
+        bottom_right: QtCore.QModelIndex,
+        roles: Sequence[int] = (),
+    ) -> None:
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            first = self.mapFromSource(top_left.siblingAtRow(row))
+            if first.isValid():
+                last = self.index(first.row(), bottom_right.column())
+                self.dataChanged.emit(first, last, list(roles))
@@ -1,14 +1,39 @@
-"""Dialog for reviewing OCR mismatches."""
+"""Dialogs for reviewing OCR mismatches."""
 
 from __future__ import annotations
 
-from typing import Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
 from models import OCRComparisonResult
 
 
+_RESIZE_DEBOUNCE_MS = 150
+_PREFETCH_AHEAD = 3
+_PIXMAP_CACHE_SIZE = 24
+_DECODED_CACHE_SIZE = 6
+
+
+def _debounce_timer(parent: QtCore.QObject, callback: Callable[[], None]) -> QtCore.QTimer:
+    timer = QtCore.QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(_RESIZE_DEBOUNCE_MS)
+    timer.timeout.connect(callback)
+    return timer
+
+
+def _scaled(image: QtGui.QPixmap, size: QtCore.QSize, smooth: bool = True) -> QtGui.QPixmap:
+    mode = (
+        QtCore.Qt.TransformationMode.SmoothTransformation
+        if smooth
+        else QtCore.Qt.TransformationMode.FastTransformation
+    )
+    return image.scaled(size, QtCore.Qt.AspectRatioMode.KeepAspectRatio, mode)
+
+
 class ReviewDialog(QtWidgets.QDialog):
     """Display OCR results side-by-side for user confirmation."""
 
@@ -61,8 +86,10 @@ class ReviewDialog(QtWidgets.QDialog):
         self.cancel_button.clicked.connect(self.reject)
 
         self._image_path = image_path
+        self._pixmap = QtGui.QPixmap(image_path) if image_path else QtGui.QPixmap()
+        self._resize_timer = _debounce_timer(self, self._render_image)
         if image_path:
-            self._load_image(image_path)
+            self._render_image()
 
     def _build_text_group(self, title: str, text: str) -> QtWidgets.QGroupBox:
         group = QtWidgets.QGroupBox(title)
@@ -72,22 +99,16 @@ class ReviewDialog(QtWidgets.QDialog):
         layout.addWidget(widget)
         return group
 
-    def _load_image(self, image_path: str) -> None:
-        pixmap = QtGui.QPixmap(image_path)
-        if pixmap.isNull():
+    def _render_image(self) -> None:
+        if self._pixmap.isNull():
             self.image_label.setText("Image not found")
             return
-        scaled = pixmap.scaled(
-            self.image_label.size(),
-            QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-            QtCore.Qt.TransformationMode.SmoothTransformation,
-        )
-        self.image_label.setPixmap(scaled)
+        self.image_label.setPixmap(_scaled(self._pixmap, self.image_label.size()))
 
     def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
         super().resizeEvent(event)
         if self._image_path:
-            self._load_image(self._image_path)
+            self._resize_timer.start()
 
     def _choose_primary(self) -> None:
         self._selected_text = self._comparison.primary_text
@@ -110,3 +131,284 @@ class ReviewDialog(QtWidgets.QDialog):
 
     def selected_text(self) -> Optional[str]:
         return self._selected_text
+
+
+@dataclass(frozen=True)
+class ReviewItem:
+    """One mismatch waiting for review.
+
+    ``record_index`` is the screenshot number of the record it belongs to.
+    """
+
+    image_path: Optional[str]
+    comparison: OCRComparisonResult
+    label: str = ""
+    record_index: Optional[int] = None
+
+
+class _ImageLoader(QtCore.QObject):
+    """Decodes and smooth-scales screenshots off the GUI thread.
+
+    Recently decoded images are kept, so rescaling one after a resize does
+    not go back to disk.
+    """
+
+    loaded = QtCore.Signal(str, QtCore.QSize, QtGui.QImage)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._decoded: OrderedDict[str, QtGui.QImage] = OrderedDict()
+
+    @QtCore.Slot(str, QtCore.QSize)
+    def load(self, path: str, size: QtCore.QSize) -> None:
+        image = self._decoded.get(path)
+        if image is None:
+            image = QtGui.QImageReader(path).read()
+            self._decoded[path] = image
+            if len(self._decoded) > _DECODED_CACHE_SIZE:
+                self._decoded.popitem(last=False)
+        else:
+            self._decoded.move_to_end(path)
+        if not image.isNull():
+            image = image.scaled(
+                size,
+                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+                QtCore.Qt.TransformationMode.SmoothTransformation,
+            )
+        self.loaded.emit(path, size, image)
+
+
+class ReviewQueueDialog(QtWidgets.QDialog):
+    """Non-modal walk through every mismatch of a batch.
+
+    Keys: ``1`` uses the primary text, ``2`` the secondary one, ``E`` edits
+    it by hand; the arrow keys move between items without deciding. Each
+    choice emits ``decided(position, text)`` and moves to the next undecided
+    item; ``completed`` fires once all are decided.
+
+    Screenshots are decoded and scaled on a background thread, the next few
+    are prefetched at the current display size, and scaled pixmaps are kept
+    in an LRU cache. While the window is being resized the current pixmap is
+    stretched cheaply; the smooth rescale runs once resizing pauses.
+    """
+
+    decided = QtCore.Signal(int, str)
+    completed = QtCore.Signal()
+    _requested = QtCore.Signal(str, QtCore.QSize)
+
+    def __init__(
+        self,
+        items: Sequence[ReviewItem],
+        parent: Optional[QtWidgets.QWidget] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.setModal(False)
+        self.items = list(items)
+        self.decisions: dict[int, str] = {}
+        self._position = 0
+        self._pixmaps: OrderedDict[tuple[str, int, int], QtGui.QPixmap] = OrderedDict()
+        self._pending: set[tuple[str, int, int]] = set()
+        self._shown_path: Optional[str] = None
+
+        self.setWindowTitle("Review OCR Mismatches")
+        self.resize(900, 600)
+
+        self.progress_label = QtWidgets.QLabel()
+        self.image_label = QtWidgets.QLabel()
+        self.image_label.setMinimumWidth(320)
+        self.image_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        # Keep the label's size independent of the pixmap it shows, so the
+        # window can shrink and cache keys stay stable.
+        self.image_label.setSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Ignored,
+            QtWidgets.QSizePolicy.Policy.Ignored,
+        )
+        self.primary_text = QtWidgets.QPlainTextEdit()
+        self.secondary_text = QtWidgets.QPlainTextEdit()
+        for widget in (self.primary_text, self.secondary_text):
+            widget.setReadOnly(True)
+
+        text_layout = QtWidgets.QVBoxLayout()
+        groups = (("Primary OCR", self.primary_text), ("Secondary OCR", self.secondary_text))
+        for title, widget in groups:
+            group = QtWidgets.QGroupBox(title)
+            QtWidgets.QVBoxLayout(group).addWidget(widget)
+            text_layout.addWidget(group)
+
+        content = QtWidgets.QHBoxLayout()
+        content.addWidget(self.image_label, 1)
+        content.addLayout(text_layout, 1)
+
+        self.previous_button = QtWidgets.QPushButton("Previous (←)")
+        self.use_primary_button = QtWidgets.QPushButton("Use Primary (1)")
+        self.use_secondary_button = QtWidgets.QPushButton("Use Secondary (2)")
+        self.manual_edit_button = QtWidgets.QPushButton("Manual Edit (E)")
+        self.next_button = QtWidgets.QPushButton("Next (→)")
+        action_layout = QtWidgets.QHBoxLayout()
+        for button in (
+            self.previous_button,
+            self.use_primary_button,
+            self.use_secondary_button,
+            self.manual_edit_button,
+            self.next_button,
+        ):
+            button.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
+            action_layout.addWidget(button)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.addWidget(self.progress_label)
+        layout.addLayout(content, 1)
+        layout.addLayout(action_layout)
+
+        actions = (
+            ("1", self.use_primary_button, self._choose_primary),
+            ("2", self.use_secondary_button, self._choose_secondary),
+            ("E", self.manual_edit_button, self._open_manual_edit),
+            ("Right", self.next_button, lambda: self._show(self._position + 1)),
+            ("Left", self.previous_button, lambda: self._show(self._position - 1)),
+        )
+        for key, button, callback in actions:
+            button.clicked.connect(callback)
+            QtGui.QShortcut(QtGui.QKeySequence(key), self, callback)
+
+        self._resize_timer = _debounce_timer(self, self._render_image)
+        self._thread = QtCore.QThread(self)
+        self._loader = _ImageLoader()
+        self._loader.moveToThread(self._thread)
+        self._requested.connect(self._loader.load)
+        self._loader.loaded.connect(self._store_pixmap)
+        self._thread.finished.connect(self._loader.deleteLater)
+        self._thread.start()
+
+        self._show(0)
+
+    @property
+    def position(self) -> int:
+        return self._position
+
+    def pending_items(self) -> list[ReviewItem]:
+        """Items not decided yet, in queue order."""
+
+        return [item for position, item in enumerate(self.items) if position not in self.decisions]
+
+    def add_item(self, item: ReviewItem) -> None:
+        """Queue another mismatch, e.g. while a batch is still running."""
+
+        self.items.append(item)
+        self._show(self._position if len(self.items) > 1 else 0)
+
+    def done(self, result: int) -> None:
+        self._thread.quit()
+        self._thread.wait()
+        super().done(result)
+
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        self._thread.quit()
+        self._thread.wait()
+        super().closeEvent(event)
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        super().resizeEvent(event)
+        current = self.image_label.pixmap()
+        if current is not None and not current.isNull():
+            self.image_label.setPixmap(_scaled(current, self.image_label.size(), smooth=False))
+        self._resize_timer.start()
+
+    def _show(self, position: int) -> None:
+        if not self.items:
+            self.progress_label.setText("No mismatches to review.")
+            return
+        self._position = max(0, min(position, len(self.items) - 1))
+        item = self.items[self._position]
+        status = "decided" if self._position in self.decisions else "pending"
+        self.progress_label.setText(
+            f"{self._position + 1} / {len(self.items)} {item.label} ({status}, "
+            f"{len(self.decisions)} decided)",
+        )
+        self.primary_text.setPlainText(item.comparison.primary_text)
+        self.secondary_text.setPlainText(item.comparison.secondary_text)
+        self._render_image()
+
+    def _render_image(self) -> None:
+        if not self.items:
+            return
+        path = self.items[self._position].image_path
+        if not path:
+            self._shown_path = None
+            self.image_label.setText("No image")
+            return
+        pixmap = self._pixmaps.get(self._cache_key(path))
+        if pixmap is None:
+            # While rescaling, keep showing the stretched pixmap of this image.
+            if self._shown_path != path:
+                self._shown_path = None
+                self.image_label.setText("Loading…")
+            self._request(path)
+        else:
+            self._pixmaps.move_to_end(self._cache_key(path))
+            self._set_pixmap(pixmap)
+        for item in self.items[self._position + 1 : self._position + 1 + _PREFETCH_AHEAD]:
+            if item.image_path:
+                self._request(item.image_path)
+
+    def _cache_key(self, path: str) -> tuple[str, int, int]:
+        size = self.image_label.size()
+        return (path, size.width(), size.height())
+
+    def _request(self, path: str) -> None:
+        key = self._cache_key(path)
+        if key in self._pixmaps or key in self._pending:
+            return
+        self._pending.add(key)
+        self._requested.emit(path, self.image_label.size())
+
+    @QtCore.Slot(str, QtCore.QSize, QtGui.QImage)
+    def _store_pixmap(self, path: str, size: QtCore.QSize, image: QtGui.QImage) -> None:
+        key = (path, size.width(), size.height())
+        self._pending.discard(key)
+        self._pixmaps[key] = QtGui.QPixmap.fromImage(image)
+        if len(self._pixmaps) > _PIXMAP_CACHE_SIZE:
+            self._pixmaps.popitem(last=False)
+        current = self.items[self._position].image_path if self.items else None
+        if current == path and key == self._cache_key(path):
+            self._set_pixmap(self._pixmaps[key])
+
+    def _set_pixmap(self, pixmap: QtGui.QPixmap) -> None:
+        self._shown_path = self.items[self._position].image_path
+        if pixmap.isNull():
+            self.image_label.setText("Image not found")
+        else:
+            self.image_label.setPixmap(pixmap)
+
+    def _decide(self, text: str) -> None:
+        if not self.items:
+            return
+        self.decisions[self._position] = text
+        self.decided.emit(self._position, text)
+        if len(self.decisions) == len(self.items):
+            self.completed.emit()
+            self.accept()
+            return
+        order = list(range(self._position + 1, len(self.items))) + list(range(self._position))
+        self._show(next(position for position in order if position not in self.decisions))
+
+    def _choose_primary(self) -> None:
+        if self.items:
+            self._decide(self.items[self._position].comparison.primary_text)
+
+    def _choose_secondary(self) -> None:
+        if self.items:
+            self._decide(self.items[self._position].comparison.secondary_text)
+
+    def _open_manual_edit(self) -> None:
+        if not self.items:
+            return
+        comparison = self.items[self._position].comparison
+        text, ok = QtWidgets.QInputDialog.getMultiLineText(
+            self,
+            "Manual Edit",
+            "Edit OCR result:",
+            self.decisions.get(self._position, comparison.primary_text),
+        )
+        if ok:
+            self._decide(text)